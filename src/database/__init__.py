@@ -3,6 +3,6 @@
 """
 
 from .database import Database
-from .models import Project, Task, Note
+from .models import Project, Task, Note, ProjectStats, SearchHit, ProjectDiff
 
-__all__ = ['Database', 'Project', 'Task', 'Note'] 
\ No newline at end of file
+__all__ = ['Database', 'Project', 'Task', 'Note', 'ProjectStats', 'SearchHit', 'ProjectDiff'] 
\ No newline at end of file
@@ -0,0 +1,81 @@
+"""
+SQLite 연결 관리
+"""
+import sqlite3
+import threading
+from typing import Dict
+
+
+class ConnectionManager:
+    """스레드별 SQLite 연결 관리자
+
+    스레드마다 하나의 연결을 열어 재사용하고, WAL 저널 모드와 busy timeout을
+    적용한다. 종료 시 close_all()로 모든 연결을 정리한다.
+    """
+
+    def __init__(self, db_path: str, busy_timeout: float = 5.0):
+        """
+        초기화
+
+        Args:
+            db_path: 데이터베이스 파일 경로
+            busy_timeout: 잠금 대기 시간 (초)
+        """
+        self.db_path = db_path
+        self.busy_timeout = busy_timeout
+        self.journal_mode = None  # 실제 적용된 저널 모드 (네트워크 드라이브 등에서는 WAL 불가)
+        self._connections: Dict[int, sqlite3.Connection] = {}
+        self._closed_changes = 0  # 닫힌 연결들이 변경한 행 수 합계
+        self._lock = threading.Lock()
+
+    def get_connection(self) -> sqlite3.Connection:
+        """현재 스레드의 연결 반환 (없으면 새로 연결)"""
+        thread_id = threading.get_ident()
+        with self._lock:
+            conn = self._connections.get(thread_id)
+            if conn is None:
+                conn = self._open_connection()
+                self._connections[thread_id] = conn
+            return conn
+
+    def _open_connection(self) -> sqlite3.Connection:
+        """WAL 모드 연결 생성"""
+        # close_all()은 GUI 스레드에서 호출되므로 스레드 검사는 끄고,
+        # 대신 스레드별로 연결을 분리해 동시 사용을 막는다.
+        conn = sqlite3.connect(self.db_path, timeout=self.busy_timeout, check_same_thread=False)
+        conn.execute(f"PRAGMA busy_timeout = {int(self.busy_timeout * 1000)}")
+        row = conn.execute("PRAGMA journal_mode=WAL").fetchone()
+        self.journal_mode = row[0] if row else None
+        if self.journal_mode == 'wal':
+            # WAL 모드에서는 NORMAL 동기화로도 트랜잭션 일관성이 보장됨
+            conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    def total_changes(self) -> int:
+        """이 관리자로 연 연결들이 지금까지 추가/변경/삭제한 행 수 (닫힌 연결 포함)"""
+        with self._lock:
+            return self._closed_changes + sum(conn.total_changes for conn in self._connections.values())
+
+    def close_connection(self):
+        """현재 스레드의 연결 종료 (워커 스레드 종료 시 사용)"""
+        with self._lock:
+            conn = self._connections.pop(threading.get_ident(), None)
+            if conn is not None:
+                self._closed_changes += conn.total_changes
+        if conn is not None:
+            conn.close()
+
+    def close_all(self):
+        """모든 스레드의 연결 종료
+
+        마지막 연결이 닫히면 SQLite가 WAL 내용을 본 파일에 체크포인트한다.
+        """
+        with self._lock:
+            connections = list(self._connections.values())
+            self._connections.clear()
+            self._closed_changes += sum(conn.total_changes for conn in connections)
+        for conn in connections:
+            try:
+                conn.close()
+            except sqlite3.Error as e:
+                print(f"데이터베이스 연결 종료 중 오류: {e}")
@@ -3,9 +3,12 @@ SQLite 데이터베이스 관리
 """
 import sqlite3
 import os
-from datetime import datetime
-from typing import List, Optional
-from database.models import Project, Task, Note
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from typing import List, Optional, Tuple
+from database.models import Project, Task, Note, ProjectStats, SearchHit, ProjectDiff, ORDER_GAP
+from database.connection import ConnectionManager
+from database.migrations import migrate, rebuild_project_stats
 from utils.helpers import parse_datetime
 
 
@@ -14,72 +17,92 @@ class Database:
         self.db_path = db_path
         # data 디렉토리가 없으면 생성
         os.makedirs(os.path.dirname(db_path), exist_ok=True)
+        # 스레드별 연결을 재사용 (매 호출마다 connect/close 하지 않음)
+        self.connection_manager = ConnectionManager(db_path)
         self.init_database()
 
     def get_connection(self):
-        """데이터베이스 연결 반환"""
-        return sqlite3.connect(self.db_path)
+        """현재 스레드의 데이터베이스 연결 반환
+
+        연결은 스레드별로 재사용되며 닫지 않는다. `with` 블록은 트랜잭션
+        커밋/롤백만 담당한다.
+        """
+        return self.connection_manager.get_connection()
+
+    def close(self):
+        """모든 데이터베이스 연결 종료"""
+        self.connection_manager.close_all()
+
+    def replace_database_file(self, source_path: str):
+        """DB 파일을 source_path 파일로 교체하고 다시 연다 (복원용)
+
+        DatabaseExecutor 작업으로 실행하면 앞서 제출된 작업이 모두 끝난 뒤, 다른 작업이
+        끼어들지 않는 상태에서 교체된다. 모든 연결을 닫고(WAL 체크포인트) 남은 -wal/-shm
+        파일을 지운 뒤 이름 변경으로 교체하므로 반쯤 쓰인 DB 파일이 보이는 순간이 없다.
+        새 파일은 스키마 버전이 낮을 수 있으므로 다시 마이그레이션한다.
+        """
+        self.connection_manager.close_all()
+        # 이전 DB의 WAL 이 남아 있으면 새 파일에 잘못 적용되므로 제거
+        for suffix in ("-wal", "-shm"):
+            try:
+                os.remove(self.db_path + suffix)
+            except FileNotFoundError:
+                pass
+        os.replace(source_path, self.db_path)
+        self.init_database()
+
+    def total_changes(self) -> int:
+        """프로그램 시작 후 추가/변경/삭제한 행 수 (자동 백업 시점 판단용)"""
+        return self.connection_manager.total_changes()
 
     def init_database(self):
-        """데이터베이스 테이블 초기화"""
+        """데이터베이스 스키마 초기화/마이그레이션
+
+        PRAGMA user_version 이 최신이면 스키마 작업을 하지 않는다.
+        """
+        conn = self.get_connection()
+        migrate(conn)
+        # FTS5 가 없는 SQLite 에서는 마이그레이션이 검색 인덱스를 건너뜀
+        self.fts_enabled = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'tasks_fts'"
+        ).fetchone() is not None
+
+    def rebuild_project_stats(self):
+        """프로젝트 통계 재구성 (기존 DB 또는 불일치 발견 시)"""
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            rebuild_project_stats(cursor)
+            conn.commit()
+
+    def check_project_stats(self) -> List[int]:
+        """프로젝트 통계 일관성 검사
+
+        Returns:
+            저장된 통계가 실제 할 일 집계와 다른 프로젝트 id 목록
+        """
         with self.get_connection() as conn:
             cursor = conn.cursor()
-            
-            # 프로젝트 테이블
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS projects (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    title TEXT NOT NULL,
-                    description TEXT,
-                    created_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    updated_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                )
-            """)
-            
-            # 할 일 테이블
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS tasks (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    project_id INTEGER NOT NULL,
-                    title TEXT NOT NULL,
-                    description TEXT,
-                    completed BOOLEAN DEFAULT FALSE,
-                    order_index INTEGER DEFAULT 0,
-                    created_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    completed_date TIMESTAMP,
-                    due_date TIMESTAMP,
-                    FOREIGN KEY (project_id) REFERENCES projects (id) ON DELETE CASCADE
-                )
-            """)
-            
-            # 만약 기존 테이블에 order_index 컬럼이 없다면 추가 (마이그레이션)
-            try:
-                cursor.execute("ALTER TABLE tasks ADD COLUMN order_index INTEGER DEFAULT 0")
-            except sqlite3.OperationalError as e:
-                # 이미 컬럼이 있는 경우는 무시
-                if "duplicate column name" not in str(e):
-                    raise
-            
-            # 만약 기존 테이블에 due_date 컬럼이 없다면 추가 (마이그레이션)
-            try:
-                cursor.execute("ALTER TABLE tasks ADD COLUMN due_date TIMESTAMP")
-            except sqlite3.OperationalError as e:
-                # 이미 컬럼이 있는 경우는 무시
-                if "duplicate column name" not in str(e):
-                    raise
-            
-            # 노트 테이블
             cursor.execute("""
-                CREATE TABLE IF NOT EXISTS notes (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    project_id INTEGER NOT NULL,
-                    content TEXT NOT NULL,
-                    created_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    FOREIGN KEY (project_id) REFERENCES projects (id) ON DELETE CASCADE
-                )
+                SELECT p.id
+                FROM projects p
+                LEFT JOIN project_stats s ON s.project_id = p.id
+                LEFT JOIN (
+                    SELECT project_id,
+                           COUNT(*) AS total,
+                           SUM(CASE WHEN completed THEN 1 ELSE 0 END) AS completed,
+                           MIN(CASE WHEN completed = 0 THEN due_date END) AS next_due_date,
+                           MAX(order_index) AS max_order
+                    FROM tasks
+                    GROUP BY project_id
+                ) a ON a.project_id = p.id
+                WHERE s.project_id IS NULL
+                   OR s.total IS NOT COALESCE(a.total, 0)
+                   OR s.completed IS NOT COALESCE(a.completed, 0)
+                   OR s.next_due_date IS NOT a.next_due_date
+                   OR s.next_order <= a.max_order
+                ORDER BY p.id
             """)
-            
-            conn.commit()
+            return [row[0] for row in cursor.fetchall()]
 
     # 프로젝트 CRUD
     def create_project(self, project: Project) -> int:
@@ -112,6 +135,87 @@ class Database:
                 projects.append(project)
             return projects
 
+    def get_projects_with_stats(self) -> List[Tuple[Project, ProjectStats]]:
+        """모든 프로젝트와 할 일 집계를 한 번의 쿼리로 조회
+
+        프로젝트 목록 표시용으로, 프로젝트마다 할 일 전체를 불러오지 않는다.
+        전체/완료 개수는 project_stats 에서 읽고, 급함/초과 개수는 가장 이른
+        미완료 마감일이 24시간 이내인 프로젝트에 대해서만 센다.
+        """
+        now = datetime.now()
+        soon = now + timedelta(hours=24)
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(f"""
+                SELECT p.id, p.title, p.description, p.created_date, p.updated_date,
+                       {self._PROJECT_STATS_COLUMNS}
+                FROM projects p
+                LEFT JOIN project_stats s ON s.project_id = p.id
+                ORDER BY p.updated_date DESC
+            """, {'now': now, 'soon': soon})
+            rows = cursor.fetchall()
+
+            results = []
+            for row in rows:
+                project = Project(
+                    id=row[0],
+                    title=row[1],
+                    description=row[2],
+                    created_date=parse_datetime(row[3]),
+                    updated_date=parse_datetime(row[4])
+                )
+                results.append((project, self._row_to_project_stats(row[0], row[5:])))
+            return results
+
+    def get_project_stats(self, project_id: int) -> ProjectStats:
+        """특정 프로젝트의 할 일 집계 조회 (project_stats 한 행)"""
+        now = datetime.now()
+        soon = now + timedelta(hours=24)
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(f"""
+                SELECT {self._PROJECT_STATS_COLUMNS}
+                FROM projects p
+                LEFT JOIN project_stats s ON s.project_id = p.id
+                WHERE p.id = :project_id
+            """, {'now': now, 'soon': soon, 'project_id': project_id})
+            row = cursor.fetchone()
+            if row is None:
+                return ProjectStats(project_id=project_id)
+            return self._row_to_project_stats(project_id, row)
+
+    # project_stats 조회용 공통 컬럼 (p: projects, s: project_stats 별칭 필요)
+    # 급함/초과는 시간에 따라 바뀌므로 트리거로 유지할 수 없어, 가장 이른
+    # 미완료 마감일이 기준 시각 이전인 경우에만 해당 범위를 센다.
+    _PROJECT_STATS_COLUMNS = """
+        COALESCE(s.total, 0),
+        COALESCE(s.completed, 0),
+        CASE WHEN s.next_due_date < :soon THEN
+            (SELECT COUNT(*) FROM tasks t
+             WHERE t.project_id = p.id AND t.completed = 0
+               AND t.due_date >= :now AND t.due_date < :soon)
+        ELSE 0 END,
+        CASE WHEN s.next_due_date < :now THEN
+            (SELECT COUNT(*) FROM tasks t
+             WHERE t.project_id = p.id AND t.completed = 0 AND t.due_date < :now)
+        ELSE 0 END,
+        s.next_due_date,
+        s.last_changed
+    """
+
+    @staticmethod
+    def _row_to_project_stats(project_id: int, row) -> ProjectStats:
+        """_PROJECT_STATS_COLUMNS 조회 결과를 ProjectStats 로 변환"""
+        return ProjectStats(
+            project_id=project_id,
+            total=row[0],
+            completed=row[1],
+            urgent=row[2],
+            overdue=row[3],
+            next_due_date=parse_datetime(row[4]),
+            last_changed=parse_datetime(row[5])
+        )
+
     def get_project(self, project_id: int) -> Optional[Project]:
         """특정 프로젝트 조회"""
         with self.get_connection() as conn:
@@ -153,10 +257,10 @@ class Database:
         """할 일 생성"""
         with self.get_connection() as conn:
             cursor = conn.cursor()
-            # 새 할 일의 order_index를 프로젝트 내 가장 큰 order_index + 1로 설정
-            cursor.execute("SELECT MAX(order_index) FROM tasks WHERE project_id = ?", (task.project_id,))
-            max_order = cursor.fetchone()[0] or 0
-            task.order_index = max_order + 1
+            # 새 할 일은 맨 뒤로: 트리거가 유지하는 next_order 를 사용 (MAX 조회 없음)
+            cursor.execute("SELECT next_order FROM project_stats WHERE project_id = ?", (task.project_id,))
+            row = cursor.fetchone()
+            task.order_index = row[0] if row and row[0] is not None else ORDER_GAP
 
             cursor.execute("""
                 INSERT INTO tasks (project_id, title, description, completed, order_index, created_date, due_date)
@@ -165,32 +269,119 @@ class Database:
             conn.commit()
             return cursor.lastrowid
 
+    # 할 일 조회 컬럼 (_row_to_task 의 순서와 일치)
+    _TASK_COLUMNS = """
+        id, project_id, title, description, completed, order_index,
+        created_date, completed_date, due_date
+    """
+
+    def get_task_position(self, project_id: int, task_id: int,
+                          after: Optional[Tuple[int, int, int]] = None,
+                          include_completed: bool = True) -> Optional[int]:
+        """목록 정렬 기준으로 할 일 앞에 있는 할 일 수 (커서 after 이후부터 셈)
+
+        Returns:
+            0부터 시작하는 위치 (목록에 없는 할 일이면 None)
+        """
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("SELECT completed, order_index FROM tasks WHERE id = ? AND project_id = ?",
+                           (task_id, project_id))
+            row = cursor.fetchone()
+            if row is None or (row[0] and not include_completed):
+                return None
+            key = (int(row[0]), row[1], task_id)
+            if after is not None and key <= tuple(after):
+                return None
+            conditions = ["project_id = ?", "(completed, order_index, id) < (?, ?, ?)"]
+            params: list = [project_id, *key]
+            if after is not None:
+                conditions.append("(completed, order_index, id) > (?, ?, ?)")
+                params.extend(after)
+            cursor.execute(f"SELECT COUNT(*) FROM tasks WHERE {' AND '.join(conditions)}", params)
+            return cursor.fetchone()[0]
+
+    @staticmethod
+    def _row_to_task(row) -> Task:
+        """_TASK_COLUMNS 조회 결과를 Task 로 변환"""
+        return Task(
+            id=row[0],
+            project_id=row[1],
+            title=row[2],
+            description=row[3],
+            completed=bool(row[4]),
+            order_index=row[5] if row[5] is not None else 0,
+            created_date=parse_datetime(row[6]),
+            completed_date=parse_datetime(row[7]),
+            due_date=parse_datetime(row[8]) if row[8] else None
+        )
+
     def get_tasks_by_project(self, project_id: int) -> List[Task]:
-        """프로젝트별 할 일 조회"""
+        """프로젝트별 할 일 전체 조회 (큰 프로젝트는 get_tasks_page 사용)"""
         with self.get_connection() as conn:
             cursor = conn.cursor()
-            cursor.execute("""
-                SELECT * FROM tasks 
-                WHERE project_id = ? 
-                ORDER BY completed ASC, order_index ASC, created_date ASC
+            cursor.execute(f"""
+                SELECT {self._TASK_COLUMNS} FROM tasks
+                WHERE project_id = ?
+                ORDER BY completed ASC, order_index ASC, id ASC
             """, (project_id,))
+            return [self._row_to_task(row) for row in cursor.fetchall()]
+
+    def get_tasks_page(self, project_id: int, after: Optional[Tuple[int, int, int]] = None,
+                       limit: int = 200, include_completed: bool = True,
+                       include_task_id: Optional[int] = None
+                       ) -> Tuple[List[Task], Optional[Tuple[int, int, int]]]:
+        """프로젝트별 할 일 한 페이지 조회 (키셋 페이지네이션)
+
+        (completed, order_index, id) 순으로 정렬하고 이전 페이지 마지막 키 다음부터
+        읽으므로, 뒤쪽 페이지도 OFFSET 없이 인덱스 범위 검색으로 가져온다.
+
+        Args:
+            project_id: 프로젝트 id
+            after: 이전 페이지가 돌려준 커서 (첫 페이지는 None)
+            limit: 페이지 크기
+            include_completed: False 면 미완료 할 일만 조회
+            include_task_id: 이 할 일이 페이지에 들어오도록 limit 을 늘림 (검색 결과 이동용)
+
+        Returns:
+            (할 일 목록, 다음 페이지 커서 – 마지막 페이지면 None)
+        """
+        if include_task_id is not None:
+            position = self.get_task_position(project_id, include_task_id, after, include_completed)
+            if position is not None:
+                limit = max(limit, position + 1)
+
+        conditions = ["project_id = ?"]
+        params: list = [project_id]
+        if include_completed:
+            if after is not None:
+                conditions.append("(completed, order_index, id) > (?, ?, ?)")
+                params.extend(after)
+        else:
+            # 완료 여부가 고정이면 (order_index, id) 만 비교해야 정렬용 임시 B-트리가 생기지 않음
+            conditions.append("completed = 0")
+            if after is not None:
+                conditions.append("(order_index, id) > (?, ?)")
+                params.extend(after[1:])
+        # 한 행을 더 읽어 다음 페이지가 있는지 판단
+        params.append(limit + 1)
+
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(f"""
+                SELECT {self._TASK_COLUMNS} FROM tasks
+                WHERE {" AND ".join(conditions)}
+                ORDER BY completed ASC, order_index ASC, id ASC
+                LIMIT ?
+            """, params)
             rows = cursor.fetchall()
-            
-            tasks = []
-            for row in rows:
-                task = Task(
-                    id=row[0],
-                    project_id=row[1],
-                    title=row[2],
-                    description=row[3],
-                    completed=bool(row[4]),
-                    order_index=row[5] if row[5] is not None else 0,
-                    created_date=parse_datetime(row[6]),
-                    completed_date=parse_datetime(row[7]),
-                    due_date=parse_datetime(row[8]) if len(row) > 8 and row[8] else None
-                )
-                tasks.append(task)
-            return tasks
+
+        tasks = [self._row_to_task(row) for row in rows[:limit]]
+        next_cursor = None
+        if len(rows) > limit:
+            last = tasks[-1]
+            next_cursor = (int(last.completed), last.order_index, last.id)
+        return tasks, next_cursor
 
     def update_task(self, task: Task):
         """할 일 업데이트"""
@@ -231,19 +422,91 @@ class Database:
             conn.commit()
             return new_completed
 
-    def update_task_orders(self, project_id: int, task_orders: list[tuple[int, int]]):
-        """할 일의 order_index를 일괄 업데이트 (드래그 앤 드롭 순서 변경용)"""
-        with self.get_connection() as conn:
-            cursor = conn.cursor()
-            for task_id, new_order in task_orders:
-                cursor.execute("UPDATE tasks SET order_index = ? WHERE id = ? AND project_id = ?", (new_order, task_id, project_id))
-            conn.commit()
+    def move_task(self, project_id: int, task_id: int, prev_task_id: Optional[int]) -> int:
+        """할 일을 같은 완료 구간에서 prev_task_id 바로 뒤로 이동 (드래그 앤 드롭용)
+
+        뒤쪽 이웃은 DB에서 찾으므로 화면에 일부 페이지만 불러온 상태에서도 순서가
+        어긋나지 않는다. 보통은 이동한 행 하나만 갱신하고, 키 간격이 소진된 경우에만
+        프로젝트 전체 순서 키를 다시 벌린다.
 
-        # 프로젝트의 updated_date를 갱신하여 목록 정렬이 최신화되도록 함
+        Args:
+            project_id: 프로젝트 id
+            task_id: 이동할 할 일 id
+            prev_task_id: 이동 후 바로 앞에 올 할 일 id (맨 앞이면 None)
+
+        Returns:
+            새 order_index
+        """
         with self.get_connection() as conn:
             cursor = conn.cursor()
-            cursor.execute("UPDATE projects SET updated_date = CURRENT_TIMESTAMP WHERE id = ?", (project_id,))
+            new_order = self._order_key_after(cursor, task_id, prev_task_id)
+            if new_order is None:
+                self._rebalance_task_orders(cursor, project_id)
+                new_order = self._order_key_after(cursor, task_id, prev_task_id)
+            cursor.execute("UPDATE tasks SET order_index = ? WHERE id = ?", (new_order, task_id))
+            # 프로젝트의 updated_date를 갱신하여 목록 정렬이 최신화되도록 함
+            cursor.execute("UPDATE projects SET updated_date = ? WHERE id = ?", (datetime.now(), project_id))
             conn.commit()
+            return new_order
+
+    def _order_key_after(self, cursor, task_id: int, prev_task_id: Optional[int]) -> Optional[int]:
+        """prev_task_id 와 그 다음 할 일 사이의 order_index 계산 (이동 중인 할 일 제외)"""
+        cursor.execute("SELECT project_id, completed FROM tasks WHERE id = ?", (task_id,))
+        project_id, completed = cursor.fetchone()
+
+        prev_order = None
+        if prev_task_id is not None:
+            cursor.execute("SELECT order_index FROM tasks WHERE id = ?", (prev_task_id,))
+            prev_order = cursor.fetchone()[0]
+            cursor.execute("""
+                SELECT order_index FROM tasks
+                WHERE project_id = ? AND completed = ? AND id != ?
+                  AND (order_index, id) > (?, ?)
+                ORDER BY order_index, id LIMIT 1
+            """, (project_id, completed, task_id, prev_order, prev_task_id))
+        else:
+            cursor.execute("""
+                SELECT order_index FROM tasks
+                WHERE project_id = ? AND completed = ? AND id != ?
+                ORDER BY order_index, id LIMIT 1
+            """, (project_id, completed, task_id))
+        row = cursor.fetchone()
+        next_order = row[0] if row else None
+        return self.order_key_between(prev_order, next_order)
+
+    @staticmethod
+    def _rebalance_task_orders(cursor, project_id: int):
+        """프로젝트의 order_index 를 현재 순서대로 ORDER_GAP 간격으로 재배치"""
+        cursor.execute("""
+            SELECT id FROM tasks WHERE project_id = ?
+            ORDER BY completed, order_index, id
+        """, (project_id,))
+        task_ids = [row[0] for row in cursor.fetchall()]
+        cursor.executemany(
+            "UPDATE tasks SET order_index = ? WHERE id = ?",
+            [((idx + 1) * ORDER_GAP, task_id) for idx, task_id in enumerate(task_ids)]
+        )
+
+    @staticmethod
+    def order_key_between(prev_order: Optional[int], next_order: Optional[int]) -> Optional[int]:
+        """두 이웃 사이에 들어갈 order_index 계산
+
+        Args:
+            prev_order: 앞 할 일의 order_index (맨 앞이면 None)
+            next_order: 뒤 할 일의 order_index (맨 뒤면 None)
+
+        Returns:
+            새 order_index (간격이 없어 재배치가 필요하면 None)
+        """
+        if prev_order is None and next_order is None:
+            return ORDER_GAP
+        if prev_order is None:
+            return next_order - ORDER_GAP
+        if next_order is None:
+            return prev_order + ORDER_GAP
+        if next_order - prev_order < 2:
+            return None
+        return (prev_order + next_order) // 2
 
     # 노트 CRUD
     def create_note(self, note: Note) -> int:
@@ -290,9 +553,280 @@ class Database:
             """, (note.content, note.id))
             conn.commit()
 
+    def replace_notes(self, project_id: int, content: str) -> Optional[int]:
+        """프로젝트의 노트를 모두 지우고 content 하나로 교체 (한 트랜잭션)
+
+        Args:
+            project_id: 프로젝트 id
+            content: 새 노트 내용 (비어 있으면 삭제만 수행)
+
+        Returns:
+            새 노트 id (삭제만 한 경우 None)
+        """
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("DELETE FROM notes WHERE project_id = ?", (project_id,))
+            note_id = None
+            if content:
+                note = Note(project_id=project_id, content=content, created_date=datetime.now())
+                cursor.execute("""
+                    INSERT INTO notes (project_id, content, created_date)
+                    VALUES (?, ?, ?)
+                """, (note.project_id, note.content, note.created_date))
+                note_id = cursor.lastrowid
+            conn.commit()
+            return note_id
+
     def delete_note(self, note_id: int):
         """노트 삭제"""
         with self.get_connection() as conn:
             cursor = conn.cursor()
             cursor.execute("DELETE FROM notes WHERE id = ?", (note_id,))
-            conn.commit() 
\ No newline at end of file
+            conn.commit() 
+
+    # 검색
+    @staticmethod
+    def _build_fts_query(text: str) -> str:
+        """입력 문자열을 FTS5 MATCH 식으로 변환
+
+        단어마다 따옴표로 감싸 FTS 연산자 문법을 무력화하고, 접두어 검색(*)으로
+        '보고서'가 '보고서를' 같은 조사 붙은 단어에도 일치하게 한다.
+        모든 단어가 포함된 결과만 찾는다(AND).
+        """
+        terms = []
+        for word in text.split():
+            terms.append('"' + word.replace('"', '""') + '"*')
+        return " ".join(terms)
+
+    def search(self, query: str, limit: int = 50, offset: int = 0) -> List[SearchHit]:
+        """모든 프로젝트의 할 일 제목/설명과 노트 내용 전문 검색
+
+        Args:
+            query: 검색어 (공백으로 구분된 단어는 모두 포함되어야 함)
+            limit: 최대 결과 수
+            offset: 건너뛸 결과 수 (페이지 이동용)
+
+        Returns:
+            관련도 순으로 정렬된 검색 결과 목록
+        """
+        if not query.split():
+            return []
+        if not self.fts_enabled:
+            return self._search_like(query, limit, offset)
+
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            # 할 일 제목은 설명보다 가중치를 높게 준다
+            cursor.execute("""
+                SELECT 'task', t.id, t.project_id, p.title, t.title,
+                       snippet(tasks_fts, -1, '[', ']', '…', 12),
+                       bm25(tasks_fts, 5.0, 1.0) AS rank
+                FROM tasks_fts
+                JOIN tasks t ON t.id = tasks_fts.rowid
+                JOIN projects p ON p.id = t.project_id
+                WHERE tasks_fts MATCH :query
+                UNION ALL
+                SELECT 'note', n.id, n.project_id, p.title, '',
+                       snippet(notes_fts, 0, '[', ']', '…', 12),
+                       bm25(notes_fts) AS rank
+                FROM notes_fts
+                JOIN notes n ON n.id = notes_fts.rowid
+                JOIN projects p ON p.id = n.project_id
+                WHERE notes_fts MATCH :query
+                ORDER BY rank
+                LIMIT :limit OFFSET :offset
+            """, {'query': self._build_fts_query(query), 'limit': limit, 'offset': offset})
+            return [SearchHit(kind=row[0], item_id=row[1], project_id=row[2], project_title=row[3],
+                              title=row[4], snippet=row[5], rank=row[6])
+                    for row in cursor.fetchall()]
+
+    def _search_like(self, query: str, limit: int, offset: int) -> List[SearchHit]:
+        """FTS5 를 쓸 수 없을 때의 LIKE 검색 (관련도 순위 없음)"""
+        words = query.split()
+        task_cond = " AND ".join("(t.title LIKE ? OR COALESCE(t.description, '') LIKE ?)" for _ in words)
+        note_cond = " AND ".join("n.content LIKE ?" for _ in words)
+        patterns = [f"%{word}%" for word in words]
+        params = [p for pattern in patterns for p in (pattern, pattern)] + patterns + [limit, offset]
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(f"""
+                SELECT 'task', t.id, t.project_id, p.title, t.title, COALESCE(t.description, '')
+                FROM tasks t JOIN projects p ON p.id = t.project_id
+                WHERE {task_cond}
+                UNION ALL
+                SELECT 'note', n.id, n.project_id, p.title, '', substr(n.content, 1, 80)
+                FROM notes n JOIN projects p ON p.id = n.project_id
+                WHERE {note_cond}
+                LIMIT ? OFFSET ?
+            """, params)
+            return [SearchHit(kind=row[0], item_id=row[1], project_id=row[2], project_title=row[3],
+                              title=row[4], snippet=row[5])
+                    for row in cursor.fetchall()]
+
+    # 백업 살펴보기/프로젝트 단위 복원 (백업 파일을 읽기 전용으로 ATTACH)
+    BACKUP_SCHEMA = "backup"
+
+    @contextmanager
+    def _attached_backup(self, backup_uri: str):
+        """백업 DB를 BACKUP_SCHEMA 이름으로 붙였다가 떼는 연결 (트랜잭션 밖에서만 ATTACH 가능)
+
+        Args:
+            backup_uri: 읽기 전용 URI (예: file:/.../backup.db?mode=ro&immutable=1)
+        """
+        conn = self.get_connection()
+        conn.execute(f"ATTACH DATABASE ? AS {self.BACKUP_SCHEMA}", (backup_uri,))
+        try:
+            yield conn
+        finally:
+            if conn.in_transaction:
+                conn.rollback()
+            conn.execute(f"DETACH DATABASE {self.BACKUP_SCHEMA}")
+
+    def _common_columns(self, conn, table: str) -> List[str]:
+        """현재 DB와 백업에 모두 있는 컬럼 (백업의 스키마 버전이 낮을 수 있음)"""
+        backup_columns = {row[1] for row in conn.execute(f"PRAGMA {self.BACKUP_SCHEMA}.table_info({table})")}
+        return [row[1] for row in conn.execute(f"PRAGMA main.table_info({table})") if row[1] in backup_columns]
+
+    def get_backup_projects(self, backup_uri: str) -> List[Tuple[Project, ProjectStats, bool]]:
+        """백업에 있는 프로젝트 목록
+
+        Returns:
+            [(프로젝트, 할 일 집계(전체/완료), 현재 DB에 있는지), ...] (제목순)
+        """
+        with self._attached_backup(backup_uri) as conn:
+            cursor = conn.cursor()
+            cursor.execute(f"""
+                SELECT p.id, p.title, p.description, p.created_date, p.updated_date,
+                       (SELECT COUNT(*) FROM {self.BACKUP_SCHEMA}.tasks t WHERE t.project_id = p.id),
+                       (SELECT COUNT(*) FROM {self.BACKUP_SCHEMA}.tasks t
+                        WHERE t.project_id = p.id AND t.completed),
+                       EXISTS (SELECT 1 FROM main.projects m WHERE m.id = p.id)
+                FROM {self.BACKUP_SCHEMA}.projects p
+                ORDER BY p.title COLLATE NOCASE, p.id
+            """)
+            return [(Project(id=row[0], title=row[1], description=row[2] or "",
+                             created_date=parse_datetime(row[3]), updated_date=parse_datetime(row[4])),
+                     ProjectStats(project_id=row[0], total=row[5], completed=row[6]),
+                     bool(row[7]))
+                    for row in cursor.fetchall()]
+
+    def get_backup_tasks(self, backup_uri: str, project_id: int) -> List[Task]:
+        """백업에 있는 프로젝트의 할 일 (목록 순서)"""
+        with self._attached_backup(backup_uri) as conn:
+            columns = set(self._common_columns(conn, 'tasks'))
+            # 오래된 백업에 없는 컬럼은 기본값으로
+            select = ", ".join(
+                column if column in columns else "NULL"
+                for column in ("id", "project_id", "title", "description", "completed",
+                               "order_index", "created_date", "completed_date", "due_date")
+            )
+            cursor = conn.execute(f"""
+                SELECT {select} FROM {self.BACKUP_SCHEMA}.tasks
+                WHERE project_id = ?
+                ORDER BY completed ASC, order_index ASC, id ASC
+            """, (project_id,))
+            return [self._row_to_task(row) for row in cursor.fetchall()]
+
+    def diff_project_with_backup(self, backup_uri: str, project_id: int) -> ProjectDiff:
+        """백업의 프로젝트와 현재 DB 비교 (id 기준, 양쪽에 있는 컬럼만 비교)"""
+        with self._attached_backup(backup_uri) as conn:
+            diff = ProjectDiff(project_id=project_id)
+            backup = self.BACKUP_SCHEMA
+            diff.in_backup = conn.execute(
+                f"SELECT 1 FROM {backup}.projects WHERE id = ?", (project_id,)).fetchone() is not None
+            diff.in_live = conn.execute(
+                "SELECT 1 FROM main.projects WHERE id = ?", (project_id,)).fetchone() is not None
+            if diff.in_backup and diff.in_live:
+                changed = " OR ".join(f"m.{c} IS NOT b.{c}" for c in self._common_columns(conn, 'projects'))
+                diff.project_changed = conn.execute(f"""
+                    SELECT 1 FROM main.projects m JOIN {backup}.projects b ON b.id = m.id
+                    WHERE m.id = ? AND ({changed})
+                """, (project_id,)).fetchone() is not None
+
+            # 현재 DB에서 프로젝트가 삭제되었으면 남아 있는 할 일/노트(외래 키 미사용으로 남은 고아 행)는
+            # 없는 것으로 본다 – 복원이 그 행들을 지우고 백업의 행을 모두 다시 넣으므로
+            live = 1 if diff.in_live else 0
+            for table in ('tasks', 'notes'):
+                columns = [c for c in self._common_columns(conn, table) if c not in ('id', 'project_id')]
+                changed = " OR ".join(f"m.{c} IS NOT b.{c}" for c in columns) or "0"
+                added, removed, modified = conn.execute(f"""
+                    SELECT
+                        (SELECT COUNT(*) FROM {backup}.{table} b WHERE b.project_id = :pid
+                         AND NOT EXISTS (SELECT 1 FROM main.{table} m WHERE m.id = b.id AND m.project_id = :pid AND :live)),
+                        (SELECT COUNT(*) FROM main.{table} m WHERE m.project_id = :pid AND :live
+                         AND NOT EXISTS (SELECT 1 FROM {backup}.{table} b WHERE b.id = m.id AND b.project_id = :pid)),
+                        (SELECT COUNT(*) FROM main.{table} m JOIN {backup}.{table} b ON b.id = m.id
+                         WHERE m.project_id = :pid AND b.project_id = :pid AND :live AND ({changed}))
+                """, {'pid': project_id, 'live': live}).fetchone()
+                setattr(diff, f"{table}_added", added)
+                setattr(diff, f"{table}_removed", removed)
+                setattr(diff, f"{table}_changed", modified)
+            return diff
+
+    def restore_project_from_backup(self, backup_uri: str, project_id: int) -> int:
+        """백업의 프로젝트 하나(프로젝트 행, 할 일, 노트)로 현재 DB의 같은 프로젝트를 되돌림
+
+        한 트랜잭션에서 현재 할 일/노트를 지우고 백업의 행을 INSERT ... SELECT 로 복사한다.
+        통계와 검색 인덱스는 트리거가 갱신한다. 백업의 할 일/노트 id가 그 사이 다른
+        프로젝트에서 쓰이고 있으면 그 행만 새 id로 복사한다.
+
+        Returns:
+            복원한 할 일 수
+
+        Raises:
+            ValueError: 백업에 프로젝트가 없는 경우
+        """
+        backup = self.BACKUP_SCHEMA
+        with self._attached_backup(backup_uri) as conn:
+            cursor = conn.cursor()
+            if cursor.execute(f"SELECT 1 FROM {backup}.projects WHERE id = ?", (project_id,)).fetchone() is None:
+                raise ValueError("백업에 해당 프로젝트가 없습니다.")
+
+            # 현재 할 일/노트 삭제 (삭제된 프로젝트에 남은 할 일 포함) – 통계 행을 만들기 전에
+            # 지워야 남은 할 일 수만큼 통계가 어긋나지 않음
+            for table in ('tasks', 'notes'):
+                cursor.execute(f"DELETE FROM main.{table} WHERE project_id = ?", (project_id,))
+
+            # 프로젝트 행: 있으면 백업 값으로 갱신, 없으면(삭제된 프로젝트) 같은 id로 추가
+            project_columns = self._common_columns(conn, 'projects')
+            if cursor.execute("SELECT 1 FROM main.projects WHERE id = ?", (project_id,)).fetchone():
+                assignments = ", ".join(
+                    f"{c} = (SELECT {c} FROM {backup}.projects WHERE id = :pid)"
+                    for c in project_columns if c != 'id'
+                )
+                cursor.execute(f"UPDATE main.projects SET {assignments} WHERE id = :pid", {'pid': project_id})
+            else:
+                column_list = ", ".join(project_columns)
+                cursor.execute(f"""
+                    INSERT INTO main.projects ({column_list})
+                    SELECT {column_list} FROM {backup}.projects WHERE id = ?
+                """, (project_id,))
+            cursor.execute("INSERT OR IGNORE INTO main.project_stats (project_id) VALUES (?)", (project_id,))
+
+            restored_tasks = 0
+            for table in ('tasks', 'notes'):
+                columns = self._common_columns(conn, table)
+                column_list = ", ".join(columns)
+                new_id_columns = ", ".join(c for c in columns if c != 'id')
+                # 백업의 id 그대로 (다른 프로젝트가 쓰는 id는 제외)
+                cursor.execute(f"""
+                    INSERT INTO main.{table} ({column_list})
+                    SELECT {column_list} FROM {backup}.{table} b
+                    WHERE b.project_id = :pid AND NOT EXISTS (SELECT 1 FROM main.{table} m WHERE m.id = b.id)
+                    ORDER BY b.id
+                """, {'pid': project_id})
+                copied = cursor.rowcount
+                # 다른 프로젝트가 쓰는 id는 새 id로
+                cursor.execute(f"""
+                    INSERT INTO main.{table} ({new_id_columns})
+                    SELECT {new_id_columns} FROM {backup}.{table} b
+                    WHERE b.project_id = :pid AND EXISTS (
+                        SELECT 1 FROM main.{table} m WHERE m.id = b.id AND m.project_id != :pid
+                    )
+                    ORDER BY b.id
+                """, {'pid': project_id})
+                copied += cursor.rowcount
+                if table == 'tasks':
+                    restored_tasks = copied
+            conn.commit()
+            return restored_tasks
@@ -0,0 +1,81 @@
+"""
+백그라운드 데이터베이스 실행기
+"""
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Optional
+
+from PySide6.QtCore import QObject, Signal
+
+
+class DatabaseExecutor(QObject):
+    """전용 워커 스레드에서 DB 작업을 실행하는 실행기
+
+    작업은 단일 스레드에서 제출 순서대로(FIFO) 실행되므로 쓰기 순서가 보장되고,
+    쓰기 뒤에 제출한 조회는 항상 그 결과를 본다. 콜백은 Qt 시그널을 통해
+    GUI 스레드에서 호출된다.
+    """
+
+    # (콜백, 결과) / (에러 콜백, 예외) – 워커 스레드 → GUI 스레드 전달용
+    _job_succeeded = Signal(object, object)
+    _job_failed = Signal(object, object)
+
+    def __init__(self, db, parent: Optional[QObject] = None):
+        """
+        초기화
+
+        Args:
+            db: Database 인스턴스 (워커 스레드는 자체 연결을 사용)
+            parent: 부모 QObject
+        """
+        super().__init__(parent)
+        self.db = db
+        self._pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="db-worker")
+        self._shutdown = False
+        self._job_succeeded.connect(self._on_job_succeeded)
+        self._job_failed.connect(self._on_job_failed)
+
+    def submit(self, func: Callable, *args,
+               callback: Optional[Callable] = None,
+               error_callback: Optional[Callable] = None, **kwargs) -> Optional[Future]:
+        """
+        DB 작업 제출
+
+        Args:
+            func: 워커 스레드에서 실행할 함수 (예: db.get_tasks_by_project)
+            callback: 성공 시 GUI 스레드에서 결과와 함께 호출
+            error_callback: 실패 시 GUI 스레드에서 예외와 함께 호출 (없으면 콘솔 출력)
+
+        Returns:
+            Future (종료된 실행기면 None)
+        """
+        if self._shutdown:
+            return None
+        return self._pool.submit(self._run_job, func, args, kwargs, callback, error_callback)
+
+    def _run_job(self, func, args, kwargs, callback, error_callback):
+        """워커 스레드에서 작업 실행 후 결과를 GUI 스레드로 전달"""
+        try:
+            result = func(*args, **kwargs)
+        except Exception as e:
+            self._job_failed.emit(error_callback, e)
+            raise
+        if callback is not None:
+            self._job_succeeded.emit(callback, result)
+        return result
+
+    def _on_job_succeeded(self, callback, result):
+        callback(result)
+
+    def _on_job_failed(self, error_callback, error):
+        if error_callback is not None:
+            error_callback(error)
+        else:
+            print(f"데이터베이스 작업 중 오류: {error}")
+
+    def shutdown(self):
+        """남은 작업을 마치고 워커 스레드와 그 연결을 종료"""
+        if self._shutdown:
+            return
+        self._shutdown = True
+        self._pool.submit(self.db.connection_manager.close_connection)
+        self._pool.shutdown(wait=True)
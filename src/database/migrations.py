@@ -0,0 +1,391 @@
+"""
+데이터베이스 스키마 마이그레이션
+
+각 단계는 PRAGMA user_version 으로 기록되며 한 번만 실행된다.
+새 스키마 변경은 MIGRATIONS 끝에 함수를 추가하는 방식으로 한다
+(이미 배포된 단계는 수정하지 않는다).
+"""
+import sqlite3
+from typing import Callable, List
+
+from database.models import ORDER_GAP
+
+
+def _column_exists(cursor, table: str, column: str) -> bool:
+    """테이블에 컬럼이 있는지 확인"""
+    cursor.execute(f"PRAGMA table_info({table})")
+    return any(row[1] == column for row in cursor.fetchall())
+
+
+def _migration_001_base_schema(cursor):
+    """기본 테이블 (projects, tasks, notes)"""
+    # 프로젝트 테이블
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS projects (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            title TEXT NOT NULL,
+            description TEXT,
+            created_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            updated_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    """)
+
+    # 할 일 테이블
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS tasks (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            project_id INTEGER NOT NULL,
+            title TEXT NOT NULL,
+            description TEXT,
+            completed BOOLEAN DEFAULT FALSE,
+            order_index INTEGER DEFAULT 0,
+            created_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            completed_date TIMESTAMP,
+            due_date TIMESTAMP,
+            FOREIGN KEY (project_id) REFERENCES projects (id) ON DELETE CASCADE
+        )
+    """)
+
+    # v0.3 이전 DB: order_index / due_date 컬럼이 없을 수 있음
+    if not _column_exists(cursor, 'tasks', 'order_index'):
+        cursor.execute("ALTER TABLE tasks ADD COLUMN order_index INTEGER DEFAULT 0")
+    if not _column_exists(cursor, 'tasks', 'due_date'):
+        cursor.execute("ALTER TABLE tasks ADD COLUMN due_date TIMESTAMP")
+
+    # 노트 테이블
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS notes (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            project_id INTEGER NOT NULL,
+            content TEXT NOT NULL,
+            created_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            FOREIGN KEY (project_id) REFERENCES projects (id) ON DELETE CASCADE
+        )
+    """)
+
+
+def _migration_002_project_stats(cursor):
+    """트리거로 유지되는 project_stats 테이블
+
+    tasks 변경 시 트리거가 프로젝트별 전체/완료 개수, 가장 이른 미완료 마감일,
+    마지막 변경 시각을 갱신한다. 미완료 조건은 인덱스를 탈 수 있도록
+    `completed = 0` 으로 쓴다.
+    """
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS project_stats (
+            project_id INTEGER PRIMARY KEY,
+            total INTEGER NOT NULL DEFAULT 0,
+            completed INTEGER NOT NULL DEFAULT 0,
+            next_due_date TIMESTAMP,
+            last_changed TIMESTAMP
+        )
+    """)
+
+    # 버전 관리 이전에 만들어진 트리거가 있으면 새 정의로 교체
+    for trigger in ('tasks_stats_insert', 'tasks_stats_delete', 'tasks_stats_update', 'projects_stats_delete'):
+        cursor.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+
+    # 할 일 추가: 개수 증가, 마감일은 더 이른 쪽으로
+    cursor.execute("""
+        CREATE TRIGGER tasks_stats_insert AFTER INSERT ON tasks
+        BEGIN
+            INSERT OR IGNORE INTO project_stats (project_id) VALUES (NEW.project_id);
+            UPDATE project_stats SET
+                total = total + 1,
+                completed = completed + (CASE WHEN NEW.completed THEN 1 ELSE 0 END),
+                next_due_date = CASE
+                    WHEN NOT NEW.completed AND NEW.due_date IS NOT NULL
+                         AND (next_due_date IS NULL OR NEW.due_date < next_due_date)
+                    THEN NEW.due_date ELSE next_due_date END,
+                last_changed = datetime('now', 'localtime')
+            WHERE project_id = NEW.project_id;
+        END
+    """)
+
+    # 할 일 삭제: 개수 감소, 가장 이른 마감일이 삭제된 경우에만 재계산
+    cursor.execute("""
+        CREATE TRIGGER tasks_stats_delete AFTER DELETE ON tasks
+        BEGIN
+            UPDATE project_stats SET
+                total = total - 1,
+                completed = completed - (CASE WHEN OLD.completed THEN 1 ELSE 0 END),
+                next_due_date = CASE
+                    WHEN NOT OLD.completed AND OLD.due_date = next_due_date
+                    THEN (SELECT MIN(due_date) FROM tasks
+                          WHERE project_id = OLD.project_id AND completed = 0 AND due_date IS NOT NULL)
+                    ELSE next_due_date END,
+                last_changed = datetime('now', 'localtime')
+            WHERE project_id = OLD.project_id;
+        END
+    """)
+
+    # 할 일 수정: 이전 값을 빼고 새 값을 더함 (order_index 변경은 통계와 무관하므로 제외)
+    cursor.execute("""
+        CREATE TRIGGER tasks_stats_update
+        AFTER UPDATE OF project_id, title, description, completed, due_date ON tasks
+        BEGIN
+            INSERT OR IGNORE INTO project_stats (project_id) VALUES (NEW.project_id);
+            UPDATE project_stats SET
+                total = total - 1,
+                completed = completed - (CASE WHEN OLD.completed THEN 1 ELSE 0 END)
+            WHERE project_id = OLD.project_id;
+            UPDATE project_stats SET
+                total = total + 1,
+                completed = completed + (CASE WHEN NEW.completed THEN 1 ELSE 0 END),
+                last_changed = datetime('now', 'localtime')
+            WHERE project_id = NEW.project_id;
+            UPDATE project_stats SET
+                next_due_date = (SELECT MIN(due_date) FROM tasks
+                                 WHERE project_id = project_stats.project_id
+                                   AND completed = 0 AND due_date IS NOT NULL)
+            WHERE project_id IN (OLD.project_id, NEW.project_id)
+              AND (OLD.completed IS NOT NEW.completed
+                   OR OLD.due_date IS NOT NEW.due_date
+                   OR OLD.project_id IS NOT NEW.project_id);
+        END
+    """)
+
+    # 프로젝트 삭제 시 통계 행도 제거
+    cursor.execute("""
+        CREATE TRIGGER projects_stats_delete AFTER DELETE ON projects
+        BEGIN
+            DELETE FROM project_stats WHERE project_id = OLD.id;
+        END
+    """)
+
+    # 기존 할 일로 통계 채우기
+    cursor.execute("DELETE FROM project_stats")
+    cursor.execute("""
+        INSERT INTO project_stats (project_id, total, completed, next_due_date, last_changed)
+        SELECT p.id,
+               COUNT(t.id),
+               COALESCE(SUM(CASE WHEN t.completed THEN 1 ELSE 0 END), 0),
+               MIN(CASE WHEN t.completed = 0 THEN t.due_date END),
+               datetime('now', 'localtime')
+        FROM projects p
+        LEFT JOIN tasks t ON t.project_id = p.id
+        GROUP BY p.id
+    """)
+
+
+def _migration_003_indexes(cursor):
+    """조회 패턴별 인덱스"""
+    # 할 일 목록: WHERE project_id = ? ORDER BY completed, order_index, created_date
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_tasks_project_order
+        ON tasks (project_id, completed, order_index, created_date)
+    """)
+    # 미완료 마감일 범위 검색 (급함/초과 집계, 가장 이른 마감일 재계산)
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_tasks_project_due
+        ON tasks (project_id, completed, due_date)
+    """)
+    # 노트: WHERE project_id = ? ORDER BY created_date DESC
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_notes_project_created
+        ON notes (project_id, created_date)
+    """)
+    # 프로젝트 목록: ORDER BY updated_date DESC
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_projects_updated
+        ON projects (updated_date)
+    """)
+
+
+def _migration_004_sparse_order(cursor):
+    """간격을 둔 order_index 와 프로젝트별 다음 순서 키
+
+    기존 1, 2, 3 ... 순번을 ORDER_GAP 간격으로 벌려 이동 시 중간값을 쓸 수 있게 하고,
+    새 할 일의 순서 키는 MAX(order_index) 대신 project_stats.next_order 에서 읽는다.
+    """
+    # 상대 순서를 유지한 채 간격을 벌림 (order_index 트리거 생성 전에 실행)
+    cursor.execute(f"UPDATE tasks SET order_index = COALESCE(order_index, 0) * {ORDER_GAP:d}")
+
+    cursor.execute("ALTER TABLE project_stats ADD COLUMN next_order INTEGER")
+    cursor.execute(f"""
+        UPDATE project_stats SET next_order = (
+            SELECT COALESCE(MAX(order_index), 0) + {ORDER_GAP:d}
+            FROM tasks WHERE tasks.project_id = project_stats.project_id
+        )
+    """)
+
+    # 할 일 추가/이동 시 next_order 를 항상 마지막 키 뒤로 유지
+    cursor.execute(f"""
+        CREATE TRIGGER tasks_order_insert AFTER INSERT ON tasks
+        BEGIN
+            INSERT OR IGNORE INTO project_stats (project_id) VALUES (NEW.project_id);
+            UPDATE project_stats
+            SET next_order = MAX(COALESCE(next_order, 0), NEW.order_index + {ORDER_GAP:d})
+            WHERE project_id = NEW.project_id;
+        END
+    """)
+    cursor.execute(f"""
+        CREATE TRIGGER tasks_order_update AFTER UPDATE OF order_index ON tasks
+        BEGIN
+            UPDATE project_stats
+            SET next_order = MAX(COALESCE(next_order, 0), NEW.order_index + {ORDER_GAP:d})
+            WHERE project_id = NEW.project_id;
+        END
+    """)
+
+
+def _fts5_available(cursor) -> bool:
+    """SQLite 빌드에 FTS5 모듈이 포함되어 있는지 확인"""
+    try:
+        cursor.execute("CREATE VIRTUAL TABLE temp._fts5_probe USING fts5(x)")
+        cursor.execute("DROP TABLE temp._fts5_probe")
+        return True
+    except sqlite3.OperationalError:
+        return False
+
+
+def _migration_005_fts(cursor):
+    """할 일/노트 전문 검색 인덱스 (FTS5)
+
+    외부 콘텐츠(external content) 테이블이라 본문은 tasks/notes 에만 저장되고
+    인덱스만 따로 유지된다. 동기화는 트리거가 맡는다.
+    FTS5 가 없는 SQLite 에서는 건너뛰며, 검색은 LIKE 로 대체된다.
+    """
+    if not _fts5_available(cursor):
+        print("경고: SQLite에 FTS5가 없어 전문 검색 인덱스를 만들지 않습니다.")
+        return
+
+    cursor.execute("""
+        CREATE VIRTUAL TABLE IF NOT EXISTS tasks_fts USING fts5(
+            title, description, content='tasks', content_rowid='id'
+        )
+    """)
+    cursor.execute("""
+        CREATE VIRTUAL TABLE IF NOT EXISTS notes_fts USING fts5(
+            content, content='notes', content_rowid='id'
+        )
+    """)
+
+    # 외부 콘텐츠 테이블은 삭제 시 이전 값을 'delete' 명령으로 넘겨야 함
+    cursor.execute("""
+        CREATE TRIGGER tasks_fts_insert AFTER INSERT ON tasks
+        BEGIN
+            INSERT INTO tasks_fts (rowid, title, description)
+            VALUES (NEW.id, NEW.title, NEW.description);
+        END
+    """)
+    cursor.execute("""
+        CREATE TRIGGER tasks_fts_delete AFTER DELETE ON tasks
+        BEGIN
+            INSERT INTO tasks_fts (tasks_fts, rowid, title, description)
+            VALUES ('delete', OLD.id, OLD.title, OLD.description);
+        END
+    """)
+    cursor.execute("""
+        CREATE TRIGGER tasks_fts_update AFTER UPDATE OF title, description ON tasks
+        BEGIN
+            INSERT INTO tasks_fts (tasks_fts, rowid, title, description)
+            VALUES ('delete', OLD.id, OLD.title, OLD.description);
+            INSERT INTO tasks_fts (rowid, title, description)
+            VALUES (NEW.id, NEW.title, NEW.description);
+        END
+    """)
+    cursor.execute("""
+        CREATE TRIGGER notes_fts_insert AFTER INSERT ON notes
+        BEGIN
+            INSERT INTO notes_fts (rowid, content) VALUES (NEW.id, NEW.content);
+        END
+    """)
+    cursor.execute("""
+        CREATE TRIGGER notes_fts_delete AFTER DELETE ON notes
+        BEGIN
+            INSERT INTO notes_fts (notes_fts, rowid, content) VALUES ('delete', OLD.id, OLD.content);
+        END
+    """)
+    cursor.execute("""
+        CREATE TRIGGER notes_fts_update AFTER UPDATE OF content ON notes
+        BEGIN
+            INSERT INTO notes_fts (notes_fts, rowid, content) VALUES ('delete', OLD.id, OLD.content);
+            INSERT INTO notes_fts (rowid, content) VALUES (NEW.id, NEW.content);
+        END
+    """)
+
+    # 기존 할 일/노트로 인덱스 채우기
+    cursor.execute("INSERT INTO tasks_fts (tasks_fts) VALUES ('rebuild')")
+    cursor.execute("INSERT INTO notes_fts (notes_fts) VALUES ('rebuild')")
+
+
+def _migration_006_task_keyset_index(cursor):
+    """할 일 키셋 페이지네이션용 인덱스
+
+    목록 정렬을 (completed, order_index, id) 로 바꾸면서 created_date 가 들어간
+    기존 인덱스를 교체한다. 인덱스 끝에는 rowid(id)가 암묵적으로 붙으므로
+    (project_id, completed, order_index) 만으로 정렬과 커서 비교를 모두 처리한다.
+    """
+    cursor.execute("DROP INDEX IF EXISTS idx_tasks_project_order")
+    cursor.execute("""
+        CREATE INDEX idx_tasks_project_order
+        ON tasks (project_id, completed, order_index)
+    """)
+
+
+# 순서대로 실행되는 마이그레이션 목록 (인덱스 + 1 = user_version)
+MIGRATIONS: List[Callable] = [
+    _migration_001_base_schema,
+    _migration_002_project_stats,
+    _migration_003_indexes,
+    _migration_004_sparse_order,
+    _migration_005_fts,
+    _migration_006_task_keyset_index,
+]
+
+SCHEMA_VERSION = len(MIGRATIONS)
+
+
+def rebuild_project_stats(cursor):
+    """tasks 테이블 전체를 집계해 project_stats 재작성"""
+    cursor.execute("DELETE FROM project_stats")
+    cursor.execute(f"""
+        INSERT INTO project_stats (project_id, total, completed, next_due_date, last_changed, next_order)
+        SELECT p.id,
+               COUNT(t.id),
+               COALESCE(SUM(CASE WHEN t.completed THEN 1 ELSE 0 END), 0),
+               MIN(CASE WHEN t.completed = 0 THEN t.due_date END),
+               datetime('now', 'localtime'),
+               COALESCE(MAX(t.order_index), 0) + {ORDER_GAP:d}
+        FROM projects p
+        LEFT JOIN tasks t ON t.project_id = p.id
+        GROUP BY p.id
+    """)
+
+
+def get_schema_version(conn: sqlite3.Connection) -> int:
+    """현재 DB 스키마 버전 (PRAGMA user_version)"""
+    return conn.execute("PRAGMA user_version").fetchone()[0]
+
+
+def migrate(conn: sqlite3.Connection) -> int:
+    """아직 적용되지 않은 마이그레이션을 순서대로 실행
+
+    각 단계는 자체 트랜잭션에서 실행되고 user_version 도 같은 트랜잭션에서
+    올라가므로, 중간에 실패해도 완료된 단계까지만 기록된다.
+
+    Args:
+        conn: 데이터베이스 연결
+
+    Returns:
+        마이그레이션 후 스키마 버전
+    """
+    version = get_schema_version(conn)
+    if version >= SCHEMA_VERSION:
+        if version > SCHEMA_VERSION:
+            print(f"경고: 데이터베이스 스키마 버전({version})이 프로그램({SCHEMA_VERSION})보다 높습니다.")
+        return version
+
+    for step in range(version, SCHEMA_VERSION):
+        cursor = conn.cursor()
+        cursor.execute("BEGIN")
+        try:
+            MIGRATIONS[step](cursor)
+            # PRAGMA 는 매개변수 바인딩을 지원하지 않음 (정수만 사용)
+            cursor.execute(f"PRAGMA user_version = {step + 1:d}")
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+    return SCHEMA_VERSION
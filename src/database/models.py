@@ -6,6 +6,10 @@ from datetime import datetime
 from typing import Optional, List
 
 
+# 할 일 order_index 간격 – 드래그 이동 시 이웃 키의 중간값을 써서 한 행만 갱신한다
+ORDER_GAP = 1024
+
+
 @dataclass
 class Project:
     """프로젝트 모델"""
@@ -49,4 +53,62 @@ class Note:
 
     def __post_init__(self):
         if self.created_date is None:
-            self.created_date = datetime.now() 
\ No newline at end of file
+            self.created_date = datetime.now() 
+
+
+@dataclass
+class ProjectStats:
+    """프로젝트별 할 일 집계 (목록 표시용)"""
+    project_id: int = 0
+    total: int = 0
+    completed: int = 0
+    urgent: int = 0    # 미완료 + 24시간 이내 마감
+    overdue: int = 0   # 미완료 + 마감일 초과
+    next_due_date: Optional[datetime] = None  # 가장 이른 미완료 마감일
+    last_changed: Optional[datetime] = None   # 마지막 할 일 변경 시각
+
+    @property
+    def remaining(self) -> int:
+        return self.total - self.completed
+
+    @property
+    def progress(self) -> float:
+        """진척도 퍼센트 (0.0 ~ 100.0)"""
+        if not self.total:
+            return 0.0
+        return (self.completed / self.total) * 100.0
+
+
+@dataclass
+class SearchHit:
+    """전문 검색 결과 한 건"""
+    kind: str = "task"       # 'task' 또는 'note'
+    item_id: int = 0         # 할 일/노트 id
+    project_id: int = 0
+    project_title: str = ""
+    title: str = ""          # 할 일 제목 (노트는 빈 문자열)
+    snippet: str = ""        # 일치 부분 주변 발췌
+    rank: float = 0.0        # bm25 점수 (작을수록 관련도 높음)
+
+
+@dataclass
+class ProjectDiff:
+    """백업의 프로젝트 하나와 현재 DB 비교 결과 (백업으로 되돌리면 바뀌는 내용)"""
+    project_id: int = 0
+    in_backup: bool = True         # 백업에 프로젝트가 있는지
+    in_live: bool = True           # 현재 DB에 프로젝트가 있는지 (없으면 삭제된 프로젝트)
+    project_changed: bool = False  # 제목/설명 등 프로젝트 행이 다른지
+    tasks_added: int = 0           # 백업에만 있는 할 일 (복원하면 다시 생김)
+    tasks_removed: int = 0         # 현재 DB에만 있는 할 일 (복원하면 사라짐)
+    tasks_changed: int = 0         # 양쪽에 있지만 내용이 다른 할 일
+    notes_added: int = 0
+    notes_removed: int = 0
+    notes_changed: int = 0
+
+    @property
+    def is_same(self) -> bool:
+        """현재 DB와 백업 내용이 같은지"""
+        return self.in_live and not (
+            self.project_changed or self.tasks_added or self.tasks_removed or self.tasks_changed
+            or self.notes_added or self.notes_removed or self.notes_changed
+        )
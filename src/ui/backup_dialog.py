@@ -1,51 +1,105 @@
 """
 백업/복원 다이얼로그
 """
+import os
 from PySide6.QtWidgets import (
-    QDialog, QVBoxLayout, QHBoxLayout, QPushButton, 
+    QDialog, QWidget, QVBoxLayout, QHBoxLayout, QPushButton, 
     QListWidget, QTableWidget, QTableWidgetItem, QHeaderView,
-    QLabel, QMessageBox, QInputDialog,
-    QProgressDialog, QApplication
+    QLabel, QMessageBox, QInputDialog, QFileDialog,
+    QProgressBar, QCheckBox, QSplitter, QListWidgetItem
 )
-from PySide6.QtCore import Qt, QThread, Signal
+from PySide6.QtCore import Qt
 from PySide6.QtGui import QFont
+from utils.backup_jobs import BackupJob
+from utils.helpers import format_datetime
 
 
-class BackupWorker(QThread):
-    """백업 작업을 위한 워커 스레드"""
-    finished = Signal(bool, str)
+class BackupJobIndicator(QWidget):
+    """백업 작업 대기열 상태 (실행 중인 작업, 진행률, 대기 수, 취소 버튼) – 작업이 없으면 숨김
     
-    def __init__(self, backup_manager, operation, *args):
-        super().__init__()
-        self.backup_manager = backup_manager
-        self.operation = operation
-        self.args = args
+    백업 창과 메인 창 상태바에서 함께 쓴다.
+    """
     
-    def run(self):
-        try:
-            if self.operation == 'create':
-                result = self.backup_manager.create_backup(*self.args)
-            elif self.operation == 'restore':
-                filename = self.args[0]
-                should_backup = self.args[1] if len(self.args) > 1 else True
-                result = self.backup_manager.restore_backup(filename, should_backup)
-            elif self.operation == 'delete':
-                result = self.backup_manager.delete_backup(*self.args)
-            else:
-                result = (False, "알 수 없는 작업입니다.")
-            
-            self.finished.emit(result[0], result[1])
-        except Exception as e:
-            self.finished.emit(False, f"작업 중 오류가 발생했습니다: {str(e)}")
+    def __init__(self, job_queue, parent=None):
+        super().__init__(parent)
+        self.job_queue = job_queue
+        
+        layout = QHBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        self.label = QLabel()
+        layout.addWidget(self.label)
+        self.progress = QProgressBar()
+        self.progress.setMaximumWidth(120)
+        self.progress.setTextVisible(False)
+        layout.addWidget(self.progress)
+        self.cancel_btn = QPushButton("취소")
+        self.cancel_btn.clicked.connect(self.cancel_current)
+        layout.addWidget(self.cancel_btn)
+        
+        for signal in (job_queue.job_added, job_queue.job_started,
+                       job_queue.job_progress, job_queue.job_finished):
+            signal.connect(self.refresh)
+        self.refresh()
+    
+    def refresh(self, *_):
+        """대기열 상태 다시 표시"""
+        jobs = self.job_queue.jobs()
+        if not jobs:
+            self.hide()
+            return
+        job = jobs[0]  # 넣은 순서대로 실행하므로 맨 앞이 실행 중인 작업
+        text = job.label
+        if job.percent is not None:
+            text += f" {job.percent}%"
+        if len(jobs) > 1:
+            text += f" (대기 {len(jobs) - 1}개)"
+        self.label.setText(text)
+        if job.percent is None:
+            self.progress.setRange(0, 0)  # 진행률을 모르는 작업
+        else:
+            self.progress.setRange(0, 100)
+            self.progress.setValue(job.percent)
+        self.cancel_btn.setEnabled(not job.is_cancelled())
+        self.show()
+    
+    def cancel_current(self):
+        """실행 중인 작업 취소"""
+        jobs = self.job_queue.jobs()
+        if jobs:
+            self.job_queue.cancel(jobs[0])
+            self.refresh()
 
 
 class BackupDialog(QDialog):
-    """백업/복원 다이얼로그"""
+    """백업/복원 다이얼로그
+    
+    작업은 MainWindow 의 백업 작업 대기열에 넣으므로 창을 닫아도 계속 실행된다
+    (진행 상황은 상태바에 표시). 창을 닫은 뒤 끝난 작업은 결과 창을 띄우지 않는다.
+    """
     
-    def __init__(self, backup_manager, parent=None):
+    def __init__(self, backup_manager, job_queue, parent=None, replace_database=None,
+                 db=None, db_executor=None, on_data_changed=None):
+        """
+        초기화
+        
+        Args:
+            backup_manager: BackupManager
+            job_queue: 작업을 실행할 BackupJobQueue
+            parent: 부모 위젯
+            replace_database: 복원 시 임시 파일을 DB 파일과 교체하는 함수 (작업 스레드에서 호출,
+                              열린 연결 정리와 화면 갱신은 호출하는 쪽이 담당)
+            db: 현재 Database (백업 살펴보기/프로젝트 단위 복원용, 없으면 살펴보기 숨김)
+            db_executor: db 작업을 실행할 DatabaseExecutor
+            on_data_changed: 프로젝트 단위 복원 후 호출 (화면 갱신)
+        """
         super().__init__(parent)
         self.backup_manager = backup_manager
-        self.worker = None
+        self.job_queue = job_queue
+        self.replace_database = replace_database
+        self.db = db
+        self.db_executor = db_executor
+        self.on_data_changed = on_data_changed
+        self._closed = False  # 창을 닫은 뒤 끝난 작업의 콜백은 무시
         self.init_ui()
         self.refresh_backup_list()
     
@@ -69,22 +123,27 @@ class BackupDialog(QDialog):
         
         # QListWidget → QTableWidget으로 변경 (시인성 개선)
         self.backup_list = QTableWidget()
-        self.backup_list.setColumnCount(4)
-        self.backup_list.setHorizontalHeaderLabels(["백업 이름", "생성일시", "파일 크기", "작업"])
+        self.backup_list.setColumnCount(5)
+        self.backup_list.setHorizontalHeaderLabels(["백업 이름", "생성일시", "원본 크기", "저장 크기", "작업"])
         
         # 컬럼 크기 설정
         header = self.backup_list.horizontalHeader()
         header.setSectionResizeMode(0, QHeaderView.Stretch)          # 백업 이름
         header.setSectionResizeMode(1, QHeaderView.ResizeToContents) # 생성일시
-        header.setSectionResizeMode(2, QHeaderView.ResizeToContents) # 파일 크기
-        header.setSectionResizeMode(3, QHeaderView.Fixed)            # 작업
-        self.backup_list.setColumnWidth(3, 100)
+        header.setSectionResizeMode(2, QHeaderView.ResizeToContents) # 원본(DB) 크기
+        header.setSectionResizeMode(3, QHeaderView.ResizeToContents) # 저장(압축) 크기
+        header.setSectionResizeMode(4, QHeaderView.Fixed)            # 작업
+        self.backup_list.setColumnWidth(4, 100)
         
         # 행 선택 모드 설정
         self.backup_list.setSelectionBehavior(QTableWidget.SelectRows)
         
         layout.addWidget(self.backup_list)
         
+        # 증분 백업 선택 (바뀐 부분만 저장)
+        self.incremental_check = QCheckBox("증분 백업 (이전 백업과 달라진 부분만 저장)")
+        layout.addWidget(self.incremental_check)
+        
         # 버튼 영역
         button_layout = QHBoxLayout()
         
@@ -98,6 +157,22 @@ class BackupDialog(QDialog):
         self.restore_btn.clicked.connect(self.restore_backup)
         button_layout.addWidget(self.restore_btn)
         
+        # 백업 살펴보기 버튼 (복원하지 않고 내용 확인, 프로젝트 하나만 복원)
+        self.browse_btn = QPushButton("살펴보기")
+        self.browse_btn.clicked.connect(self.browse_backup)
+        self.browse_btn.setVisible(self.db is not None and self.db_executor is not None)
+        button_layout.addWidget(self.browse_btn)
+        
+        # 백업 검사 버튼 (전체 무결성 검사)
+        self.verify_btn = QPushButton("검사")
+        self.verify_btn.clicked.connect(self.verify_backup)
+        button_layout.addWidget(self.verify_btn)
+        
+        # 백업 내보내기 버튼 (일반 .db 파일로 저장)
+        self.export_btn = QPushButton("내보내기")
+        self.export_btn.clicked.connect(self.export_backup)
+        button_layout.addWidget(self.export_btn)
+        
         # 백업 삭제 버튼
         self.delete_btn = QPushButton("백업 삭제")
         self.delete_btn.clicked.connect(self.delete_backup)
@@ -105,11 +180,15 @@ class BackupDialog(QDialog):
         
         # 새로고침 버튼
         self.refresh_btn = QPushButton("새로고침")
-        self.refresh_btn.clicked.connect(self.refresh_backup_list)
+        self.refresh_btn.clicked.connect(self.rescan_backups)
         button_layout.addWidget(self.refresh_btn)
         
         layout.addLayout(button_layout)
         
+        # 백업 작업 진행 상황 (창을 닫아도 작업은 계속됨)
+        self.job_indicator = BackupJobIndicator(self.job_queue, self)
+        layout.addWidget(self.job_indicator)
+        
         # 닫기 버튼
         close_layout = QHBoxLayout()
         close_layout.addStretch()
@@ -120,6 +199,11 @@ class BackupDialog(QDialog):
         
         layout.addLayout(close_layout)
     
+    def done(self, result):
+        """창 닫기 (진행 중인 작업은 계속 실행)"""
+        self._closed = True
+        super().done(result)
+    
     def refresh_backup_list(self):
         """백업 목록 새로고침"""
         self.backup_list.setRowCount(0)  # 기존 행 모두 제거
@@ -133,17 +217,20 @@ class BackupDialog(QDialog):
             self.backup_list.setItem(0, 0, no_backup_item)
             
             # 나머지 컬럼도 빈 아이템으로 채움
-            for col in range(1, 4):
+            for col in range(1, 5):
                 empty_item = QTableWidgetItem("")
                 empty_item.setFlags(empty_item.flags() & ~Qt.ItemIsSelectable)
                 self.backup_list.setItem(0, col, empty_item)
             
             self.restore_btn.setEnabled(False)
+            self.browse_btn.setEnabled(False)
+            self.verify_btn.setEnabled(False)
+            self.export_btn.setEnabled(False)
             self.delete_btn.setEnabled(False)
         else:
             self.backup_list.setRowCount(len(backups))
             
-            for row, (display_name, created_time, file_size, actual_filename) in enumerate(backups):
+            for row, (display_name, created_time, database_size, file_size, actual_filename) in enumerate(backups):
                 # 백업 이름 (사용자 지정 이름)
                 name_item = QTableWidgetItem(display_name)
                 name_item.setData(Qt.UserRole, actual_filename)  # 실제 파일명 저장
@@ -155,19 +242,50 @@ class BackupDialog(QDialog):
                 time_item.setFlags(time_item.flags() & ~Qt.ItemIsEditable)
                 self.backup_list.setItem(row, 1, time_item)
                 
-                # 파일 크기
+                # 원본 크기 (DB 크기)
+                database_size_item = QTableWidgetItem(database_size)
+                database_size_item.setFlags(database_size_item.flags() & ~Qt.ItemIsEditable)
+                self.backup_list.setItem(row, 2, database_size_item)
+                
+                # 저장 크기 (압축된 파일 크기)
                 size_item = QTableWidgetItem(file_size)
                 size_item.setFlags(size_item.flags() & ~Qt.ItemIsEditable)
-                self.backup_list.setItem(row, 2, size_item)
+                self.backup_list.setItem(row, 3, size_item)
                 
                 # 작업 컬럼 (비워둠 - 버튼은 별도 처리)
                 action_item = QTableWidgetItem("")
                 action_item.setFlags(action_item.flags() & ~Qt.ItemIsEditable)
-                self.backup_list.setItem(row, 3, action_item)
+                self.backup_list.setItem(row, 4, action_item)
             
             self.restore_btn.setEnabled(True)
+            self.browse_btn.setEnabled(True)
+            self.verify_btn.setEnabled(True)
+            self.export_btn.setEnabled(True)
             self.delete_btn.setEnabled(True)
     
+    def rescan_backups(self):
+        """백업 폴더를 다시 훑어 직접 추가/삭제한 파일을 목록에 반영"""
+        try:
+            self.backup_manager.reconcile_catalog()
+        except OSError as e:
+            QMessageBox.warning(self, "경고", f"백업 폴더를 읽을 수 없습니다: {str(e)}")
+        self.refresh_backup_list()
+    
+    def _selected_filename(self, warning):
+        """선택한 백업의 실제 파일명 (선택하지 않았으면 warning 을 띄우고 None)"""
+        current_row = self.backup_list.currentRow()
+        if current_row < 0:
+            QMessageBox.warning(self, "경고", warning)
+            return None
+        
+        # 첫 번째 컬럼(백업 이름)에서 실제 파일명 가져오기
+        name_item = self.backup_list.item(current_row, 0)
+        filename = name_item.data(Qt.UserRole) if name_item else None
+        if not filename:
+            QMessageBox.warning(self, "경고", "올바른 백업을 선택해주세요.")
+            return None
+        return filename
+    
     def create_backup(self):
         """백업 생성"""
         name, ok = QInputDialog.getText(
@@ -180,31 +298,27 @@ class BackupDialog(QDialog):
         
         # 빈 이름인 경우 None으로 처리
         backup_name = name.strip() if name.strip() else None
+        if self.backup_manager.is_reserved_name(backup_name):
+            QMessageBox.warning(
+                self, "경고",
+                f"'{self.backup_manager.AUTO_BACKUP_NAME}' 은(는) 자동 백업용 이름이라 사용할 수 없습니다.\n다른 이름을 입력해주세요."
+            )
+            return
         
-        self.show_progress("백업을 생성하고 있습니다...")
-        
-        self.worker = BackupWorker(self.backup_manager, 'create', backup_name)
-        self.worker.finished.connect(self.on_backup_finished)
-        self.worker.start()
+        incremental = self.incremental_check.isChecked()
+        self.job_queue.create_backup(backup_name, incremental, callback=self.on_job_finished)
     
     def restore_backup(self):
         """백업 복원"""
-        current_row = self.backup_list.currentRow()
-        if current_row < 0:
-            QMessageBox.warning(self, "경고", "복원할 백업을 선택해주세요.")
-            return
-        
-        # 첫 번째 컬럼(백업 이름)에서 실제 파일명 가져오기
-        name_item = self.backup_list.item(current_row, 0)
-        if not name_item:
-            QMessageBox.warning(self, "경고", "올바른 백업을 선택해주세요.")
-            return
-        
-        filename = name_item.data(Qt.UserRole)
+        filename = self._selected_filename("복원할 백업을 선택해주세요.")
         if not filename:
-            QMessageBox.warning(self, "경고", "올바른 백업을 선택해주세요.")
             return
         
+        # 복원하면 무엇이 바뀌는지 먼저 비교해서 보여줌
+        self.job_queue.diff_backup(filename, callback=lambda job: self.on_diff_finished(filename, job))
+    
+    def confirm_restore(self, filename, diff_text):
+        """비교 결과를 보여주고 복원 진행"""
         # 현재 데이터 자동 백업 여부 확인
         backup_reply = QMessageBox.question(
             self, "현재 데이터 백업",
@@ -216,36 +330,74 @@ class BackupDialog(QDialog):
         # 복원 진행 여부 확인
         restore_reply = QMessageBox.question(
             self, "백업 복원 확인",
-            f"정말로 '{filename}' 백업으로 복원하시겠습니까?",
+            f"{diff_text}\n\n정말로 '{filename}' 백업으로 복원하시겠습니까?",
             QMessageBox.Yes | QMessageBox.No,
             QMessageBox.No
         )
         
         if restore_reply == QMessageBox.Yes:
-            self.show_progress("백업을 복원하고 있습니다...")
-            
             # 자동 백업 여부를 함께 전달
             should_backup = backup_reply == QMessageBox.Yes
-            self.worker = BackupWorker(self.backup_manager, 'restore', filename, should_backup)
-            self.worker.finished.connect(self.on_restore_finished)
-            self.worker.start()
+            self.job_queue.restore_backup(filename, should_backup, self.replace_database,
+                                          callback=self.on_job_finished)
     
-    def delete_backup(self):
-        """백업 삭제"""
-        current_row = self.backup_list.currentRow()
-        if current_row < 0:
-            QMessageBox.warning(self, "경고", "삭제할 백업을 선택해주세요.")
+    def diff_text(self, diff):
+        """백업 비교 결과 문구 (복원하면 현재 데이터가 어떻게 바뀌는지)"""
+        if diff.is_same:
+            return "백업과 현재 데이터가 같습니다."
+        labels = {'projects': "프로젝트", 'tasks': "할 일", 'notes': "노트"}
+        lines = ["복원하면 현재 데이터가 이렇게 바뀝니다."]
+        for table in diff.tables:
+            lines.append(f"- {labels.get(table.table, table.table)}: 되살아남 {table.only_in_backup}, "
+                         f"사라짐 {table.only_in_live}, 바뀜 {table.changed}")
+        projects = diff.get('projects')
+        for title, ids, total in (("되살아나는 프로젝트", projects.backup_examples, projects.only_in_backup),
+                                  ("사라지는 프로젝트", projects.live_examples, projects.only_in_live),
+                                  ("바뀌는 프로젝트", projects.changed_examples, projects.changed)):
+            if not ids:
+                continue
+            names = ", ".join(diff.project_titles.get(project_id, f"#{project_id}") for project_id in ids)
+            if total > len(ids):
+                names += f" 외 {total - len(ids)}개"
+            lines.append(f"{title}: {names}")
+        return "\n".join(lines)
+    
+    def browse_backup(self):
+        """선택한 백업을 읽기 전용으로 열어 프로젝트/할 일 확인"""
+        filename = self._selected_filename("살펴볼 백업을 선택해주세요.")
+        if not filename:
             return
         
-        # 첫 번째 컬럼(백업 이름)에서 실제 파일명 가져오기
-        name_item = self.backup_list.item(current_row, 0)
-        if not name_item:
-            QMessageBox.warning(self, "경고", "올바른 백업을 선택해주세요.")
+        self.job_queue.open_backup(filename, callback=self.on_open_finished)
+    
+    def verify_backup(self):
+        """선택한 백업 전체 무결성 검사"""
+        filename = self._selected_filename("검사할 백업을 선택해주세요.")
+        if not filename:
             return
         
-        filename = name_item.data(Qt.UserRole)
+        self.job_queue.verify_backup(filename, callback=self.on_job_finished)
+    
+    def export_backup(self):
+        """선택한 백업을 일반 데이터베이스 파일로 내보내기"""
+        filename = self._selected_filename("내보낼 백업을 선택해주세요.")
+        if not filename:
+            return
+        
+        default_name = filename.split('.', 1)[0] + ".db"  # 백업 이름에는 '.' 이 없음
+        target_path, _ = QFileDialog.getSaveFileName(
+            self, "백업 내보내기", os.path.join(os.path.expanduser("~"), default_name),
+            "SQLite 데이터베이스 (*.db)"
+        )
+        if not target_path:
+            return
+        
+        self.job_queue.export_backup(filename, target_path, callback=self.on_job_finished)
+    
+    def delete_backup(self):
+        """백업 삭제"""
+        filename = self._selected_filename("삭제할 백업을 선택해주세요.")
         if not filename:
-            QMessageBox.warning(self, "경고", "올바른 백업을 선택해주세요.")
             return
         
         reply = QMessageBox.question(
@@ -257,50 +409,219 @@ class BackupDialog(QDialog):
         )
         
         if reply == QMessageBox.Yes:
-            self.show_progress("백업을 삭제하고 있습니다...")
-            
-            self.worker = BackupWorker(self.backup_manager, 'delete', filename)
-            self.worker.finished.connect(self.on_delete_finished)
-            self.worker.start()
-    
-    def show_progress(self, message):
-        """진행 상황 표시"""
-        self.progress = QProgressDialog(message, None, 0, 0, self)
-        self.progress.setWindowModality(Qt.WindowModal)
-        self.progress.show()
-        QApplication.processEvents()
-    
-    def hide_progress(self):
-        """진행 상황 숨기기"""
-        if hasattr(self, 'progress'):
-            self.progress.close()
-    
-    def on_backup_finished(self, success, message):
-        """백업 생성 완료"""
-        self.hide_progress()
-        
-        if success:
-            QMessageBox.information(self, "성공", message)
-            self.refresh_backup_list()
-        else:
-            QMessageBox.critical(self, "오류", message)
+            self.job_queue.delete_backup(filename, callback=self.on_job_finished)
     
-    def on_restore_finished(self, success, message):
-        """백업 복원 완료"""
-        self.hide_progress()
+    def on_job_finished(self, job):
+        """생성/복원/검사/내보내기/삭제 작업 완료 – 목록 갱신 후 결과 표시"""
+        if self._closed:
+            return  # 결과는 메인 창 상태바에 표시됨
         
-        if success:
-            QMessageBox.information(self, "성공", 
-                f"{message}\n\n프로그램을 다시 시작하여 복원된 데이터를 확인하세요.")
+        # 백업이 추가/삭제되었거나 (복원 전 before_restore 백업 포함) 검사 결과가 바뀌었을 수 있음
+        self.refresh_backup_list()
+        if job.state == BackupJob.DONE:
+            QMessageBox.information(self, "성공", job.message)
+        elif job.state == BackupJob.CANCELLED:
+            QMessageBox.information(self, "취소", job.message)
         else:
-            QMessageBox.critical(self, "오류", message)
+            QMessageBox.critical(self, "오류", job.message)
+    
+    def on_diff_finished(self, filename, job):
+        """백업 비교 완료 – 결과를 보여주고 복원 확인"""
+        if self._closed or job.state == BackupJob.CANCELLED:
+            return
+        if job.state != BackupJob.DONE:
+            QMessageBox.critical(self, "오류", job.message)
+            return
+        self.confirm_restore(filename, self.diff_text(job.result))
+    
+    def on_open_finished(self, job):
+        """백업 열기 완료 – 살펴보기 창 표시"""
+        if job.state != BackupJob.DONE:
+            if not self._closed and job.state == BackupJob.FAILED:
+                QMessageBox.critical(self, "오류", job.message)
+            return
+        snapshot = job.result
+        if self._closed:
+            self.db_executor.submit(snapshot.close)
+            return
+        browser = BackupBrowserDialog(snapshot, self.db, self.db_executor, self,
+                                      on_project_restored=self.on_data_changed)
+        browser.exec()
+        # 살펴보기 창에서 제출한 조회가 끝난 뒤 임시 파일 삭제 (DB 작업은 제출 순서대로 실행)
+        self.db_executor.submit(snapshot.close)
+
+
+class BackupBrowserDialog(QDialog):
+    """백업을 복원하지 않고 살펴보는 창 – 프로젝트/할 일 목록, 현재 데이터와 비교, 프로젝트 하나만 복원"""
+    
+    def __init__(self, snapshot, db, db_executor, parent=None, on_project_restored=None):
+        """
+        초기화
+        
+        Args:
+            snapshot: BackupManager.open_backup() 으로 연 백업
+            db: 현재 Database (백업을 ATTACH 해서 조회/복원)
+            db_executor: db 작업을 실행할 DatabaseExecutor
+            parent: 부모 위젯
+            on_project_restored: 프로젝트 복원 후 호출 (화면 갱신)
+        """
+        super().__init__(parent)
+        self.snapshot = snapshot
+        self.db = db
+        self.db_executor = db_executor
+        self.on_project_restored = on_project_restored
+        self._generation = 0  # 마지막 프로젝트 선택 번호 (늦게 도착한 결과 무시)
+        self.init_ui()
+        self.load_projects()
     
-    def on_delete_finished(self, success, message):
-        """백업 삭제 완료"""
-        self.hide_progress()
+    def init_ui(self):
+        """UI 초기화"""
+        self.setWindowTitle("백업 살펴보기")
+        self.setModal(True)
+        self.resize(760, 460)
+        
+        layout = QVBoxLayout(self)
+        
+        title = QLabel(f"백업 내용: {self.snapshot.filename}")
+        title.setFont(QFont("Arial", 12, QFont.Bold))
+        layout.addWidget(title)
         
-        if success:
-            QMessageBox.information(self, "성공", message)
-            self.refresh_backup_list()
+        splitter = QSplitter(Qt.Horizontal)
+        
+        # 백업에 있는 프로젝트
+        self.project_list = QListWidget()
+        self.project_list.currentItemChanged.connect(self.on_project_selected)
+        splitter.addWidget(self.project_list)
+        
+        # 선택한 프로젝트의 할 일과 현재 데이터와의 차이
+        self.task_table = QTableWidget()
+        self.task_table.setColumnCount(3)
+        self.task_table.setHorizontalHeaderLabels(["할 일", "완료", "마감일"])
+        self.task_table.setEditTriggers(QTableWidget.NoEditTriggers)
+        self.task_table.setSelectionBehavior(QTableWidget.SelectRows)
+        header = self.task_table.horizontalHeader()
+        header.setSectionResizeMode(0, QHeaderView.Stretch)
+        header.setSectionResizeMode(1, QHeaderView.ResizeToContents)
+        header.setSectionResizeMode(2, QHeaderView.ResizeToContents)
+        splitter.addWidget(self.task_table)
+        splitter.setSizes([260, 500])
+        layout.addWidget(splitter)
+        
+        self.diff_label = QLabel("프로젝트를 선택하세요.")
+        self.diff_label.setWordWrap(True)
+        layout.addWidget(self.diff_label)
+        
+        button_layout = QHBoxLayout()
+        button_layout.addStretch()
+        self.restore_project_btn = QPushButton("이 프로젝트만 복원")
+        self.restore_project_btn.setEnabled(False)
+        self.restore_project_btn.clicked.connect(self.restore_project)
+        button_layout.addWidget(self.restore_project_btn)
+        self.close_btn = QPushButton("닫기")
+        self.close_btn.clicked.connect(self.accept)
+        button_layout.addWidget(self.close_btn)
+        layout.addLayout(button_layout)
+    
+    def _selected_project(self):
+        item = self.project_list.currentItem()
+        return item.data(Qt.UserRole) if item else None
+    
+    def load_projects(self, select_project_id=None):
+        """백업의 프로젝트 목록 조회"""
+        self.db_executor.submit(
+            self.db.get_backup_projects, self.snapshot.uri,
+            callback=lambda rows: self._render_projects(rows, select_project_id),
+            error_callback=self._on_error
+        )
+    
+    def _render_projects(self, rows, select_project_id):
+        self.project_list.clear()
+        for project, stats, in_live in rows:
+            text = f"{project.title} ({stats.completed}/{stats.total})"
+            if not in_live:
+                text += " – 현재 없음"
+            item = QListWidgetItem(text)
+            item.setData(Qt.UserRole, project)
+            self.project_list.addItem(item)
+            if project.id == select_project_id:
+                self.project_list.setCurrentItem(item)
+        if not rows:
+            self.diff_label.setText("백업에 프로젝트가 없습니다.")
+    
+    def on_project_selected(self, *_):
+        """프로젝트 선택 – 백업의 할 일과 현재 데이터와의 차이 조회"""
+        project = self._selected_project()
+        self.restore_project_btn.setEnabled(project is not None)
+        self.task_table.setRowCount(0)
+        if project is None:
+            return
+        self._generation += 1
+        generation = self._generation
+        self.diff_label.setText("비교하는 중...")
+        self.db_executor.submit(
+            self.db.get_backup_tasks, self.snapshot.uri, project.id,
+            callback=lambda tasks: self._render_tasks(generation, tasks),
+            error_callback=self._on_error
+        )
+        self.db_executor.submit(
+            self.db.diff_project_with_backup, self.snapshot.uri, project.id,
+            callback=lambda diff: self._render_diff(generation, diff),
+            error_callback=self._on_error
+        )
+    
+    def _render_tasks(self, generation, tasks):
+        if generation != self._generation:
+            return
+        self.task_table.setRowCount(len(tasks))
+        for row, task in enumerate(tasks):
+            self.task_table.setItem(row, 0, QTableWidgetItem(task.title))
+            self.task_table.setItem(row, 1, QTableWidgetItem("✔" if task.completed else ""))
+            due = format_datetime(task.due_date, "%Y-%m-%d %H:%M") if task.due_date else ""
+            self.task_table.setItem(row, 2, QTableWidgetItem(due))
+    
+    def _render_diff(self, generation, diff):
+        if generation != self._generation:
+            return
+        if not diff.in_live:
+            text = "현재 데이터에 없는 프로젝트입니다. 복원하면 백업의 프로젝트가 다시 생깁니다."
+        elif diff.is_same:
+            text = "현재 데이터와 같습니다."
         else:
-            QMessageBox.critical(self, "오류", message) 
\ No newline at end of file
+            parts = []
+            if diff.project_changed:
+                parts.append("프로젝트 제목/설명이 다름")
+            parts.append(f"할 일: 되살아남 {diff.tasks_added}, 사라짐 {diff.tasks_removed}, "
+                         f"바뀜 {diff.tasks_changed}")
+            parts.append(f"노트: 되살아남 {diff.notes_added}, 사라짐 {diff.notes_removed}, "
+                         f"바뀜 {diff.notes_changed}")
+            text = "복원하면 – " + " / ".join(parts)
+        self.diff_label.setText(text)
+    
+    def restore_project(self):
+        """선택한 프로젝트만 백업 내용으로 되돌림 (다른 프로젝트는 그대로)"""
+        project = self._selected_project()
+        if project is None:
+            return
+        reply = QMessageBox.question(
+            self, "프로젝트 복원 확인",
+            f"'{project.title}' 프로젝트를 백업 내용으로 되돌리시겠습니까?\n\n"
+            "이 프로젝트의 현재 할 일과 노트는 백업의 내용으로 바뀝니다. 다른 프로젝트는 바뀌지 않습니다.",
+            QMessageBox.Yes | QMessageBox.No,
+            QMessageBox.No
+        )
+        if reply != QMessageBox.Yes:
+            return
+        
+        def _on_restored(count):
+            QMessageBox.information(self, "성공", f"'{project.title}' 프로젝트를 복원했습니다. (할 일 {count}개)")
+            if self.on_project_restored is not None:
+                self.on_project_restored()
+            self.load_projects(select_project_id=project.id)
+        
+        self.db_executor.submit(
+            self.db.restore_project_from_backup, self.snapshot.uri, project.id,
+            callback=_on_restored, error_callback=self._on_error
+        )
+    
+    def _on_error(self, error):
+        QMessageBox.critical(self, "오류", f"백업을 읽는 중 오류가 발생했습니다: {str(error)}")
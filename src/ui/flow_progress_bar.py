@@ -1,9 +1,10 @@
 from PySide6.QtWidgets import QProgressBar
-from PySide6.QtCore import QTimer, QRect, Qt
-from PySide6.QtGui import QPainter, QLinearGradient, QColor, QPalette, QPen, QGradient, QFont
+from PySide6.QtCore import QRect, QRectF, QPointF, Qt
+from PySide6.QtGui import QPainter, QLinearGradient, QColor, QPalette, QGradient, QFont, QPixmap
 
 # Utils import is placed inside to avoid heavy dependency if not used in other contexts
 from utils.theme_manager import theme_manager
+from utils.frame_clock import frame_clock
 
 class FlowProgressBar(QProgressBar):
     """Apple Music iOS-style flowing pastel gradient progress bar."""
@@ -44,22 +45,39 @@ class FlowProgressBar(QProgressBar):
         a = cls._lerp_channel(c1.alpha(), c2.alpha(), t)
         return QColor(r, g, b, a)
 
-    def _color_for_progress(self, progress: float) -> QColor:
-        """Return blended QColor based on progress (0-100)."""
-        segments = self._segments_dark if theme_manager.get_current_theme() == "dark" else self._segments_light
+    @classmethod
+    def _blend_segments(cls, segments, progress: float) -> QColor:
+        """Walk the segment list and blend the color for progress (0-100)."""
         for start, end, c_start, c_end in segments:
             if progress <= end:
                 t = (progress - start) / (end - start) if end != start else 0
-                return self._interpolate_color(c_start, c_end, t)
+                return cls._interpolate_color(c_start, c_end, t)
         return segments[-1][3]
 
-    def _current_palette(self):
+    # 진척도 0~100 → 색상 조회 테이블 (테마별, 처음 사용할 때 한 번 계산)
+    _color_lut: dict = {}
+
+    @classmethod
+    def _lut(cls, theme: str) -> list:
+        lut = cls._color_lut.get(theme)
+        if lut is None:
+            segments = cls._segments_dark if theme == "dark" else cls._segments_light
+            lut = [cls._blend_segments(segments, progress) for progress in range(101)]
+            cls._color_lut[theme] = lut
+        return lut
+
+    def _color_for_progress(self, progress: float, theme: str | None = None) -> QColor:
+        """Return blended QColor based on progress (0-100) from the lookup table."""
+        lut = self._lut(theme or theme_manager.get_current_theme())
+        return lut[max(0, min(100, round(progress)))]
+
+    def _current_palette(self, theme: str | None = None):
         """Generate three colors for gradient based on current progress with slight brightness variation."""
-        base_color = self._color_for_progress(self.value())
+        base_color = self._color_for_progress(self.value(), theme)
         lighter = base_color.lighter(120)
         return [lighter, base_color, lighter]
 
-    # Smaller value => faster flow. 0.2 ≈ 5 s cycle for full loop when timer is 16 ms.
+    # Gradient shift per second. 0.2 ≈ 5 s cycle for full loop.
     gradient_speed = 0.2
 
     show_text: bool = True
@@ -68,13 +86,14 @@ class FlowProgressBar(QProgressBar):
         super().__init__(parent)
         self._offset = 0.0  # value between 0 and 1 indicating current gradient shift
         self._celebration = False  # 100% 완료 축하 모드 여부
+        self._text_font = QFont("Segoe UI", 10, QFont.Bold)
+        # 미리 그려둔 이미지: 이름 → (캐시 키, QPixmap). 값/테마/크기가 바뀔 때만 다시 그림
+        self._pixmap_cache: dict[str, tuple[tuple, QPixmap]] = {}
         # The default text is shown separately by MainWindow, so hide internal text.
         self.setTextVisible(False)
 
-        # Timer drives continuous offset updates (approx 60 FPS)
-        self._timer = QTimer(self)
-        self._timer.timeout.connect(self._update_offset)
-        self._timer.start(16)
+        # 공유 프레임 시계가 offset 을 갱신 (보이는 막대가 없으면 시계가 멈춤)
+        frame_clock.subscribe(self)
 
         # Repaint when theme changes to adjust color palette automatically
         theme_manager.theme_changed.connect(lambda *_: self.update())
@@ -83,79 +102,113 @@ class FlowProgressBar(QProgressBar):
     # Painting Logic
     # ---------------------------------------------------------------------
     def paintEvent(self, event):  # noqa: N802 (Qt naming conventions)
+        # 그라디언트 한 주기와 퍼센트 글자는 미리 그려두고, 프레임마다 offset 만큼
+        # 밀어서 붙이기만 한다 (QLinearGradient/QColor/QFont 를 매 프레임 만들지 않음)
         painter = QPainter(self)
         rect = self.rect()
+        theme = theme_manager.get_current_theme()
 
         # Background: use the base color from current palette so that widget
         # integrates with the active theme.
         painter.fillRect(rect, self.palette().color(QPalette.Base))
 
-        # Calculate filled portion of the bar
+        filled_rect = self._filled_rect()
+        filled_width = filled_rect.width()
+
+        if filled_width > 0:
+            if self._celebration:
+                # 축하 모드: 골드 그라디언트 (흐르지 않음)
+                painter.drawPixmap(filled_rect.topLeft(), self._celebration_strip(theme, filled_rect.size()))
+            else:
+                # RepeatSpread 그라디언트의 시작점을 offset 만큼 옮긴 것과 같도록 한 주기를 타일로 붙임
+                strip = self._gradient_strip(theme, filled_rect.size())
+                shift = ((1.0 - self._offset) % 1.0) * filled_width
+                painter.drawTiledPixmap(QRectF(filled_rect), strip, QPointF(shift, 0))
+
+        # Draw percentage text
+        if self.show_text:
+            painter.drawPixmap(rect.topLeft(), self._text_overlay(theme, rect.size()))
+        painter.end()
+
+    def _filled_rect(self) -> QRect:
+        """Calculate filled portion of the bar."""
+        rect = self.rect()
         if self.maximum() == self.minimum():
             progress_ratio = 0.0
         else:
             progress_ratio = (self.value() - self.minimum()) / (self.maximum() - self.minimum())
-        filled_width = int(rect.width() * progress_ratio)
-        filled_rect = QRect(rect.x(), rect.y(), filled_width, rect.height())
+        return QRect(rect.x(), rect.y(), int(rect.width() * progress_ratio), rect.height())
 
-        # 축하 모드: 골드 그라디언트로 덮어쓰기 ------------------------------------------------
-        if self._celebration:
-            gold_start = QColor("#FFD700") if theme_manager.get_current_theme() == "light" else QColor("#FFA000")
-            gold_end = QColor("#FFB400") if theme_manager.get_current_theme() == "light" else QColor("#FFCC00")
+    # ------------------------------------------------------------------
+    # Cached rendering
+    # ------------------------------------------------------------------
+    def _cached_pixmap(self, name: str, key: tuple, size, render) -> QPixmap:
+        """키가 같으면 보관한 이미지를, 다르면 render(painter)로 새로 그려 반환"""
+        ratio = self.devicePixelRatioF()
+        key = key + (size.width(), size.height(), ratio)
+        cached = self._pixmap_cache.get(name)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        pixmap = QPixmap(max(1, round(size.width() * ratio)), max(1, round(size.height() * ratio)))
+        pixmap.setDevicePixelRatio(ratio)
+        pixmap.fill(Qt.transparent)
+        painter = QPainter(pixmap)
+        render(painter, QRect(0, 0, size.width(), size.height()))
+        painter.end()
+        self._pixmap_cache[name] = (key, pixmap)
+        return pixmap
+
+    def _gradient_strip(self, theme: str, size) -> QPixmap:
+        """흐르는 그라디언트 한 주기 (채워진 폭 = 한 주기)"""
+        def render(painter, rect):
+            colors = self._current_palette(theme)
+            grad = QLinearGradient(0, 0, 1, 0)
+            grad.setCoordinateMode(QGradient.ObjectBoundingMode)
+            for pos, color in zip([0.0, 0.5, 1.0], colors):
+                grad.setColorAt(pos, color)
+            painter.fillRect(rect, grad)
+        return self._cached_pixmap('strip', ('flow', theme, self.value()), size, render)
+
+    def _celebration_strip(self, theme: str, size) -> QPixmap:
+        """축하 모드 골드 그라디언트"""
+        def render(painter, rect):
+            gold_start = QColor("#FFD700") if theme == "light" else QColor("#FFA000")
+            gold_end = QColor("#FFB400") if theme == "light" else QColor("#FFCC00")
             grad = QLinearGradient(0, 0, 1, 0)
             grad.setCoordinateMode(QGradient.ObjectBoundingMode)
             grad.setColorAt(0.0, gold_start)
             grad.setColorAt(1.0, gold_end)
-            painter.fillRect(filled_rect, grad)
-            # 텍스트
-            if self.show_text:
-                pct_text = f"{self.value():.0f}%"
-                painter.setFont(QFont("Segoe UI", 10, QFont.Bold))
-                painter.setPen(QColor("#333") if theme_manager.get_current_theme() == "light" else QColor("#fff"))
-                painter.drawText(rect, Qt.AlignCenter, pct_text)
-            painter.end()
-            return
-
-        # Select color set depending on theme
-        colors = self._current_palette()
-
-        # Build flowing linear gradient using RepeatSpread for seamless wrap
-        grad = QLinearGradient(self._offset, 0, 1 + self._offset, 0)
-        grad.setCoordinateMode(QGradient.ObjectBoundingMode)
-        grad.setSpread(QGradient.RepeatSpread)
-
-        # Static color stops – pattern itself repeats, so offset is handled by start/stop shift
-        for pos, color in zip([0.0, 0.5, 1.0], colors):
-            grad.setColorAt(pos, color)
+            painter.fillRect(rect, grad)
+        return self._cached_pixmap('strip', ('celebration', theme), size, render)
 
-        painter.fillRect(filled_rect, grad)
-
-        # Draw percentage text
-        if self.show_text:
-            pct_text = f"{self.value():.0f}%"
-            painter.setFont(QFont("Segoe UI", 10, QFont.Bold))
-            base_color = self._color_for_progress(self.value())
-            if theme_manager.get_current_theme() == "light" and self.value() < 60:
-                text_color = QColor("#424242")  # fixed dark gray for early progress
-            else:
-                luminance = 0.299 * base_color.redF() + 0.587 * base_color.greenF() + 0.114 * base_color.blueF()
-                text_color = QColor("#000") if luminance > 0.6 else QColor("#fff")
-            painter.setPen(text_color)
-            painter.drawText(rect, Qt.AlignCenter, pct_text)
-
-        # Optional: draw border (disabled pen draws nothing)
-        painter.setPen(QPen(Qt.NoPen))
-        painter.end()
+    def _text_color(self, theme: str) -> QColor:
+        """퍼센트 글자 색상"""
+        if self._celebration:
+            return QColor("#333") if theme == "light" else QColor("#fff")
+        if theme == "light" and self.value() < 60:
+            return QColor("#424242")  # fixed dark gray for early progress
+        base_color = self._color_for_progress(self.value(), theme)
+        luminance = 0.299 * base_color.redF() + 0.587 * base_color.greenF() + 0.114 * base_color.blueF()
+        return QColor("#000") if luminance > 0.6 else QColor("#fff")
+
+    def _text_overlay(self, theme: str, size) -> QPixmap:
+        """퍼센트 글자만 그린 투명 이미지"""
+        def render(painter, rect):
+            painter.setFont(self._text_font)
+            painter.setPen(self._text_color(theme))
+            painter.drawText(rect, Qt.AlignCenter, f"{self.value():.0f}%")
+        return self._cached_pixmap('text', (theme, self.value(), self._celebration), size, render)
 
     # ------------------------------------------------------------------
     # Internal helpers
     # ------------------------------------------------------------------
-    def _update_offset(self):
-        """Shift gradient offset and schedule repaint."""
+    def advance_frame(self, dt: float):
+        """Shift gradient offset by elapsed time and schedule repaint (called by frame_clock)."""
         # accumulate offset; modulo 1.0 keeps value in reasonable range w/o visual jump
-        delta = self.gradient_speed * (16 / 1000)
+        delta = self.gradient_speed * dt
         self._offset = (self._offset + delta) % 1.0  # 방향 유지 (start 좌표 변경으로 반전)
-        self.update()
+        # 흐르는 건 채워진 부분뿐이므로 그 영역만 다시 그림
+        self.update(self._filled_rect())
 
     def set_celebration_mode(self, enabled: bool):
         """골드 Morph 축하 모드 켜고 끄기"""
@@ -163,8 +216,8 @@ class FlowProgressBar(QProgressBar):
             return
         self._celebration = enabled
         if enabled:
-            self._timer.stop()  # 흐르는 그라디언트 정지
+            frame_clock.unsubscribe(self)  # 흐르는 그라디언트 정지
         else:
             self._offset = 0.0
-            self._timer.start(16)
+            frame_clock.subscribe(self)
         self.update() 
\ No newline at end of file
@@ -0,0 +1,114 @@
+"""
+목록 모델의 키 기반 비교 (바뀐 행만 알림)
+"""
+from bisect import bisect_left
+from typing import Callable, Hashable, List, Optional, Set
+from PySide6.QtCore import QAbstractItemModel, QModelIndex
+
+
+# 옮겨야 할 행이 이보다 많으면 전체 리셋이 더 싸다
+MAX_INCREMENTAL_MOVES = 64
+
+
+def _stable_keys(keys: List[Hashable], position: dict) -> Set[Hashable]:
+    """기존 위치(position)가 증가하는 가장 긴 부분열의 키 집합"""
+    tails: List[int] = []        # 길이별 부분열 마지막 원소의 기존 위치
+    tail_index: List[int] = []   # 위 원소의 keys 인덱스
+    parent = [-1] * len(keys)
+    for i, key in enumerate(keys):
+        pos = position[key]
+        k = bisect_left(tails, pos)
+        if k == len(tails):
+            tails.append(pos)
+            tail_index.append(i)
+        else:
+            tails[k] = pos
+            tail_index[k] = i
+        parent[i] = tail_index[k - 1] if k > 0 else -1
+    stable = set()
+    i = tail_index[-1] if tail_index else -1
+    while i >= 0:
+        stable.add(keys[i])
+        i = parent[i]
+    return stable
+
+
+def apply_keyed_diff(model: QAbstractItemModel, items: list, new_items: list,
+                     key: Callable[[object], Hashable],
+                     on_removed: Optional[Callable[[object], None]] = None,
+                     on_changed: Optional[Callable[[int], None]] = None,
+                     max_moves: int = MAX_INCREMENTAL_MOVES) -> bool:
+    """모델이 가진 목록(items)을 new_items 와 같아지도록 고치며 바뀐 행만 알림
+
+    사라진 행은 remove, 새 행은 insert, 순서가 바뀐 행은 move 로 알리고,
+    내용이 다른 행만 on_changed 로 넘긴다. 제자리에 둘 행은 새 순서에서 기존
+    위치가 증가하는 가장 긴 부분열로 정하므로 행 하나가 옮겨지면 move 도 한 번이다.
+
+    Args:
+        model: 알림을 보낼 1차원 목록 모델 (최상위 행만 사용)
+        items: 모델이 보관하는 목록 (제자리에서 수정됨)
+        new_items: 새 목록
+        key: 항목 식별 키 함수
+        on_removed: 제거된 항목마다 호출 (캐시 정리 등)
+        on_changed: 내용이 바뀐 행 번호마다 호출 (dataChanged 발생용)
+        max_moves: 이동할 행이 이보다 많으면 적용하지 않음
+
+    Returns:
+        적용 여부 (False 면 호출한 쪽에서 모델을 리셋)
+    """
+    new_keys = {key(item) for item in new_items}
+    position = {}
+    for item in items:
+        if key(item) in new_keys:
+            position[key(item)] = len(position)
+    stable = _stable_keys([key(item) for item in new_items if key(item) in position], position)
+    if len(new_items) - len(stable) > max_moves:
+        return False
+
+    def row_of(item_key) -> int:
+        for row, item in enumerate(items):
+            if key(item) == item_key:
+                return row
+        return -1
+
+    # 1) 사라진 행 제거 (뒤에서부터 연속 구간 단위)
+    row = len(items) - 1
+    while row >= 0:
+        if key(items[row]) in new_keys:
+            row -= 1
+            continue
+        last = row
+        while row >= 0 and key(items[row]) not in new_keys:
+            row -= 1
+        model.beginRemoveRows(QModelIndex(), row + 1, last)
+        if on_removed is not None:
+            for removed in items[row + 1:last + 1]:
+                on_removed(removed)
+        del items[row + 1:last + 1]
+        model.endRemoveRows()
+
+    # 2) 새 순서대로 앞 이웃 바로 뒤에 오도록 이동/삽입
+    for i, item in enumerate(new_items):
+        item_key = key(item)
+        if item_key in stable:
+            continue
+        target = row_of(key(new_items[i - 1])) + 1 if i > 0 else 0
+        source = row_of(item_key) if item_key in position else -1
+        if source < 0:
+            model.beginInsertRows(QModelIndex(), target, target)
+            items.insert(target, item)
+            model.endInsertRows()
+        elif target not in (source, source + 1):
+            model.beginMoveRows(QModelIndex(), source, source, QModelIndex(), target)
+            items.insert(target if target < source else target - 1, items.pop(source))
+            model.endMoveRows()
+
+    # 3) 새 객체로 교체하고 내용이 바뀐 행만 알림
+    for row, item in enumerate(new_items):
+        old = items[row]
+        if old is item:
+            continue
+        items[row] = item
+        if old != item and on_changed is not None:
+            on_changed(row)
+    return True
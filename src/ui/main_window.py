@@ -4,39 +4,37 @@
 from PySide6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
     QSplitter, QLabel, QPushButton, QMessageBox,
-    QListWidget, QListWidgetItem, QInputDialog,
+    QListView, QInputDialog,
     QTextEdit, QProgressBar, QTabWidget, QFrame,
-    QMenuBar, QMenu, QApplication, QGraphicsOpacityEffect
+    QMenuBar, QMenu, QApplication, QGraphicsOpacityEffect,
+    QLineEdit
 )
-from PySide6.QtCore import Qt, Signal, QTimer, QRect, QEvent, QPropertyAnimation, QEasingCurve, QPoint
+from PySide6.QtCore import Qt, Signal, QTimer, QModelIndex, QRect, QEvent, QPropertyAnimation, QEasingCurve, QPoint
 from PySide6.QtGui import QFont, QAction, QShortcut, QKeySequence, QColor, QFontMetrics, QPainter, QPen
 from database.database import Database
-from database.models import Project
+from database.executor import DatabaseExecutor
+from database.models import Project, SearchHit
 from utils.progress import ProgressCalculator
 from utils.helpers import format_datetime, truncate_text, validate_project_title
 from utils.theme_manager import theme_manager
-from utils.status_manager import status_manager
 from utils.animation_manager import animation_manager
+from utils.frame_clock import frame_clock
+from utils.refresh_bus import refresh_bus, RefreshBus
 from utils.backup_manager import BackupManager
+from utils.backup_jobs import BackupJobQueue
+from utils.backup_scheduler import BackupScheduler
 from ui.project_widget import ProjectWidget
-from ui.backup_dialog import BackupDialog
+from ui.project_list_model import ProjectListModel
+from ui.project_delegates import ProjectItemDelegate
+from ui.backup_dialog import BackupDialog, BackupJobIndicator
 from ui.flow_progress_bar import FlowProgressBar
 from utils.celebration_manager import CelebrationManager
-import random  # 랜덤 축하 메시지에 사용
+import random  # 랜덤 도장 문구 선택에 사용
 
 
 class MainWindow(QMainWindow):
     """메인 윈도우"""
     
-    # 100% 달성 축하 아이콘/문구 리스트
-    CELEBRATION_ICONS = ["| 🤩", "| 🥳", "| 🎉", "| 👍"]
-    CELEBRATION_MESSAGES = [
-        "완벽 실행‼",
-        "성공적 마무리‼",
-        "100% 달성‼",
-        "최고의 결과‼"
-    ]
-    
     # 완료 도장 문구 리스트 (공백/개행 동일 규칙 적용)
     STAMP_TEXTS = [
         "대 박 \n 사 건",
@@ -46,16 +44,30 @@ class MainWindow(QMainWindow):
         "해 치 \n 웠 다"
     ]
     
+    # 검색 결과 메뉴에 표시할 최대 개수
+    SEARCH_RESULT_LIMIT = 30
+    
+    # 백업 백그라운드 전체 검사 (시작 후 첫 검사까지, 이후 주기)
+    BACKUP_VERIFY_DELAY_MS = 60 * 1000
+    BACKUP_VERIFY_INTERVAL_MS = 60 * 60 * 1000
+    
     def __init__(self):
         super().__init__()
         self.db = Database()
+        # DB 조회/변경은 전용 워커 스레드에서 실행 (GUI 스레드 차단 방지)
+        self.db_executor = DatabaseExecutor(self.db, self)
         self.backup_manager = BackupManager(self.db.db_path)
         self.current_project = None
+        self._projects_generation = 0  # 마지막 load_projects 요청 번호
+        self._search_generation = 0    # 마지막 검색 요청 번호
         # 축하 효과 실행 중 여부는 CelebrationManager 자체에서 관리
         self.init_ui()
         self.setup_theme()
         # 축하 매니저 초기화(테마·애니메이션 매니저 공유)
         self.celebration_manager = CelebrationManager(self, theme_manager, animation_manager)
+        # 할 일 변경 등으로 생긴 갱신 요청은 버스로 모아 틱마다 한 번씩 처리
+        refresh_bus.register(RefreshBus.PROJECT_INFO, self.update_project_info)
+        refresh_bus.register(RefreshBus.SIDEBAR, self.load_projects)
         self.load_projects()
 
         # 설명 라벨 테마 변경 시 동기화
@@ -74,6 +86,27 @@ class MainWindow(QMainWindow):
         # 도장 페이드 아웃 애니메이션 보관용
         self._stamp_fade_anim: QPropertyAnimation | None = None
 
+        # 백업 작업(생성·검사·복원·내보내기·자동 백업)은 한 대기열에서 차례로 실행 – 진행 상황은 상태바에
+        self.backup_jobs = BackupJobQueue(self.backup_manager, self)
+        self.backup_jobs.job_finished.connect(self._on_backup_job_finished)
+        self.statusBar().addPermanentWidget(BackupJobIndicator(self.backup_jobs, self))
+
+        # 백업 전체 무결성 검사는 생성/복원 시 하지 않고 백그라운드에서 주기적으로 실행
+        # 보존 정책 정리도 같은 주기로 (자동 백업이 필요 없어 만들지 않은 동안에도 오래된 백업이 정리되도록)
+        self._backup_verify_job = None
+        self._backup_prune_job = None
+        self.backup_verify_timer = QTimer(self)
+        self.backup_verify_timer.timeout.connect(self.start_backup_pruning)
+        self.backup_verify_timer.timeout.connect(self.start_backup_verification)
+        self.backup_verify_timer.start(self.BACKUP_VERIFY_INTERVAL_MS)
+        QTimer.singleShot(self.BACKUP_VERIFY_DELAY_MS, self.start_backup_pruning)
+        QTimer.singleShot(self.BACKUP_VERIFY_DELAY_MS, self.start_backup_verification)
+
+        # 자동 백업 (일정 시간마다 또는 변경이 많이 쌓이면, 워커 스레드에서)
+        self.backup_scheduler = BackupScheduler(self.backup_manager, self.db.total_changes, self.backup_jobs, self)
+        self.backup_scheduler.backup_finished.connect(self._on_auto_backup_finished)
+        self.backup_scheduler.start()
+
     def init_ui(self):
         """UI 초기화"""
         self.setWindowTitle("Progress Program v0.5")
@@ -122,12 +155,22 @@ class MainWindow(QMainWindow):
         self.new_project_btn.clicked.connect(self.create_new_project)
         layout.addWidget(self.new_project_btn)
         
-        # 프로젝트 목록
-        self.project_list = QListWidget()
-        self.project_list.itemClicked.connect(self.on_project_selected)
-        self.project_list.currentItemChanged.connect(lambda _new, _old: self.on_project_selected(self.project_list.currentItem()))
+        # 할 일·노트 검색 (Enter 로 실행)
+        self.search_edit = QLineEdit()
+        self.search_edit.setPlaceholderText("🔍 할 일·노트 검색 (Ctrl+F)")
+        self.search_edit.setClearButtonEnabled(True)
+        self.search_edit.returnPressed.connect(self.run_search)
+        layout.addWidget(self.search_edit)
+        
+        # 프로젝트 목록 (모델/뷰 – 행 내용은 delegate 가 그림)
+        self.project_model = ProjectListModel(self)
+        self.project_list = QListView()
+        self.project_list.setModel(self.project_model)
+        self.project_list.setItemDelegate(ProjectItemDelegate(self.project_list))
+        self.project_list.setResizeMode(QListView.Adjust)  # 너비가 바뀌면 제목 줄바꿈 높이 재계산
+        self.project_list.clicked.connect(self.on_project_selected)
+        self.project_list.selectionModel().currentChanged.connect(lambda current, _previous: self.on_project_selected(current))
         self.project_list.setMinimumWidth(250)  # 최소 너비 설정
-        self.project_list.setWordWrap(True)  # 긴 텍스트 자동 줄바꿈
         layout.addWidget(self.project_list)
         
         return panel
@@ -143,7 +186,7 @@ class MainWindow(QMainWindow):
         layout.addWidget(self.project_info_widget)
         
         # 프로젝트 상세 위젯
-        self.project_widget = ProjectWidget(self.db)
+        self.project_widget = ProjectWidget(self.db, self.db_executor)
         self.project_widget.project_updated.connect(self.on_project_updated)
         layout.addWidget(self.project_widget)
         
@@ -223,6 +266,11 @@ class MainWindow(QMainWindow):
         backup_action.triggered.connect(self.show_backup_dialog)
         file_menu.addAction(backup_action)
         
+        # 통계 점검/재구성
+        check_stats_action = QAction("통계 점검/재구성(&C)", self)
+        check_stats_action.triggered.connect(self.check_project_stats)
+        file_menu.addAction(check_stats_action)
+        
         # 보기 메뉴
         view_menu = menubar.addMenu("보기(&V)")
         
@@ -260,6 +308,15 @@ class MainWindow(QMainWindow):
         animation_menu.addAction(animation_enabled_action)
         
         self.animation_enabled_action = animation_enabled_action
+        
+        # 저전력 모드 (흐르는 진척도 바를 낮은 프레임으로)
+        reduced_frame_action = QAction("저전력 모드(&R)", self)
+        reduced_frame_action.setCheckable(True)
+        reduced_frame_action.setChecked(theme_manager.get_reduced_frame_rate())
+        reduced_frame_action.triggered.connect(self.toggle_reduced_frame_rate)
+        animation_menu.addAction(reduced_frame_action)
+        
+        self.reduced_frame_action = reduced_frame_action
             
         # 추가 키보드 단축키 설정
         self.setup_shortcuts()
@@ -273,6 +330,10 @@ class MainWindow(QMainWindow):
         # Del: 현재 선택된 항목 삭제
         delete_shortcut = QShortcut(QKeySequence("Delete"), self)
         delete_shortcut.activated.connect(self.delete_current_item)
+        
+        # Ctrl+F: 검색창으로 이동
+        search_shortcut = QShortcut(QKeySequence("Ctrl+F"), self)
+        search_shortcut.activated.connect(self.focus_search)
     
     def edit_current_item(self):
         """현재 선택된 항목 편집"""
@@ -284,11 +345,56 @@ class MainWindow(QMainWindow):
         if self.current_project and hasattr(self.project_widget, 'delete_selected_task'):
             self.project_widget.delete_selected_task()
     
+    def focus_search(self):
+        """검색창에 포커스"""
+        self.search_edit.setFocus()
+        self.search_edit.selectAll()
+
+    def run_search(self):
+        """검색어로 모든 프로젝트의 할 일·노트 검색 (백그라운드 조회)"""
+        query = self.search_edit.text().strip()
+        if not query:
+            return
+        
+        self._search_generation += 1
+        generation = self._search_generation
+        self.db_executor.submit(
+            self.db.search, query, self.SEARCH_RESULT_LIMIT,
+            callback=lambda hits: self._show_search_results(generation, query, hits)
+        )
+
+    def _show_search_results(self, generation: int, query: str, hits: list[SearchHit]):
+        """검색 결과를 검색창 아래 메뉴로 표시"""
+        # 그 사이 새 검색을 했다면 이전 결과는 무시
+        if generation != self._search_generation:
+            return
+        if not hits:
+            self.statusBar().showMessage(f"'{query}' 검색 결과가 없습니다.", 3000)
+            return
+        
+        menu = QMenu(self)
+        for hit in hits:
+            if hit.kind == 'task':
+                text = f"📋 {truncate_text(hit.title, 40)}  —  {hit.project_title}"
+            else:
+                text = f"📝 {truncate_text(hit.snippet, 40)}  —  {hit.project_title}"
+            action = menu.addAction(text)
+            action.setToolTip(hit.snippet)
+            action.triggered.connect(lambda _checked=False, h=hit: self.open_search_hit(h))
+        menu.setToolTipsVisible(True)
+        menu.exec(self.search_edit.mapToGlobal(QPoint(0, self.search_edit.height())))
+
+    def open_search_hit(self, hit: SearchHit):
+        """검색 결과의 프로젝트를 선택하고 해당 할 일/노트 탭으로 이동"""
+        # 할 일 목록이 다시 표시될 때 선택되도록 먼저 예약한 뒤 프로젝트 전환
+        self.project_widget.show_search_hit(hit)
+        self.select_project_by_id(hit.project_id)
+
     def refresh_data(self):
         """데이터 새로고침"""
-        self.load_projects()
+        refresh_bus.mark_dirty(RefreshBus.SIDEBAR)
         if self.current_project:
-            self.update_project_info()
+            refresh_bus.mark_dirty(RefreshBus.PROJECT_INFO)
             if hasattr(self.project_widget, 'refresh'):
                 self.project_widget.refresh()
         
@@ -297,8 +403,93 @@ class MainWindow(QMainWindow):
     
     def show_backup_dialog(self):
         """백업/복원 다이얼로그 표시"""
-        dialog = BackupDialog(self.backup_manager, self)
+        # 백업은 온라인 백업 API로 만들고 복원은 DB 작업 스레드에서 파일을 교체하므로
+        # 연결을 닫지 않아도 된다. 자동 백업과는 같은 작업 대기열에서 차례로 실행된다.
+        dialog = BackupDialog(self.backup_manager, self.backup_jobs, self,
+                              replace_database=self._replace_database,
+                              db=self.db, db_executor=self.db_executor,
+                              on_data_changed=self._on_database_replaced)
         dialog.exec()
+        # 창에서 넣은 작업은 계속 실행됨 (창을 닫은 뒤의 결과는 상태바에 표시)
+        dialog.deleteLater()
+    
+    def _replace_database(self, source_path: str):
+        """복원: DB 작업 스레드에서 파일을 교체하고 화면을 한 번 갱신 (백업 작업 스레드에서 호출)
+        
+        DB 작업은 한 스레드에서 제출 순서대로 실행되므로, 교체 작업은 앞서 제출된 작업이
+        모두 끝난 뒤 실행되고 교체 중에는 다른 작업이 실행되지 않는다.
+        """
+        future = self.db_executor.submit(
+            self.db.replace_database_file, source_path,
+            callback=lambda _: self._on_database_replaced()
+        )
+        if future is None:
+            raise RuntimeError("데이터베이스 작업이 종료되어 복원할 수 없습니다.")
+        future.result()  # 교체 중 오류는 복원 실패로 전달
+    
+    def _on_database_replaced(self):
+        """복원된 DB 기준으로 모든 화면 갱신 (갱신 버스로 모아 한 번씩, 프로젝트 단위 복원 포함)"""
+        refresh_bus.mark_dirty(RefreshBus.SIDEBAR, RefreshBus.PROJECT_INFO, RefreshBus.TASKS)
+        if self.current_project:
+            self.project_widget.load_notes()
+        self.statusBar().showMessage("복원된 데이터를 불러왔습니다.", 3000)
+    
+    def start_backup_verification(self):
+        """오래 검사하지 않은 백업의 전체 무결성 검사를 백업 작업 대기열에 추가 (대기·실행 중이면 무시)"""
+        if self._backup_verify_job is not None:
+            return
+        self._backup_verify_job = self.backup_jobs.verify_stale_backups(
+            callback=self._on_backup_verification_finished
+        )
+    
+    def _on_backup_verification_finished(self, job):
+        """백그라운드 백업 검사 완료 – 손상된 백업이 있으면 상태바에 알림"""
+        self._backup_verify_job = None
+        if job.state == job.FAILED:
+            self.statusBar().showMessage(job.message, 10000)
+    
+    def start_backup_pruning(self):
+        """보존 정책에 따른 오래된 자동 백업 정리를 백업 작업 대기열에 추가 (대기·실행 중이면 무시)"""
+        if self._backup_prune_job is not None:
+            return
+        self._backup_prune_job = self.backup_jobs.prune_backups(callback=self._on_backup_pruning_finished)
+    
+    def _on_backup_pruning_finished(self, job):
+        """보존 정책 정리 완료 – 실패했을 때만 상태바에 알림"""
+        self._backup_prune_job = None
+        if job.state == job.FAILED:
+            self.statusBar().showMessage(job.message, 10000)
+    
+    def _on_backup_job_finished(self, job):
+        """사용자가 넣은 백업 작업 완료 – 결과 첫 줄을 상태바에 표시 (백업 창을 닫은 뒤 끝난 작업 포함)"""
+        if job.background or job.kind in ('diff', 'open'):
+            return
+        self.statusBar().showMessage(job.message.split("\n", 1)[0], 5000)
+    
+    def _on_auto_backup_finished(self, success: bool, message: str):
+        """자동 백업 완료 – 결과를 상태바에 잠시 표시"""
+        if success:
+            self.statusBar().showMessage("자동 백업을 만들었습니다.", 3000)
+        else:
+            self.statusBar().showMessage(message.replace("\n", " "), 10000)
+    
+    def check_project_stats(self):
+        """프로젝트 통계 일관성 검사 후 필요 시 재구성"""
+        def _on_checked(mismatched):
+            if not mismatched:
+                QMessageBox.information(self, "통계 점검", "모든 프로젝트 통계가 정상입니다.")
+                return
+            
+            reply = QMessageBox.question(
+                self, "통계 점검",
+                f"{len(mismatched)}개 프로젝트의 통계가 실제 할 일과 다릅니다.\n통계를 재구성하시겠습니까?",
+                QMessageBox.Yes | QMessageBox.No,
+                QMessageBox.Yes
+            )
+            if reply == QMessageBox.Yes:
+                self.db_executor.submit(self.db.rebuild_project_stats, callback=lambda _: self.refresh_data())
+        
+        self.db_executor.submit(self.db.check_project_stats, callback=_on_checked)
     
     def setup_theme(self):
         """테마 설정"""
@@ -307,6 +498,7 @@ class MainWindow(QMainWindow):
         
         # 애니메이션 설정 적용
         animation_manager.set_animation_enabled(theme_manager.get_animation_enabled())
+        frame_clock.set_reduced(theme_manager.get_reduced_frame_rate())
         
         # 초기 테마 적용
         self.apply_theme(theme_manager.get_current_theme())
@@ -321,6 +513,12 @@ class MainWindow(QMainWindow):
         theme_manager.set_animation_enabled(not current_state)
         self.animation_enabled_action.setChecked(not current_state)
     
+    def toggle_reduced_frame_rate(self):
+        """저전력 애니메이션 모드 토글"""
+        reduced = not theme_manager.get_reduced_frame_rate()
+        theme_manager.set_reduced_frame_rate(reduced)
+        self.reduced_frame_action.setChecked(reduced)
+    
     def on_theme_changed(self, theme_name: str):
         """테마 변경 이벤트 처리"""
         # 메뉴 체크 상태 업데이트
@@ -341,49 +539,52 @@ class MainWindow(QMainWindow):
         if hasattr(self, 'project_widget'):
             self.project_widget.apply_theme(theme_name)
 
-    def load_projects(self):
-        """프로젝트 목록 로드"""
-        self.project_list.clear()
-        projects = self.db.get_all_projects()
+    def load_projects(self, select_project_id: int | None = None):
+        """프로젝트 목록 로드 (백그라운드 조회 후 결과가 도착하면 표시)
+
+        Args:
+            select_project_id: 목록 표시 후 선택할 프로젝트 id
+        """
+        self._projects_generation += 1
+        generation = self._projects_generation
+        # 프로젝트별 할 일 집계를 한 번의 쿼리로 조회 (N+1 방지)
+        self.db_executor.submit(
+            self.db.get_projects_with_stats,
+            callback=lambda rows: self._render_projects(generation, rows, select_project_id)
+        )
+
+    def _render_projects(self, generation: int, projects_with_stats: list, select_project_id: int | None):
+        """조회된 프로젝트 목록 표시"""
+        # 더 최근 요청이 있으면 무시
+        if generation != self._projects_generation:
+            return
         
-        for project in projects:
-            # 진척도 계산
-            tasks = self.db.get_tasks_by_project(project.id)
-            progress = ProgressCalculator.calculate_progress(tasks)
-            stats = ProgressCalculator.get_completion_stats(tasks)
-            
-            # 프로젝트 상태 계산
-            project_status_info = status_manager.get_project_status_summary(project, tasks)
-            status_icon = project_status_info['icon']
-            
-            # 전체 제목 표시
-            item_text = f"{status_icon} {project.title}\n📊 {progress:.0f}% ({stats['completed']}/{stats['total']})"
-            
-            # 완료(100%) 시 축하 메시지 추가
-            if progress >= 100:  # 100% 달성
-                random_icon = random.choice(self.CELEBRATION_ICONS)
-                random_msg = random.choice(self.CELEBRATION_MESSAGES)
-                item_text += f" {random_icon} {random_msg}"
-            
-            # 상태별 추가 정보
-            if project_status_info['urgent_tasks'] > 0:
-                item_text += f" | 🚨 급함: {project_status_info['urgent_tasks']}"
-            if project_status_info['overdue_tasks'] > 0:
-                item_text += f" | ⚠️ 초과: {project_status_info['overdue_tasks']}"
-            
-            item = QListWidgetItem(item_text)
-            item.setData(Qt.UserRole, project)
-            
-            # 설명을 툴팁으로 제공
-            item.setToolTip(project.description or "")
-            
-            # 상태에 따른 색상 적용
-            if project_status_info['status'] != 'normal':
-                item.setForeground(QColor(project_status_info['color']))
-            
-            self.project_list.addItem(item)
+        # 프로젝트 id로 이전 목록과 비교해 바뀐 행만 갱신 (선택 변경 시그널로 프로젝트가
+        # 다시 로드되지 않도록 차단)
+        selection_model = self.project_list.selectionModel()
+        selection_model.blockSignals(True)
+        self.project_model.set_projects(projects_with_stats)
+        current_row = self.project_model.row_of(self.current_project.id) if self.current_project else -1
+        if current_row >= 0 and select_project_id is None:
+            # 현재 프로젝트 강조만 복원 (다시 선택 처리하지 않음)
+            self.project_list.setCurrentIndex(self.project_model.index(current_row))
+            project = self.project_model.project_at(current_row)
+            if (project.title, project.description) != (self.current_project.title, self.current_project.description):
+                # 제목/설명이 바뀐 경우 (복원 등) 새로 읽은 프로젝트로 교체
+                self.current_project = project
+                self.project_widget.current_project = project
+                refresh_bus.mark_dirty(RefreshBus.PROJECT_INFO)
+        selection_model.blockSignals(False)
 
-        # load_projects 종료
+        if select_project_id is not None:
+            self.select_project_by_id(select_project_id)
+        elif self.current_project and current_row < 0:
+            # 현재 프로젝트가 삭제됨 (복원으로 없어진 경우 포함)
+            self.current_project = None
+            self.project_list.clearSelection()
+            self.project_widget.current_project = None
+            self.project_widget.hide()
+            self.show_welcome_message()
 
     def create_new_project(self):
         """새 프로젝트 생성"""
@@ -408,17 +609,30 @@ class MainWindow(QMainWindow):
             
             # 프로젝트 생성
             project = Project(title=title.strip(), description=description.strip())
-            project_id = self.db.create_project(project)
-            project.id = project_id
             
-            # 목록 새로고침 및 선택
-            self.load_projects()
-            self.select_project_by_id(project_id)
+            def _on_created(project_id):
+                project.id = project_id
+                # 목록 새로고침 및 선택
+                self.load_projects(select_project_id=project_id)
+                QMessageBox.information(self, "성공", f"프로젝트 '{title}'가 생성되었습니다!")
             
-            QMessageBox.information(self, "성공", f"프로젝트 '{title}'가 생성되었습니다!")
+            self.db_executor.submit(
+                self.db.create_project, project, callback=_on_created,
+                error_callback=lambda e: QMessageBox.critical(self, "오류", f"프로젝트 생성 중 오류가 발생했습니다: {str(e)}")
+            )
 
-    def on_project_selected(self, item: QListWidgetItem):
+    def on_project_selected(self, index: QModelIndex):
         """프로젝트 선택 이벤트"""
+        project = self.project_model.project_at(index.row()) if index.isValid() else None
+        if not project:
+            return
+        
+        # 표시 중인 프로젝트를 다시 선택한 경우 (클릭 시 currentChanged 와 clicked 가
+        # 함께 발생) 전환 처리 없이 할 일 목록 갱신만 요청 – 검색 결과 이동 시 대상 행 선택
+        if self.current_project and self.current_project.id == project.id:
+            refresh_bus.mark_dirty(RefreshBus.TASKS)
+            return
+        
         # 다른 프로젝트로 전환 시 모든 애니메이션·축하 효과 중지
         animation_manager.stop_all_animations()
         if hasattr(self, 'celebration_manager'):
@@ -427,20 +641,32 @@ class MainWindow(QMainWindow):
         # 기존 도장·타이머 정리 (프로젝트 변경 시 반드시 숨김 처리)
         self.hide_completion_stamp()
 
-        project = item.data(Qt.UserRole)
-        if project:
-            self.current_project = project
-            self.update_project_info()
-            self.project_widget.set_project(project)
+        self.current_project = project
+        self.update_project_info()
+        self.project_widget.set_project(project)
 
     def update_project_info(self):
         """프로젝트 정보 업데이트"""
         if not self.current_project:
             return
         
-        # 최신 데이터 가져오기
-        tasks = self.db.get_tasks_by_project(self.current_project.id)
-        stats = ProgressCalculator.get_completion_stats(tasks)
+        # 최신 데이터 가져오기 (project_stats 한 행만 조회)
+        project_id = self.current_project.id
+        self.db_executor.submit(
+            self.db.get_project_stats, project_id,
+            callback=lambda project_stats: self._apply_project_info(project_id, project_stats)
+        )
+
+    def _apply_project_info(self, project_id: int, project_stats):
+        """조회된 프로젝트 통계로 정보 영역 갱신"""
+        # 그 사이 다른 프로젝트로 전환되었으면 무시
+        if not self.current_project or self.current_project.id != project_id:
+            return
+        
+        stats = ProgressCalculator.get_completion_stats(project_stats)
+        
+        # 사이드바도 같은 집계로 해당 행만 갱신 (목록 전체 재조회 없음)
+        self.project_model.update_stats(project_id, project_stats)
         
         # UI 업데이트
         self.project_title_label.setText(f"⭐ {self.current_project.title} ⭐")
@@ -586,26 +812,17 @@ class MainWindow(QMainWindow):
         self.completion_stamp.hide()
 
     def on_project_updated(self):
-        """프로젝트 업데이트 이벤트"""
-        if self.current_project:
-            current_project_id = self.current_project.id
-            # 프로젝트 목록 새로고침
-            self.load_projects()
-            # 현재 프로젝트 선택 상태 복원
-            self.select_project_by_id(current_project_id)
-        else:
-            # 선택된 프로젝트가 없는 경우 단순 새로고침
-            self.load_projects()
+        """프로젝트 업데이트 이벤트 (프로젝트 정보와 목록 갱신 요청)"""
+        # 목록을 다시 채운 뒤에는 현재 프로젝트 강조만 복원하고 다시 로드하지 않음
+        refresh_bus.mark_dirty(RefreshBus.PROJECT_INFO, RefreshBus.SIDEBAR)
 
     def select_project_by_id(self, project_id: int):
         """ID로 프로젝트 선택"""
-        for i in range(self.project_list.count()):
-            item = self.project_list.item(i)
-            project = item.data(Qt.UserRole)
-            if project and project.id == project_id:
-                self.project_list.setCurrentItem(item)
-                self.on_project_selected(item)
-                break
+        row = self.project_model.row_of(project_id)
+        if row >= 0:
+            index = self.project_model.index(row)
+            self.project_list.setCurrentIndex(index)
+            self.on_project_selected(index)
 
     def show_welcome_message(self):
         """환영 메시지 표시"""
@@ -622,10 +839,20 @@ class MainWindow(QMainWindow):
     def closeEvent(self, event):
         """윈도우 종료 이벤트"""
         try:
-            # 데이터베이스 연결 정리
+            # 자동 백업 판단과 주기 검사 중지
+            if hasattr(self, 'backup_verify_timer'):
+                self.backup_verify_timer.stop()
+            if hasattr(self, 'backup_scheduler'):
+                self.backup_scheduler.shutdown()
+            # 대기 중인 백업 작업은 버리고 실행 중인 작업은 취소 (복원의 파일 교체는 마칠 때까지 대기)
+            if hasattr(self, 'backup_jobs'):
+                self.backup_jobs.shutdown()
+            # 남은 DB 작업 완료 후 워커 스레드 종료
+            if hasattr(self, 'db_executor'):
+                self.db_executor.shutdown()
+            # 데이터베이스 연결 정리 (마지막 연결 종료 시 WAL 체크포인트)
             if hasattr(self, 'db'):
-                # Database 클래스에 cleanup 메서드가 있다면 호출
-                pass
+                self.db.close()
             event.accept()
         except Exception as e:
             print(f"종료 시 오류: {e}")
@@ -0,0 +1,170 @@
+"""
+프로젝트 목록(사이드바) delegate
+"""
+from PySide6.QtWidgets import QStyledItemDelegate, QStyleOptionViewItem, QStyle, QApplication
+from PySide6.QtCore import Qt, QRect, QRectF, QSize
+from PySide6.QtGui import QColor, QFont, QFontMetrics
+from utils.theme_manager import theme_manager
+from utils.status_manager import status_manager
+from ui.project_list_model import ProjectListModel, ProjectEntry
+
+
+class ProjectItemDelegate(QStyledItemDelegate):
+    """프로젝트 행 그리기 – 상태 아이콘·제목, 미니 진척도 바, 급함/초과 배지"""
+
+    PADDING = 8
+    LINE_SPACING = 4
+    BAR_WIDTH = 80
+    BAR_HEIGHT = 6
+    BADGE_SPACING = 4
+
+    # 진척도 구간별 막대 색상 (상한 미만, 색상) – 진척도 바와 같은 기준
+    PROGRESS_COLORS = [
+        (25, "#f44336"),   # 빨강
+        (50, "#ff9800"),   # 주황
+        (75, "#ffeb3b"),   # 노랑
+        (100, "#4caf50"),  # 초록
+    ]
+    COMPLETE_COLOR = "#ffc107"  # 100% 달성 (골드)
+
+    # 배지: (표시 문구, 배경색)
+    BADGES = {
+        'urgent': ("🚨 급함", "#ff6b6b"),
+        'overdue': ("⚠️ 초과", "#ff4757"),
+    }
+
+    # 테마별 색상: (글자, 선택된 행 글자, 보조 글자, 막대 배경)
+    THEME_COLORS = {
+        'dark': ("#ffffff", "#4CAF50", "#bbbbbb", "#555555"),
+        'light': ("#333333", "#1976d2", "#666666", "#e0e0e0"),
+    }
+
+    def __init__(self, view):
+        super().__init__(view)
+        self.view = view
+
+    def _fonts(self, option) -> tuple[QFont, QFont]:
+        """제목/보조 글꼴"""
+        title_font = QFont(option.font)
+        title_font.setBold(True)
+        sub_font = QFont(option.font)
+        if sub_font.pointSizeF() > 0:
+            sub_font.setPointSizeF(sub_font.pointSizeF() - 1)
+        return title_font, sub_font
+
+    @staticmethod
+    def _title_text(entry: ProjectEntry) -> str:
+        icon = status_manager.get_status_icon(entry.status)
+        return f"{icon} {entry.project.title}" if icon else entry.project.title
+
+    def _badges(self, entry: ProjectEntry) -> list[tuple[str, str]]:
+        """표시할 배지 목록 (문구, 배경색)"""
+        badges = []
+        for key, count in (('urgent', entry.urgent), ('overdue', entry.overdue)):
+            if count > 0:
+                text, color = self.BADGES[key]
+                badges.append((f"{text} {count}", color))
+        return badges
+
+    def _content_width(self) -> int:
+        # 리스트 뷰의 sizeHint 에는 행 너비가 전달되지 않으므로 뷰포트 너비 기준
+        return max(60, self.view.viewport().width() - 2 * self.PADDING)
+
+    def sizeHint(self, option, index):
+        entry = index.data(ProjectListModel.EntryRole)
+        if entry is None:
+            return super().sizeHint(option, index)
+        title_font, sub_font = self._fonts(option)
+        width = self._content_width()
+        # 긴 제목은 줄바꿈해서 모두 표시
+        title_height = QFontMetrics(title_font).boundingRect(
+            QRect(0, 0, width, 10000), Qt.TextWordWrap, self._title_text(entry)
+        ).height()
+        line_height = QFontMetrics(sub_font).height()
+        height = 2 * self.PADDING + title_height + self.LINE_SPACING + line_height
+        if self._badges(entry):
+            height += self.LINE_SPACING + line_height + 2
+        return QSize(width + 2 * self.PADDING, height)
+
+    def paint(self, painter, option, index):
+        entry = index.data(ProjectListModel.EntryRole)
+
+        # 선택/호버 배경은 기본 스타일로 (텍스트 없이)
+        opt = QStyleOptionViewItem(option)
+        self.initStyleOption(opt, index)
+        opt.text = ""
+        style = opt.widget.style() if opt.widget else QApplication.style()
+        style.drawControl(QStyle.CE_ItemViewItem, opt, painter, opt.widget)
+        if entry is None:
+            return
+
+        text_color, selected_color, sub_color, bar_background = self.THEME_COLORS.get(
+            theme_manager.get_current_theme(), self.THEME_COLORS['light']
+        )
+        if entry.status != 'normal':
+            title_color = status_manager.get_status_color(entry.status)
+        elif option.state & QStyle.State_Selected:
+            title_color = selected_color
+        else:
+            title_color = text_color
+        title_font, sub_font = self._fonts(option)
+        sub_metrics = QFontMetrics(sub_font)
+        line_height = sub_metrics.height()
+
+        painter.save()
+        painter.setRenderHint(painter.RenderHint.Antialiasing)
+        rect = option.rect.adjusted(self.PADDING, self.PADDING, -self.PADDING, -self.PADDING)
+
+        # 1행: 상태 아이콘 + 제목 (줄바꿈)
+        painter.setFont(title_font)
+        painter.setPen(QColor(title_color))
+        title_rect = painter.boundingRect(
+            QRect(rect.left(), rect.top(), rect.width(), 10000), Qt.TextWordWrap, self._title_text(entry)
+        )
+        painter.drawText(title_rect, Qt.TextWordWrap, self._title_text(entry))
+        y = title_rect.bottom() + 1 + self.LINE_SPACING
+
+        # 2행: 미니 진척도 바 + 퍼센트 (+ 100% 축하 문구)
+        progress = entry.progress
+        bar = QRectF(rect.left(), y + (line_height - self.BAR_HEIGHT) / 2, self.BAR_WIDTH, self.BAR_HEIGHT)
+        radius = self.BAR_HEIGHT / 2
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(QColor(bar_background))
+        painter.drawRoundedRect(bar, radius, radius)
+        if progress > 0:
+            filled = QRectF(bar)
+            filled.setWidth(max(self.BAR_HEIGHT, bar.width() * progress / 100.0))
+            painter.setBrush(QColor(self._progress_color(progress)))
+            painter.drawRoundedRect(filled, radius, radius)
+
+        painter.setFont(sub_font)
+        painter.setPen(QColor(sub_color))
+        text = f"{progress:.0f}% ({entry.completed}/{entry.total})"
+        if entry.celebration:
+            text += f" {entry.celebration}"
+        text_left = rect.left() + self.BAR_WIDTH + 6
+        text_rect = QRect(text_left, y, rect.right() - text_left + 1, line_height)
+        painter.drawText(text_rect, Qt.AlignLeft | Qt.AlignVCenter,
+                         sub_metrics.elidedText(text, Qt.ElideRight, text_rect.width()))
+
+        # 3행: 급함/초과 배지
+        x = rect.left()
+        y += line_height + self.LINE_SPACING
+        for badge_text, color in self._badges(entry):
+            badge = QRect(x, y, sub_metrics.horizontalAdvance(badge_text) + 10, line_height + 2)
+            painter.setPen(Qt.NoPen)
+            painter.setBrush(QColor(color))
+            painter.drawRoundedRect(QRectF(badge), badge.height() / 2, badge.height() / 2)
+            painter.setPen(QColor("#ffffff"))
+            painter.drawText(badge, Qt.AlignCenter, badge_text)
+            x = badge.right() + 1 + self.BADGE_SPACING
+        painter.restore()
+
+    def _progress_color(self, progress: float) -> str:
+        """진척도 구간 색상"""
+        if progress >= 100:
+            return self.COMPLETE_COLOR
+        for limit, color in self.PROGRESS_COLORS:
+            if progress < limit:
+                return color
+        return self.PROGRESS_COLORS[-1][1]
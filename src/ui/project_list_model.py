@@ -0,0 +1,135 @@
+"""
+프로젝트 목록(사이드바) 모델
+"""
+import random
+from dataclasses import dataclass
+from PySide6.QtCore import Qt, QAbstractListModel, QModelIndex
+from database.models import Project, ProjectStats
+from utils.status_manager import status_manager
+from ui.list_diff import apply_keyed_diff
+
+
+@dataclass
+class ProjectEntry:
+    """사이드바 한 행 – 프로젝트와 표시에 필요한 집계만 보관"""
+    project: Project
+    total: int = 0
+    completed: int = 0
+    urgent: int = 0
+    overdue: int = 0
+    status: str = 'normal'   # status_manager 상태 키
+    celebration: str = ""    # 100% 달성 문구 (없으면 빈 문자열)
+
+    @property
+    def progress(self) -> float:
+        """진척도 퍼센트 (0.0 ~ 100.0)"""
+        if not self.total:
+            return 0.0
+        return (self.completed / self.total) * 100.0
+
+
+class ProjectListModel(QAbstractListModel):
+    """프로젝트 목록 모델 (QListView 용)
+
+    행 내용은 ProjectItemDelegate 가 그린다. 목록 새로고침은 프로젝트 id로
+    이전 목록과 비교해 바뀐 행만 알리고, 프로젝트 하나의 집계가 바뀌면
+    update_stats 로 그 행만 갱신한다.
+    """
+
+    EntryRole = Qt.UserRole + 1  # ProjectEntry
+
+    # 100% 달성 축하 아이콘/문구 (프로젝트마다 한 번 골라 유지)
+    CELEBRATION_ICONS = ["| 🤩", "| 🥳", "| 🎉", "| 👍"]
+    CELEBRATION_MESSAGES = [
+        "완벽 실행‼",
+        "성공적 마무리‼",
+        "100% 달성‼",
+        "최고의 결과‼"
+    ]
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._entries: list[ProjectEntry] = []
+        self._celebrations: dict[int, str] = {}  # 프로젝트 id → 선택된 축하 문구
+
+    # ------------------------------------------------------------------
+    # 데이터 설정
+    # ------------------------------------------------------------------
+    def _make_entry(self, project: Project, stats: ProjectStats) -> ProjectEntry:
+        """프로젝트와 집계로 행 데이터 생성"""
+        status = status_manager.get_project_status_by_counts(
+            stats.total, stats.completed, stats.urgent, stats.overdue
+        )
+        celebration = ""
+        if stats.total and stats.completed >= stats.total:
+            celebration = self._celebrations.get(project.id)
+            if celebration is None:
+                celebration = f"{random.choice(self.CELEBRATION_ICONS)} {random.choice(self.CELEBRATION_MESSAGES)}"
+                self._celebrations[project.id] = celebration
+        else:
+            self._celebrations.pop(project.id, None)
+        return ProjectEntry(
+            project=project, total=stats.total, completed=stats.completed,
+            urgent=stats.urgent, overdue=stats.overdue,
+            status=status, celebration=celebration
+        )
+
+    def set_projects(self, projects_with_stats: list[tuple[Project, ProjectStats]]):
+        """목록 교체 (추가/삭제/순서 변경/내용 변경된 행만 알림)"""
+        entries = [self._make_entry(project, stats) for project, stats in projects_with_stats]
+        if not self._entries or not entries or not apply_keyed_diff(
+                self, self._entries, entries, key=lambda entry: entry.project.id,
+                on_removed=lambda entry: self._celebrations.pop(entry.project.id, None),
+                on_changed=self.refresh_row):
+            self.beginResetModel()
+            self._entries = entries
+            self.endResetModel()
+
+    def update_stats(self, project_id: int, stats: ProjectStats):
+        """프로젝트 하나의 집계만 갱신 (해당 행만 다시 그림)"""
+        row = self.row_of(project_id)
+        if row < 0:
+            return
+        entry = self._make_entry(self._entries[row].project, stats)
+        if entry != self._entries[row]:
+            self._entries[row] = entry
+            self.refresh_row(row)
+
+    def refresh_row(self, row: int):
+        """행을 다시 그리도록 알림"""
+        index = self.index(row)
+        self.dataChanged.emit(index, index)
+
+    def project_at(self, row: int) -> Project | None:
+        """행의 프로젝트 반환"""
+        if 0 <= row < len(self._entries):
+            return self._entries[row].project
+        return None
+
+    def row_of(self, project_id: int) -> int:
+        """프로젝트 id의 행 번호 (없으면 -1)"""
+        for row, entry in enumerate(self._entries):
+            if entry.project.id == project_id:
+                return row
+        return -1
+
+    # ------------------------------------------------------------------
+    # QAbstractListModel 구현
+    # ------------------------------------------------------------------
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._entries)
+
+    def data(self, index: QModelIndex, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        entry = self._entries[index.row()]
+        if role == Qt.DisplayRole:
+            return entry.project.title
+        if role == Qt.ToolTipRole:
+            # 설명을 툴팁으로 제공
+            return entry.project.description or ""
+        if role == Qt.UserRole:
+            return entry.project
+        if role == self.EntryRole:
+            return entry
+        return None
@@ -10,7 +10,8 @@ from PySide6.QtWidgets import (
 from PySide6.QtCore import Qt, Signal
 from PySide6.QtGui import QFont
 from database.database import Database
-from database.models import Project, Task, Note
+from database.executor import DatabaseExecutor
+from database.models import Project, Task, Note, SearchHit
 from utils.helpers import format_datetime, validate_task_title, validate_project_title
 from ui.task_widget import TaskWidget
 from datetime import datetime
@@ -21,10 +22,12 @@ class ProjectWidget(QWidget):
     
     project_updated = Signal()
     
-    def __init__(self, db: Database):
+    def __init__(self, db: Database, executor: DatabaseExecutor):
         super().__init__()
         self.db = db
+        self.executor = executor  # DB 작업은 백그라운드 워커에서 실행
         self.current_project = None
+        self._notes_generation = 0  # 마지막 load_notes 요청 번호
         self.last_saved_note_content = ""  # 마지막으로 저장된 노트 내용
         self.last_note_time = None  # 마지막 노트 저장 시간
         self.init_ui()
@@ -51,8 +54,7 @@ class ProjectWidget(QWidget):
         self.tab_widget = QTabWidget()
         
         # 할 일 탭
-        self.task_widget = TaskWidget(self.db)
-        self.task_widget.task_updated.connect(self.on_task_updated)
+        self.task_widget = TaskWidget(self.db, self.executor)
         self.tab_widget.addTab(self.task_widget, "📋 할 일")
         
         # 노트 탭
@@ -164,6 +166,14 @@ class ProjectWidget(QWidget):
         self.show()
         self.load_project_data()
 
+    def show_search_hit(self, hit: SearchHit):
+        """검색 결과에 맞는 탭으로 전환 (할 일은 목록 표시 후 해당 행 선택)"""
+        if hit.kind == 'task':
+            self.task_widget.focus_task(hit.item_id)
+            self.tab_widget.setCurrentWidget(self.task_widget)
+        else:
+            self.tab_widget.setCurrentWidget(self.note_widget)
+
     def has_unsaved_notes(self) -> bool:
         """저장되지 않은 노트가 있는지 확인"""
         current_content = self.note_text.toPlainText().strip()
@@ -181,11 +191,22 @@ class ProjectWidget(QWidget):
         self.load_notes()
 
     def load_notes(self):
-        """노트 로드"""
+        """노트 로드 (백그라운드 조회 후 결과가 도착하면 표시)"""
         if not self.current_project:
             return
         
-        notes = self.db.get_notes_by_project(self.current_project.id)
+        self._notes_generation += 1
+        generation = self._notes_generation
+        self.executor.submit(
+            self.db.get_notes_by_project, self.current_project.id,
+            callback=lambda notes: self._render_notes(generation, notes)
+        )
+
+    def _render_notes(self, generation: int, notes: list[Note]):
+        """조회된 노트 표시"""
+        # 그 사이 다른 프로젝트로 전환되었다면 무시
+        if generation != self._notes_generation:
+            return
         
         self.note_text.setPlainText("")
         for note in notes:
@@ -217,11 +238,16 @@ class ProjectWidget(QWidget):
                 project_id=self.current_project.id,
                 content=content
             )
-            self.db.create_note(note)
             
-            # 노트 다시 로드
-            self.load_notes()
-            QMessageBox.information(self, "성공", "노트가 추가되었습니다!")
+            # 저장 완료 후 노트 다시 로드
+            def _on_done(_note_id):
+                self.load_notes()
+                QMessageBox.information(self, "성공", "노트가 추가되었습니다!")
+            
+            self.executor.submit(
+                self.db.create_note, note, callback=_on_done,
+                error_callback=lambda e: QMessageBox.critical(self, "오류", f"노트 추가 중 오류가 발생했습니다: {str(e)}")
+            )
 
     def save_note(self):
         """일반 저장 (타임스탬프 없음)"""
@@ -232,42 +258,39 @@ class ProjectWidget(QWidget):
         current_content = self.note_text.toPlainText().strip()
         if not current_content:
             # 내용이 비어있는 경우, 기존 노트들을 모두 삭제
-            try:
-                notes = self.db.get_notes_by_project(self.current_project.id)
-                for note in notes:
-                    self.db.delete_note(note.id)
-                self.last_saved_note_content = ""
-                QMessageBox.information(self, "성공", "모든 노트가 삭제되었습니다.")
-                self.load_notes()
-                return
-            except Exception as e:
-                QMessageBox.critical(self, "오류", f"노트 삭제 중 오류가 발생했습니다: {str(e)}")
-                return
-            
-        # 마지막 저장 내용과 동일하면 저장하지 않음
-        if current_content == self.last_saved_note_content:
+            success_message = "모든 노트가 삭제되었습니다."
+            error_message = "노트 삭제 중 오류가 발생했습니다"
+        elif current_content == self.last_saved_note_content:
+            # 마지막 저장 내용과 동일하면 저장하지 않음
             QMessageBox.information(self, "알림", "변경된 내용이 없습니다.")
             return
+        else:
+            # 기존 노트들을 모두 삭제하고 현재 내용을 새로운 노트로 저장
+            success_message = "노트가 저장되었습니다."
+            error_message = "노트 저장 중 오류가 발생했습니다"
         
-        try:
-            # 기존 노트들을 모두 삭제
-            notes = self.db.get_notes_by_project(self.current_project.id)
-            for note in notes:
-                self.db.delete_note(note.id)
-            
-            # 현재 내용을 새로운 노트로 저장
-            note = Note(
-                project_id=self.current_project.id,
-                content=current_content,
-                created_date=datetime.now()
-            )
-            self.db.create_note(note)
-            
-            self.last_saved_note_content = current_content
-            QMessageBox.information(self, "성공", "노트가 저장되었습니다.")
+        # 저장 요청 시점의 내용을 기준으로 변경 여부를 판단 (프로젝트 전환 직후에도 유지)
+        project_id = self.current_project.id
+        previous_content = self.last_saved_note_content
+        self.last_saved_note_content = current_content
+        
+        def _on_done(_note_id):
+            QMessageBox.information(self, "성공", success_message)
             self.load_notes()
-        except Exception as e:
-            QMessageBox.critical(self, "오류", f"노트 저장 중 오류가 발생했습니다: {str(e)}")
+        
+        def _on_error(e):
+            # 저장에 실패하면 이전 기준으로 되돌려 같은 내용으로 다시 저장할 수 있게 함
+            # (그 사이 다른 프로젝트로 바뀌었거나 다시 저장했으면 그대로 둠)
+            if (self.current_project is not None and self.current_project.id == project_id
+                    and self.last_saved_note_content == current_content):
+                self.last_saved_note_content = previous_content
+            QMessageBox.critical(self, "오류", f"{error_message}: {str(e)}")
+        
+        self.executor.submit(
+            self.db.replace_notes, project_id, current_content,
+            callback=_on_done,
+            error_callback=_on_error
+        )
 
     def extract_new_content(self, current_content: str) -> str:
         """현재 내용에서 새로운 내용만 추출"""
@@ -302,11 +325,16 @@ class ProjectWidget(QWidget):
             # 프로젝트 업데이트
             self.current_project.title = title.strip()
             self.current_project.description = description.strip() if description else ""
-            self.db.update_project(self.current_project)
             
-            # 업데이트 시그널 발생
-            self.project_updated.emit()
-            QMessageBox.information(self, "성공", "프로젝트가 수정되었습니다!")
+            # 저장 완료 후 업데이트 시그널 발생
+            def _on_done(_result):
+                self.project_updated.emit()
+                QMessageBox.information(self, "성공", "프로젝트가 수정되었습니다!")
+            
+            self.executor.submit(
+                self.db.update_project, self.current_project, callback=_on_done,
+                error_callback=lambda e: QMessageBox.critical(self, "오류", f"프로젝트 수정 중 오류가 발생했습니다: {str(e)}")
+            )
 
     def delete_project(self):
         """프로젝트 삭제"""
@@ -322,20 +350,22 @@ class ProjectWidget(QWidget):
         )
         
         if reply == QMessageBox.Yes:
-            self.db.delete_project(self.current_project.id)
+            project_id = self.current_project.id
             self.current_project = None
             
             # 화면 숨김
             self.hide()
             
-            # 업데이트 시그널 발생
-            self.project_updated.emit()
-            QMessageBox.information(self, "성공", "프로젝트가 삭제되었습니다!")
+            # 삭제 완료 후 업데이트 시그널 발생
+            def _on_done(_result):
+                self.project_updated.emit()
+                QMessageBox.information(self, "성공", "프로젝트가 삭제되었습니다!")
+            
+            self.executor.submit(
+                self.db.delete_project, project_id, callback=_on_done,
+                error_callback=lambda e: QMessageBox.critical(self, "오류", f"프로젝트 삭제 중 오류가 발생했습니다: {str(e)}")
+            )
 
-    def on_task_updated(self):
-        """할 일 업데이트 시그널 전달"""
-        self.project_updated.emit()
-    
     def edit_selected_task(self):
         """선택된 할 일 편집 (키보드 단축키용)"""
         if hasattr(self.task_widget, 'edit_selected_task'):
@@ -0,0 +1,220 @@
+"""
+할 일 테이블 delegate (체크박스, 액션 버튼)
+"""
+from PySide6.QtWidgets import (
+    QStyledItemDelegate, QStyleOptionViewItem, QStyleOptionButton,
+    QStyle, QApplication, QToolTip
+)
+from PySide6.QtCore import (
+    Qt, Signal, QEvent, QRect, QRectF, QPointF, QPersistentModelIndex,
+    QVariantAnimation, QAbstractAnimation, QEasingCurve
+)
+from PySide6.QtGui import QColor, QPen, QFont
+from utils.theme_manager import theme_manager
+from utils.animation_manager import animation_manager
+
+
+def _paint_item_background(delegate: QStyledItemDelegate, painter, option, index):
+    """선택/호버 배경만 기본 스타일로 그림 (텍스트 없음)"""
+    opt = QStyleOptionViewItem(option)
+    delegate.initStyleOption(opt, index)
+    opt.text = ""
+    style = opt.widget.style() if opt.widget else QApplication.style()
+    style.drawControl(QStyle.CE_ItemViewItem, opt, painter, opt.widget)
+    return style, opt.widget
+
+
+class CheckBoxDelegate(QStyledItemDelegate):
+    """완료 체크박스를 그리는 delegate (행마다 QCheckBox 위젯을 만들지 않음)"""
+
+    toggled = Signal(object)  # 클릭된 행의 Task
+
+    def __init__(self, view):
+        super().__init__(view)
+        self.view = view
+        self._pulses: dict[int, QVariantAnimation] = {}  # 할 일 id → 체크 애니메이션
+
+    def paint(self, painter, option, index):
+        style, widget = _paint_item_background(self, painter, option, index)
+        task = index.data(Qt.UserRole)
+        if task is None:
+            return
+
+        indicator = QStyleOptionButton()
+        width = style.pixelMetric(QStyle.PM_IndicatorWidth, None, widget)
+        height = style.pixelMetric(QStyle.PM_IndicatorHeight, None, widget)
+        rect = QRect(0, 0, width, height)
+        rect.moveCenter(option.rect.center())
+        indicator.rect = rect
+        indicator.state = QStyle.State_Enabled | (QStyle.State_On if task.completed else QStyle.State_Off)
+
+        painter.save()
+        pulse = self._pulses.get(task.id)
+        if pulse is not None:
+            # 체크 순간 살짝 커졌다가 돌아오는 효과
+            scale = 1.0 + 0.25 * pulse.currentValue()
+            center = QPointF(indicator.rect.center())
+            painter.translate(center)
+            painter.scale(scale, scale)
+            painter.translate(-center)
+        style.drawPrimitive(QStyle.PE_IndicatorCheckBox, indicator, painter, widget)
+        painter.restore()
+
+    def editorEvent(self, event, model, option, index):
+        """셀 클릭 또는 스페이스 키로 토글"""
+        if event.type() == QEvent.MouseButtonPress and event.button() == Qt.LeftButton:
+            return True  # 클릭이 행 선택/드래그로 넘어가지 않도록 소비
+        if event.type() == QEvent.MouseButtonRelease and event.button() == Qt.LeftButton:
+            if option.rect.contains(event.position().toPoint()):
+                self.toggled.emit(index.data(Qt.UserRole))
+            return True
+        if event.type() == QEvent.KeyPress and event.key() == Qt.Key_Space:
+            self.toggled.emit(index.data(Qt.UserRole))
+            return True
+        return False
+
+    def pulse(self, index):
+        """체크 애니메이션 시작"""
+        if not animation_manager.is_animation_enabled():
+            return
+        task = index.data(Qt.UserRole)
+        if task is None:
+            return
+
+        persistent = QPersistentModelIndex(index)
+        animation = QVariantAnimation(self)
+        animation.setDuration(200)
+        animation.setStartValue(0.0)
+        animation.setKeyValueAt(0.5, 1.0)
+        animation.setEndValue(0.0)
+        animation.setEasingCurve(QEasingCurve.OutCubic)
+        animation.valueChanged.connect(lambda _value: persistent.isValid() and self.view.update(persistent))
+
+        def _on_state_changed(new_state, _old_state):
+            # 정상 종료뿐 아니라 stop_all_animations() 로 중지된 경우도 정리
+            if new_state != QAbstractAnimation.Stopped:
+                return
+            if self._pulses.get(task.id) is animation:
+                del self._pulses[task.id]
+            animation_manager.animation_finished(animation)
+            if persistent.isValid():
+                self.view.update(persistent)
+            animation.deleteLater()
+
+        animation.stateChanged.connect(_on_state_changed)
+        self._pulses[task.id] = animation
+        animation_manager.active_animations.append(animation)
+        animation.start()
+
+
+class ActionButtonsDelegate(QStyledItemDelegate):
+    """날짜/편집/삭제 버튼을 그리고 클릭을 전달하는 delegate"""
+
+    action_triggered = Signal(str, object)  # (액션 이름, Task)
+
+    # (액션 이름, 표시 문구, 툴팁)
+    ACTIONS = [
+        ('due_date', "📅 날짜", "마감일 설정/수정"),
+        ('edit', "✏️ 편집", "할 일 편집"),
+        ('delete', "🗑️ 삭제", "할 일 삭제"),
+    ]
+
+    BUTTON_HEIGHT = 18
+    MARGIN = 5
+    SPACING = 3
+
+    # 테마별 버튼 색상: (배경, 테두리, 글자) – 기본 / 호버 / 삭제 호버
+    BUTTON_COLORS = {
+        'dark': {
+            'normal': ("#4a4a4a", "#666666", "#ffffff"),
+            'hover': ("#5a5a5a", "#777777", "#ffffff"),
+            'delete_hover': ("#664444", "#777777", "#ffffff"),
+        },
+        'light': {
+            'normal': ("#ffffff", "#d0d0d0", "#333333"),
+            'hover': ("#f0f8ff", "#0078d4", "#0078d4"),
+            'delete_hover': ("#fff5f5", "#dc3545", "#dc3545"),
+        },
+    }
+
+    def __init__(self, view):
+        super().__init__(view)
+        self.view = view
+        self._hover = None  # (행, 액션 이름) – 마우스가 올라간 버튼
+        self._font = QFont("맑은 고딕")
+        self._font.setPixelSize(12)
+
+    def _button_rects(self, cell: QRect) -> list[tuple[str, QRect]]:
+        """셀 안의 버튼 영역 계산 (세로 중앙 정렬, 같은 너비)"""
+        count = len(self.ACTIONS)
+        inner_width = cell.width() - 2 * self.MARGIN - (count - 1) * self.SPACING
+        width = max(28, inner_width // count)
+        top = cell.top() + (cell.height() - self.BUTTON_HEIGHT) // 2
+        rects = []
+        x = cell.left() + self.MARGIN
+        for name, _text, _tooltip in self.ACTIONS:
+            rects.append((name, QRect(x, top, width, self.BUTTON_HEIGHT)))
+            x += width + self.SPACING
+        return rects
+
+    def _action_at(self, cell: QRect, pos) -> str | None:
+        for name, rect in self._button_rects(cell):
+            if rect.contains(pos):
+                return name
+        return None
+
+    def paint(self, painter, option, index):
+        _paint_item_background(self, painter, option, index)
+        colors = self.BUTTON_COLORS.get(theme_manager.get_current_theme(), self.BUTTON_COLORS['light'])
+        texts = {name: text for name, text, _tooltip in self.ACTIONS}
+
+        painter.save()
+        painter.setRenderHint(painter.RenderHint.Antialiasing)
+        painter.setFont(self._font)
+        for name, rect in self._button_rects(option.rect):
+            if self._hover == (index.row(), name):
+                key = 'delete_hover' if name == 'delete' else 'hover'
+            else:
+                key = 'normal'
+            background, border, text = colors[key]
+            painter.setPen(QPen(QColor(border), 1))
+            painter.setBrush(QColor(background))
+            painter.drawRoundedRect(QRectF(rect).adjusted(0.5, 0.5, -0.5, -0.5), 3, 3)
+            painter.setPen(QColor(text))
+            painter.drawText(rect, Qt.AlignCenter, texts[name])
+        painter.restore()
+
+    def editorEvent(self, event, model, option, index):
+        """버튼 호버/클릭 처리"""
+        if event.type() == QEvent.MouseMove:
+            hover = self._action_at(option.rect, event.position().toPoint())
+            new_hover = (index.row(), hover) if hover else None
+            if new_hover != self._hover:
+                self._hover = new_hover
+                self.view.viewport().update(option.rect)
+            return False
+        if event.type() in (QEvent.MouseButtonPress, QEvent.MouseButtonRelease) \
+                and event.button() == Qt.LeftButton:
+            action = self._action_at(option.rect, event.position().toPoint())
+            if action is None:
+                return False
+            if event.type() == QEvent.MouseButtonRelease:
+                self.action_triggered.emit(action, index.data(Qt.UserRole))
+            return True  # 버튼 위 클릭은 행 선택/드래그로 넘기지 않음
+        return False
+
+    def clear_hover(self):
+        """마우스가 테이블을 벗어났을 때 호버 표시 제거"""
+        if self._hover is not None:
+            self._hover = None
+            self.view.viewport().update()
+
+    def helpEvent(self, event, view, option, index):
+        """버튼별 툴팁"""
+        if event.type() == QEvent.ToolTip:
+            action = self._action_at(option.rect, event.pos())
+            for name, _text, tooltip in self.ACTIONS:
+                if name == action:
+                    QToolTip.showText(event.globalPos(), tooltip, view)
+                    return True
+        return super().helpEvent(event, view, option, index)
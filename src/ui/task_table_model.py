@@ -0,0 +1,252 @@
+"""
+할 일 테이블 모델
+"""
+from bisect import bisect_left
+from PySide6.QtCore import Qt, QAbstractTableModel, QModelIndex, Signal
+from PySide6.QtGui import QColor
+from database.models import Task
+from utils.helpers import format_datetime
+from utils.status_manager import status_manager
+from ui.list_diff import apply_keyed_diff
+
+
+class TaskTableModel(QAbstractTableModel):
+    """할 일 목록 모델 (QTableView 용)
+
+    행마다 위젯을 만들지 않고 데이터만 보관하며, 체크박스/액션 버튼은
+    delegate 가 그린다. 아직 불러오지 않은 페이지는 canFetchMore/fetchMore 로
+    뷰가 스크롤 끝에 닿을 때 요청한다.
+    """
+
+    # 컬럼 인덱스
+    COLUMN_ORDER = 0
+    COLUMN_COMPLETED = 1
+    COLUMN_TITLE = 2
+    COLUMN_DUE_DATE = 3
+    COLUMN_CREATED = 4
+    COLUMN_ACTIONS = 5
+
+    HEADERS = ["순서", "완료", "할 일", "마감일", "생성일", "액션"]
+
+    # 마감일 상태별 (배경색, 글자색)
+    DUE_DATE_COLORS = {
+        'overdue': ("#ff4757", "#ffffff"),
+        'urgent': ("#ff6b6b", "#ffffff"),
+        'completed': ("#2ed573", "#ffffff"),
+    }
+
+    fetch_more_requested = Signal()      # 다음 페이지 조회 요청 (뷰 스크롤이 끝에 닿음)
+    title_edited = Signal(object, str)   # (Task, 새 제목) – 인라인 편집 완료
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._tasks: list[Task] = []
+        self._next_cursor = None     # 다음 페이지 커서 (None 이면 끝까지 불러옴)
+        self._fetching = False       # 다음 페이지 조회 중 여부
+        self._status_cache: dict[int, dict] = {}  # 할 일 id → 상태 요약 (그려진 행만 계산)
+
+    # ------------------------------------------------------------------
+    # 데이터 설정
+    # ------------------------------------------------------------------
+    @property
+    def tasks(self) -> list[Task]:
+        """불러온 할 일 목록 (화면 순서)"""
+        return self._tasks
+
+    @property
+    def next_cursor(self):
+        return self._next_cursor
+
+    def reset_tasks(self, tasks: list[Task], next_cursor):
+        """목록 전체 교체 (첫 페이지 로드)"""
+        self.beginResetModel()
+        self._tasks = list(tasks)
+        self._next_cursor = next_cursor
+        self._fetching = False
+        self._status_cache.clear()
+        self.endResetModel()
+
+    def append_tasks(self, tasks: list[Task], next_cursor):
+        """다음 페이지를 목록 끝에 추가"""
+        self._next_cursor = next_cursor
+        self._fetching = False
+        if not tasks:
+            return
+        start = len(self._tasks)
+        self.beginInsertRows(QModelIndex(), start, start + len(tasks) - 1)
+        self._tasks.extend(tasks)
+        self.endInsertRows()
+
+    @staticmethod
+    def sort_key(task: Task) -> tuple[int, int, int]:
+        """목록 정렬 키 (DB 페이지 커서와 같은 형태)"""
+        return (int(task.completed), task.order_index, task.id)
+
+    def apply_tasks(self, tasks: list[Task], next_cursor):
+        """새 목록과 현재 목록을 할 일 id로 비교해 바뀐 행만 알림
+
+        사라진 행은 remove, 새 행은 insert, 순서가 바뀐 행은 move 로 알리고
+        내용이 바뀐 행만 dataChanged 를 보낸다. 선택/스크롤 위치는 뷰가 유지한다.
+        """
+        if not self._tasks or not tasks or not apply_keyed_diff(
+                self, self._tasks, tasks, key=lambda task: task.id,
+                on_removed=lambda task: self._status_cache.pop(task.id, None),
+                on_changed=self.refresh_row):
+            self.reset_tasks(tasks, next_cursor)
+            return
+        self._next_cursor = next_cursor
+        self._fetching = False
+
+    def place_task(self, task: Task, visible: bool = True):
+        """정렬 키가 바뀐(또는 새로 생긴) 할 일 하나를 제자리로 옮김
+
+        DB를 다시 읽지 않고 불러온 목록 안에서 위치만 계산한다. 새 위치가 아직
+        불러오지 않은 페이지 쪽이면 목록에서 빼 두고, 스크롤로 그 페이지를
+        불러올 때 다시 나타나게 한다.
+
+        Args:
+            task: 변경된 할 일
+            visible: 현재 필터에서 보여야 하는지 (완료 숨김 상태의 완료 할 일이면 False)
+        """
+        others = [t for t in self._tasks if t.id != task.id]
+        key = self.sort_key(task)
+        if visible and (self._next_cursor is None or key <= tuple(self._next_cursor)):
+            others.insert(bisect_left([self.sort_key(t) for t in others], key), task)
+        self.apply_tasks(others, self._next_cursor)
+        self.refresh_row(self.row_of(task.id))
+
+    def remove_task(self, task_id: int):
+        """할 일 행 하나 제거"""
+        row = self.row_of(task_id)
+        if row < 0:
+            return
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self._tasks[row]
+        self._status_cache.pop(task_id, None)
+        self.endRemoveRows()
+
+    def cancel_fetch(self):
+        """다음 페이지 조회 실패 시 다시 요청할 수 있도록 상태 복원"""
+        self._fetching = False
+
+    def task_at(self, row: int) -> Task | None:
+        """행의 할 일 반환"""
+        if 0 <= row < len(self._tasks):
+            return self._tasks[row]
+        return None
+
+    def row_of(self, task_id: int) -> int:
+        """할 일 id의 행 번호 (없으면 -1)"""
+        for row, task in enumerate(self._tasks):
+            if task.id == task_id:
+                return row
+        return -1
+
+    def refresh_row(self, row: int):
+        """할 일 객체가 바뀐 행을 다시 그리도록 알림"""
+        task = self.task_at(row)
+        if task is None:
+            return
+        self._status_cache.pop(task.id, None)
+        self.dataChanged.emit(self.index(row, 0), self.index(row, self.columnCount() - 1))
+
+    def _status(self, task: Task) -> dict:
+        """할 일 상태 요약 (캐시)"""
+        info = self._status_cache.get(task.id)
+        if info is None:
+            info = status_manager.get_task_status_summary(task)
+            self._status_cache[task.id] = info
+        return info
+
+    # ------------------------------------------------------------------
+    # QAbstractTableModel 구현
+    # ------------------------------------------------------------------
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._tasks)
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+    def data(self, index: QModelIndex, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        task = self._tasks[index.row()]
+        column = index.column()
+
+        if role == Qt.UserRole:
+            return task
+
+        if column == self.COLUMN_ORDER:
+            # order_index 는 간격을 둔 정렬 키이므로 화면 순번을 표시
+            if role == Qt.DisplayRole:
+                return str(index.row() + 1)
+
+        elif column == self.COLUMN_TITLE:
+            if role == Qt.DisplayRole:
+                icon = self._status(task)['icon']
+                return f"{icon} {task.title}" if icon else task.title
+            if role == Qt.EditRole:
+                return task.title
+            if role == Qt.ForegroundRole:
+                info = self._status(task)
+                if info['status'] != 'normal':
+                    return QColor(info['color'])
+            if role == Qt.BackgroundRole and task.completed:
+                return QColor(Qt.lightGray)
+
+        elif column == self.COLUMN_DUE_DATE:
+            status = self._status(task)['status']
+            if role == Qt.DisplayRole:
+                if not task.due_date:
+                    return "-"
+                text = format_datetime(task.due_date, "%m/%d %H:%M")
+                if status == 'overdue':
+                    return f"⚠️ {text}"
+                if status == 'urgent':
+                    return f"🔥 {text}"
+                return text
+            if role in (Qt.BackgroundRole, Qt.ForegroundRole) and status in self.DUE_DATE_COLORS:
+                background, foreground = self.DUE_DATE_COLORS[status]
+                return QColor(background if role == Qt.BackgroundRole else foreground)
+
+        elif column == self.COLUMN_CREATED:
+            if role == Qt.DisplayRole:
+                return format_datetime(task.created_date, "%m/%d %H:%M")
+
+        return None
+
+    def setData(self, index: QModelIndex, value, role=Qt.EditRole) -> bool:
+        """제목 인라인 편집 – 저장은 title_edited 를 받은 쪽에서 처리"""
+        if role != Qt.EditRole or index.column() != self.COLUMN_TITLE:
+            return False
+        task = self._tasks[index.row()]
+        new_title = str(value).strip()
+        if new_title and new_title != task.title:
+            self.title_edited.emit(task, new_title)
+        return False
+
+    def flags(self, index: QModelIndex):
+        if not index.isValid():
+            return Qt.ItemIsDropEnabled
+        flags = Qt.ItemIsEnabled | Qt.ItemIsSelectable | Qt.ItemIsDragEnabled
+        # 완료된 할 일은 제목 편집 불가
+        if index.column() == self.COLUMN_TITLE and not self._tasks[index.row()].completed:
+            flags |= Qt.ItemIsEditable
+        return flags
+
+    def supportedDropActions(self):
+        return Qt.MoveAction
+
+    def canFetchMore(self, parent=QModelIndex()) -> bool:
+        return not parent.isValid() and self._next_cursor is not None and not self._fetching
+
+    def fetchMore(self, parent=QModelIndex()):
+        if not self.canFetchMore(parent):
+            return
+        self._fetching = True
+        self.fetch_more_requested.emit()
@@ -3,34 +3,39 @@
 """
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QPushButton,
-    QTableWidget, QTableWidgetItem, QHeaderView,
-    QCheckBox, QInputDialog, QMessageBox, QLineEdit,
+    QTableView, QHeaderView, QInputDialog, QMessageBox,
     QAbstractItemView, QDialog
 )
-from PySide6.QtCore import Qt, Signal
-from PySide6.QtGui import QColor
+from PySide6.QtCore import Qt, QModelIndex
 from database.database import Database
+from database.executor import DatabaseExecutor
 from database.models import Project, Task
 from utils.helpers import format_datetime, validate_task_title
 from datetime import datetime, timedelta
 from utils.theme_manager import theme_manager
-from utils.status_manager import status_manager
-from utils.animation_manager import animation_manager
+from utils.refresh_bus import refresh_bus, RefreshBus
 from ui.due_date_dialog import DueDateDialog
+from ui.task_table_model import TaskTableModel
+from ui.task_delegates import CheckBoxDelegate, ActionButtonsDelegate
 
 
 class TaskWidget(QWidget):
     """할 일 관리 위젯"""
     
-    task_updated = Signal()
+    # 한 번에 불러오는 할 일 수 (스크롤이 끝에 가까워지면 다음 페이지 조회)
+    PAGE_SIZE = 200
     
-    def __init__(self, db: Database):
+    def __init__(self, db: Database, executor: DatabaseExecutor):
         super().__init__()
         self.db = db
+        self.executor = executor    # DB 작업은 백그라운드 워커에서 실행
         self.current_project = None
+        self._load_generation = 0   # 마지막 load_tasks 요청 번호 (늦게 도착한 이전 결과 무시)
+        self._focus_task_id = None  # 다음 목록 표시 후 선택할 할 일 (검색 결과 이동)
         self.show_completed = True  # 완료된 할 일 표시 여부
-        self.editing_item = None    # 현재 편집 중인 아이템
         self.init_ui()
+        # 목록 재조회 요청은 갱신 버스로 모아 틱마다 한 번만 실행
+        refresh_bus.register(RefreshBus.TASKS, self.load_tasks)
 
     def init_ui(self):
         """UI 초기화"""
@@ -51,23 +56,34 @@ class TaskWidget(QWidget):
         button_layout.addStretch()
         layout.addLayout(button_layout)
         
-        # 할 일 테이블
-        self.task_table = TaskTableWidget(self)
-        
-        # 컬럼 설정
-        self.task_table.setColumnCount(6)
-        self.task_table.setHorizontalHeaderLabels(["순서", "완료", "할 일", "마감일", "생성일", "액션"])
+        # 할 일 테이블 (모델/뷰 – 행마다 위젯을 만들지 않고 delegate 가 그림)
+        self.task_model = TaskTableModel(self)
+        self.task_model.fetch_more_requested.connect(self.fetch_more)
+        self.task_model.title_edited.connect(self.finish_inline_editing)
+        self.task_table = TaskTableView(self)
+        self.task_table.setModel(self.task_model)
+        
+        self.checkbox_delegate = CheckBoxDelegate(self.task_table)
+        self.checkbox_delegate.toggled.connect(self.toggle_task_completion)
+        self.task_table.setItemDelegateForColumn(TaskTableModel.COLUMN_COMPLETED, self.checkbox_delegate)
+        self.action_delegate = ActionButtonsDelegate(self.task_table)
+        self.action_delegate.action_triggered.connect(self.on_task_action)
+        self.task_table.setItemDelegateForColumn(TaskTableModel.COLUMN_ACTIONS, self.action_delegate)
+        self.task_table.setMouseTracking(True)  # 액션 버튼 호버 표시
         
         # 드래그앤드롭 설정 (행 이동)
-        self.task_table.setDragDropMode(QTableWidget.InternalMove)
+        self.task_table.setDragDropMode(QAbstractItemView.InternalMove)
+        self.task_table.setDragDropOverwriteMode(False)
         self.task_table.setDefaultDropAction(Qt.MoveAction)
         self.task_table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.task_table.setSelectionMode(QAbstractItemView.SingleSelection)
         self.task_table.setDragEnabled(True)
         self.task_table.setAcceptDrops(True)
         self.task_table.setDropIndicatorShown(True)
         
-        # 더블클릭 편집 설정
-        self.task_table.itemDoubleClicked.connect(self.start_inline_editing)
+        # 더블클릭: 제목은 인라인 편집, 마감일은 마감일 다이얼로그
+        self.task_table.setEditTriggers(QAbstractItemView.DoubleClicked)
+        self.task_table.doubleClicked.connect(self.on_cell_double_clicked)
         
         # 컬럼 너비 설정
         header = self.task_table.horizontalHeader()
@@ -90,235 +106,126 @@ class TaskWidget(QWidget):
 
     def set_project(self, project: Project):
         """프로젝트 설정"""
+        same_project = self.current_project is not None and project is not None \
+            and self.current_project.id == project.id
         self.current_project = project
-        self.load_tasks()
+        # 같은 프로젝트를 다시 설정하면 (프로젝트 정보 갱신 등) 목록을 비우지 않고 바뀐 행만 반영
+        if not same_project:
+            self.task_model.reset_tasks([], None)
+        refresh_bus.mark_dirty(RefreshBus.TASKS)
 
     def load_tasks(self):
-        """할 일 목록 로드"""
+        """할 일 목록 첫 페이지 로드 (백그라운드 조회 후 결과가 도착하면 표시)"""
         if not self.current_project:
             return
         
-        all_tasks = self.db.get_tasks_by_project(self.current_project.id)
-        
-        # 완료된 할 일 필터링
-        tasks = all_tasks if self.show_completed else [t for t in all_tasks if not t.completed]
-        
-        # 데이터베이스에서 이미 order_index로 정렬되어 있음
-        
-        self.task_table.setRowCount(len(tasks))
-        
-        for row, task in enumerate(tasks):
-            # 순서 표시
-            order_item = QTableWidgetItem(str(task.order_index))
-            order_item.setData(Qt.UserRole, task)
-            order_item.setFlags(order_item.flags() & ~Qt.ItemIsEditable)
-            self.task_table.setItem(row, 0, order_item)
-            
-            # 완료 체크박스
-            checkbox = QCheckBox()
-            checkbox.setChecked(task.completed)
-            checkbox.stateChanged.connect(lambda state, t=task, cb=checkbox: self.toggle_task_completion(t, cb))
-            checkbox_widget = QWidget()
-            checkbox_layout = QHBoxLayout(checkbox_widget)
-            checkbox_layout.addWidget(checkbox)
-            checkbox_layout.setAlignment(Qt.AlignCenter)
-            checkbox_layout.setContentsMargins(0, 0, 0, 0)
-            self.task_table.setCellWidget(row, 1, checkbox_widget)
-            
-            # 할 일 제목 - 상태 표시 추가
-            task_status_info = status_manager.get_task_status_summary(task)
-            status_icon = task_status_info['icon']
-            title_text = f"{status_icon} {task.title}" if status_icon else task.title
-            
-            title_item = QTableWidgetItem(title_text)
-            title_item.setData(Qt.UserRole, task)
-            
-            # 상태에 따른 색상 적용
-            if task_status_info['status'] != 'normal':
-                title_item.setForeground(QColor(task_status_info['color']))
-            
-            if task.completed:
-                title_item.setFlags(title_item.flags() & ~Qt.ItemIsEditable)
-                title_item.setBackground(Qt.lightGray)
-            self.task_table.setItem(row, 2, title_item)
-            
-            # 마감일 - 상태 기반 표시
-            due_date_text = ""
-            if task.due_date:
-                due_date_text = format_datetime(task.due_date, "%m/%d %H:%M")
-                
-                # 상태에 따른 아이콘 추가
-                if task_status_info['status'] == 'overdue':
-                    due_date_text = f"⚠️ {due_date_text}"
-                elif task_status_info['status'] == 'urgent':
-                    due_date_text = f"🔥 {due_date_text}"
-            else:
-                due_date_text = "-"
-            
-            due_date_item = QTableWidgetItem(due_date_text)
-            due_date_item.setFlags(due_date_item.flags() & ~Qt.ItemIsEditable)
-            
-            # 상태에 따른 배경색 적용
-            if task_status_info['status'] == 'overdue':
-                due_date_item.setBackground(QColor("#ff4757"))
-                due_date_item.setForeground(QColor("#ffffff"))
-            elif task_status_info['status'] == 'urgent':
-                due_date_item.setBackground(QColor("#ff6b6b"))
-                due_date_item.setForeground(QColor("#ffffff"))
-            elif task_status_info['status'] == 'completed':
-                due_date_item.setBackground(QColor("#2ed573"))
-                due_date_item.setForeground(QColor("#ffffff"))
-            
-            self.task_table.setItem(row, 3, due_date_item)
-            
-            # 생성일
-            date_item = QTableWidgetItem(format_datetime(task.created_date, "%m/%d %H:%M"))
-            self.task_table.setItem(row, 4, date_item)
-            
-            # 액션 버튼들 (완벽한 수직 중앙 정렬을 위한 wrapper 적용)
-            action_widget = self.create_task_action_widget(task)
-            
-            # 수직 중앙 정렬을 강제하는 wrapper 위젯
-            wrapper = QWidget()
-            wrapper_layout = QVBoxLayout(wrapper)
-            wrapper_layout.setContentsMargins(0, 0, 0, 0)
-            wrapper_layout.setSpacing(0)
-            wrapper_layout.addStretch()  # 위쪽 여백
-            wrapper_layout.addWidget(action_widget)
-            wrapper_layout.addStretch()  # 아래쪽 여백
-            
-            self.task_table.setCellWidget(row, 5, wrapper)
+        self._load_generation += 1
+        generation = self._load_generation
+        # 변경 후 재로드할 때는 스크롤해서 불러온 만큼 다시 읽어 위치를 유지
+        limit = max(self.PAGE_SIZE, self.task_model.rowCount())
+        # 검색 결과로 이동하는 경우 대상 할 일까지 한 번에 읽음
+        self.executor.submit(
+            self.db.get_tasks_page, self.current_project.id, None, limit, self.show_completed,
+            include_task_id=self._focus_task_id,
+            callback=lambda page: self._render_tasks(generation, *page)
+        )
 
-    def create_task_action_widget(self, task: Task) -> QWidget:
-        """할 일 액션 위젯 생성 (wrapper와 함께 완벽한 중앙 정렬)"""
-        from PySide6.QtWidgets import QSizePolicy
+    def fetch_more(self):
+        """다음 페이지를 불러와 목록 끝에 추가 (뷰가 스크롤 끝에 닿으면 모델이 요청)"""
+        cursor = self.task_model.next_cursor
+        if not self.current_project or cursor is None:
+            self.task_model.cancel_fetch()
+            return
         
-        # 액션 버튼들을 담는 위젯 (wrapper에 의해 중앙 정렬됨)
-        widget = QWidget()
-        widget.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
-        widget.setFixedHeight(20)  # 적절한 버튼 높이
+        generation = self._load_generation
+        self.executor.submit(
+            self.db.get_tasks_page, self.current_project.id, cursor,
+            self.PAGE_SIZE, self.show_completed,
+            callback=lambda page: self._append_tasks(generation, *page),
+            error_callback=lambda _error: self.task_model.cancel_fetch()
+        )
+
+    def _render_tasks(self, generation: int, tasks: list[Task], next_cursor):
+        """조회된 첫 페이지(들)를 테이블에 표시"""
+        # 그 사이 다른 프로젝트 선택 등으로 새 요청이 있었다면 무시
+        if generation != self._load_generation:
+            return
         
-        layout = QHBoxLayout(widget)
-        layout.setContentsMargins(5, 1, 5, 1)  # 좌우 여백, 최소 상하 여백
-        layout.setSpacing(3)  # 버튼 간격
-        layout.setAlignment(Qt.AlignCenter)
+        # 재로드 후에도 선택된 할 일과 스크롤 위치 유지 (변경이 많아 모델이 리셋된 경우 대비)
+        current = self._current_task()
+        scroll_value = self.task_table.verticalScrollBar().value()
         
-        # 현재 테마 확인
-        current_theme = theme_manager.get_current_theme()
+        # 완료 필터와 정렬은 DB 조회에서 이미 적용됨 – 바뀐 행만 모델에 반영
+        self.task_model.apply_tasks(tasks, next_cursor)
         
-        # 반응형 버튼 스타일 (전문가 권장: 호버 효과 개선)
-        if current_theme == 'dark':
-            button_style = """
-                QPushButton {
-                    font-family: 'Segoe UI', '맑은 고딕';
-                    font-size: 12px;
-                    font-weight: normal;
-                    border: 1px solid #666;
-                    border-radius: 3px;
-                    background-color: #4a4a4a;
-                    color: #ffffff;
-                    text-align: center;
-                    padding: 2px 4px;
-                }
-                QPushButton:hover {
-                    background-color: #5a5a5a;
-                    border-color: #777;
-                }
-                QPushButton:pressed {
-                    background-color: #3a3a3a;
-                }
-            """
-            delete_button_style = """
-                QPushButton {
-                    font-family: 'Segoe UI', '맑은 고딕';
-                    font-size: 12px;
-                    font-weight: normal;
-                    border: 1px solid #666;
-                    border-radius: 3px;
-                    background-color: #4a4a4a;
-                    color: #ffffff;
-                    text-align: center;
-                    padding: 2px 4px;
-                }
-                QPushButton:hover {
-                    background-color: #664444;
-                    border-color: #777;
-                }
-                QPushButton:pressed {
-                    background-color: #553333;
-                }
-            """
+        # 검색 결과로 이동하는 경우 대상 행 선택 (숨긴 완료 할 일이면 선택하지 않음)
+        if self._focus_task_id is not None:
+            self._select_task_row(self._focus_task_id)
+            self._focus_task_id = None
         else:
-            # 라이트 테마: 밝은 색상으로 일관성 유지
-            button_style = """
-                QPushButton {
-                    font-family: 'Segoe UI', '맑은 고딕';
-                    font-size: 12px;
-                    font-weight: normal;
-                    border: 1px solid #d0d0d0;
-                    border-radius: 3px;
-                    background-color: #ffffff;
-                    color: #333333;
-                    text-align: center;
-                    padding: 2px 4px;
-                }
-                QPushButton:hover {
-                    background-color: #f0f8ff;
-                    border-color: #0078d4;
-                    color: #0078d4;
-                }
-                QPushButton:pressed {
-                    background-color: #e6f3ff;
-                    border-color: #106ebe;
-                    color: #106ebe;
-                }
-            """
-            delete_button_style = """
-                QPushButton {
-                    font-family: 'Segoe UI', '맑은 고딕';
-                    font-size: 12px;
-                    font-weight: normal;
-                    border: 1px solid #d0d0d0;
-                    border-radius: 3px;
-                    background-color: #ffffff;
-                    color: #333333;
-                    text-align: center;
-                    padding: 2px 4px;
-                }
-                QPushButton:hover {
-                    background-color: #fff5f5;
-                    border-color: #dc3545;
-                    color: #dc3545;
-                }
-                QPushButton:pressed {
-                    background-color: #ffe6e6;
-                    border-color: #c82333;
-                    color: #c82333;
-                }
-            """
-        
-        # 버튼 생성 (전문가 권장: 아이콘 + 텍스트 조합으로 직관성 향상)
-        buttons_data = [
-            ("📅 날짜", lambda: self.set_due_date(task), button_style, "마감일 설정/수정"),
-            ("✏️ 편집", lambda: self.edit_task(task), button_style, "할 일 편집"),
-            ("🗑️ 삭제", lambda: self.delete_task(task), delete_button_style, "할 일 삭제")
-        ]
-        
-        for text, handler, style, tooltip in buttons_data:
-            btn = QPushButton(text)
-            btn.setToolTip(tooltip)
-            
-            # 🔥 핵심 수정: 반응형 크기 정책 적용
-            btn.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
-            btn.setMaximumHeight(18)  # wrapper 높이에 맞춤
-            btn.setMinimumHeight(16)
-            btn.setMinimumWidth(28)  # 최소 너비
-            
-            btn.setStyleSheet(style)
-            btn.clicked.connect(handler)
-            layout.addWidget(btn)
-        
-        return widget
+            if current is not None:
+                self._select_task_row(current.id, scroll=False)
+            self.task_table.verticalScrollBar().setValue(scroll_value)
+
+    def _append_tasks(self, generation: int, tasks: list[Task], next_cursor):
+        """다음 페이지를 테이블 끝에 추가"""
+        if generation != self._load_generation:
+            return
+        self.task_model.append_tasks(tasks, next_cursor)
+
+    def focus_task(self, task_id: int):
+        """다음 목록 표시가 끝나면 해당 할 일 행을 선택 (검색 결과로 이동할 때 사용)"""
+        self._focus_task_id = task_id
+
+    def _select_task_row(self, task_id: int, scroll: bool = True) -> bool:
+        """id가 일치하는 할 일 행을 선택하고 보이도록 스크롤 (찾으면 True)"""
+        row = self.task_model.row_of(task_id)
+        if row < 0:
+            return False
+        self.task_table.selectRow(row)
+        if scroll:
+            self.task_table.scrollTo(self.task_model.index(row, 0))
+        return True
+
+    def _current_task(self) -> Task | None:
+        """현재 선택된 행의 할 일"""
+        return self.task_model.task_at(self.task_table.currentIndex().row())
+
+    def on_task_action(self, action: str, task: Task):
+        """액션 버튼 클릭 처리"""
+        if action == 'due_date':
+            self.set_due_date(task)
+        elif action == 'edit':
+            self.edit_task(task)
+        elif action == 'delete':
+            self.delete_task(task)
+
+    def on_cell_double_clicked(self, index: QModelIndex):
+        """마감일 컬럼 더블클릭 시 마감일 다이얼로그 호출 (제목은 인라인 편집기가 처리)"""
+        if index.column() == TaskTableModel.COLUMN_DUE_DATE:
+            task = self.task_model.task_at(index.row())
+            if task:
+                self.set_due_date(task)
+
+    def _submit_mutation(self, func, *args, on_done=None, success_message: str | None = None):
+        """DB 변경 작업을 백그라운드로 실행하고 완료 후 프로젝트 정보 갱신 요청
+
+        화면은 호출하는 쪽에서 바뀐 행만 미리(또는 on_done 에서) 갱신한다.
+        저장에 실패하면 목록을 다시 불러와 DB 상태로 되돌린다.
+        """
+        def _on_done(result):
+            if on_done is not None:
+                on_done(result)
+            # 프로젝트 정보 갱신 시 사이드바의 해당 프로젝트 행도 함께 갱신된다
+            refresh_bus.mark_dirty(RefreshBus.PROJECT_INFO)
+            if success_message:
+                QMessageBox.information(self, "성공", success_message)
+        
+        def _on_error(error):
+            QMessageBox.critical(self, "오류", f"할 일 저장 중 오류가 발생했습니다: {str(error)}")
+            refresh_bus.mark_dirty(RefreshBus.TASKS)
+        
+        self.executor.submit(func, *args, callback=_on_done, error_callback=_on_error)
 
     def add_task(self):
         """할 일 추가"""
@@ -341,10 +248,12 @@ class TaskWidget(QWidget):
                 project_id=self.current_project.id,
                 title=title.strip()
             )
-            self.db.create_task(task)
-            self.load_tasks()
-            self.task_updated.emit()
-            QMessageBox.information(self, "성공", "할 일이 추가되었습니다!")
+            def _on_created(task_id):
+                task.id = task_id
+                self.task_model.place_task(task)
+            
+            self._submit_mutation(self.db.create_task, task, on_done=_on_created,
+                                  success_message="할 일이 추가되었습니다!")
 
     def edit_task(self, task: Task):
         """할 일 편집"""
@@ -360,25 +269,22 @@ class TaskWidget(QWidget):
                 return
             
             task.title = title.strip()
-            self.db.update_task(task)
-            self.load_tasks()
-            self.task_updated.emit()
-            QMessageBox.information(self, "성공", "할 일이 수정되었습니다!")
+            self.task_model.refresh_row(self.task_model.row_of(task.id))
+            self._submit_mutation(self.db.update_task, task, success_message="할 일이 수정되었습니다!")
     
     def set_due_date(self, task: Task):
         """마감일 설정"""
         dialog = DueDateDialog(task.due_date, self)
         if dialog.exec() == QDialog.Accepted:
             task.due_date = dialog.get_due_date()
-            self.db.update_task(task)
-            self.load_tasks()
-            self.task_updated.emit()
             
             if task.due_date:
                 due_date_str = format_datetime(task.due_date, "%Y-%m-%d %H:%M")
-                QMessageBox.information(self, "성공", f"마감일이 설정되었습니다.\n{due_date_str}")
+                message = f"마감일이 설정되었습니다.\n{due_date_str}"
             else:
-                QMessageBox.information(self, "성공", "마감일이 제거되었습니다.")
+                message = "마감일이 제거되었습니다."
+            self.task_model.refresh_row(self.task_model.row_of(task.id))
+            self._submit_mutation(self.db.update_task, task, success_message=message)
     
     def toggle_completed_tasks(self):
         """완료된 할 일 표시/숨김 토글"""
@@ -391,77 +297,18 @@ class TaskWidget(QWidget):
         
         self.load_tasks()
     
-    def start_inline_editing(self, item: QTableWidgetItem):
-        """인라인 편집 시작"""
-        column = item.column()
-        
-        # 마감일 컬럼(인덱스 3) 더블클릭 시 마감일 다이얼로그 호출
-        if column == 3:  # '마감일' 컬럼 인덱스
-            # Task 객체 찾기 (순서 컬럼에서 가져오기)
-            row = item.row()
-            order_item = self.task_table.item(row, 0)
-            if order_item:
-                task = order_item.data(Qt.UserRole)
-                if task:
-                    self.set_due_date(task)
-            return
-        
-        # 할 일 제목 컬럼(인덱스 2)에서만 텍스트 편집 허용
-        if column != 2:  # '할 일' 컬럼 인덱스
-            return
-        
-        # 완료된 할 일은 편집 불가
-        task = item.data(Qt.UserRole)
-        if task and task.completed:
-            return
-        
-        # 이미 편집 중인 경우 무시
-        if self.editing_item is not None:
-            return
-        
-        self.editing_item = item
-        row = item.row()
-        
-        # 라인 에디트 생성
-        line_edit = QLineEdit()
-        line_edit.setText(item.text())
-        line_edit.selectAll()
-        
-        # 이벤트 연결
-        line_edit.editingFinished.connect(lambda: self.finish_inline_editing(line_edit, item))
-        line_edit.returnPressed.connect(lambda: self.finish_inline_editing(line_edit, item))
-        
-        # 테이블에 위젯 설정
-        self.task_table.setCellWidget(row, 2, line_edit)
-        line_edit.setFocus()
-    
-    def finish_inline_editing(self, line_edit: QLineEdit, item: QTableWidgetItem):
-        """인라인 편집 완료"""
-        if self.editing_item is None:
+    def finish_inline_editing(self, task: Task, new_title: str):
+        """인라인 편집 완료 (모델의 title_edited 시그널로 호출)"""
+        # 제목 검증
+        is_valid, error_msg = validate_task_title(new_title)
+        if not is_valid:
+            QMessageBox.warning(self, "입력 오류", error_msg)
             return
         
-        new_title = line_edit.text().strip()
-        task = item.data(Qt.UserRole)
-        
-        if new_title and task:
-            # 제목 검증
-            is_valid, error_msg = validate_task_title(new_title)
-            if is_valid:
-                # 할 일 업데이트
-                task.title = new_title
-                self.db.update_task(task)
-                item.setText(new_title)
-                self.task_updated.emit()
-            else:
-                QMessageBox.warning(self, "입력 오류", error_msg)
-        
-        # 위젯 제거 및 편집 상태 초기화
-        row = item.row()
-        self.task_table.removeCellWidget(row, 2)
-        self.editing_item = None
-        
-        # 목록 새로고침
-        self.load_tasks()
+        # 할 일 업데이트 (제목은 정렬에 영향이 없으므로 해당 행만 다시 그림)
+        task.title = new_title
+        self.task_model.refresh_row(self.task_model.row_of(task.id))
+        self._submit_mutation(self.db.update_task, task)
     
     def delete_task(self, task: Task):
         """할 일 삭제"""
@@ -473,16 +320,11 @@ class TaskWidget(QWidget):
         )
         
         if reply == QMessageBox.Yes:
-            self.db.delete_task(task.id)
-            self.load_tasks()
-            self.task_updated.emit()
-            QMessageBox.information(self, "성공", "할 일이 삭제되었습니다!")
+            self.task_model.remove_task(task.id)
+            self._submit_mutation(self.db.delete_task, task.id, success_message="할 일이 삭제되었습니다!")
 
-    def toggle_task_completion(self, task: Task, checkbox: QCheckBox):
+    def toggle_task_completion(self, task: Task):
         """할 일 완료 상태 토글"""
-        # 체크박스 애니메이션 실행
-        animation_manager.animate_task_completion(checkbox)
-        
         # 완료 상태 변경
         task.completed = not task.completed
         if task.completed:
@@ -490,42 +332,36 @@ class TaskWidget(QWidget):
         else:
             task.completed_date = None
         
-        self.db.update_task(task)
-        self.load_tasks()
-        self.task_updated.emit()
+        # 완료 여부가 정렬 첫 키이므로 행을 해당 구간으로 옮기고 (저장 완료 전에 표시)
+        # 체크박스 애니메이션 실행
+        self.task_model.place_task(task, visible=self.show_completed or not task.completed)
+        row = self.task_model.row_of(task.id)
+        if row >= 0:
+            self.checkbox_delegate.pulse(self.task_model.index(row, TaskTableModel.COLUMN_COMPLETED))
+        
+        self._submit_mutation(self.db.update_task, task)
 
     def apply_theme(self, theme_name: str):
         """테마 적용"""
         style_sheet = theme_manager.get_style_sheet(theme_name)
         self.setStyleSheet(style_sheet)
-        # 테마 변경 시 액션 버튼들도 새로 적용되도록 할 일 목록 재로드
-        if self.current_project:
-            self.load_tasks()
+        # 액션 버튼은 delegate 가 현재 테마로 그리므로 다시 그리기만 하면 됨
+        self.task_table.viewport().update()
     
     def edit_selected_task(self):
         """선택된 할 일 편집 (키보드 단축키용)"""
-        current_row = self.task_table.currentRow()
-        if current_row >= 0:
-            # 순서 컬럼(0)에서 Task 객체 가져오기
-            order_item = self.task_table.item(current_row, 0)
-            if order_item:
-                task = order_item.data(Qt.UserRole)
-                if task:
-                    self.edit_task(task)
+        task = self._current_task()
+        if task:
+            self.edit_task(task)
     
     def delete_selected_task(self):
         """선택된 할 일 삭제 (키보드 단축키용)"""
-        current_row = self.task_table.currentRow()
-        if current_row >= 0:
-            # 순서 컬럼(0)에서 Task 객체 가져오기
-            order_item = self.task_table.item(current_row, 0)
-            if order_item:
-                task = order_item.data(Qt.UserRole)
-                if task:
-                    self.delete_task(task)
+        task = self._current_task()
+        if task:
+            self.delete_task(task)
 
     # ------------------------------------------------------------------
-    # Drag & Drop 행 이동 처리 (TaskTableWidget에서 호출)
+    # Drag & Drop 행 이동 처리 (TaskTableView에서 호출)
     # ------------------------------------------------------------------
 
     def reorder_tasks(self, source_row: int, target_row: int):
@@ -534,37 +370,28 @@ class TaskWidget(QWidget):
         if not self.current_project:
             return
 
-        # 현재 화면에 표시된 Task 객체 순서를 확보
-        tasks_on_screen: list[Task] = []
-        for r in range(self.task_table.rowCount()):
-            item = self.task_table.item(r, 0)
-            if item:
-                tasks_on_screen.append(item.data(Qt.UserRole))
+        # 현재 화면에 표시된 Task 객체 순서를 확보 (불러온 페이지까지)
+        tasks_on_screen = list(self.task_model.tasks)
 
         # pop & insert
         moved_task = tasks_on_screen.pop(source_row)
         tasks_on_screen.insert(target_row, moved_task)
 
-        # order_index 재계산 및 DB 업데이트 목록 작성
-        updated_orders: list[tuple[int, int]] = []
-        for idx, task in enumerate(tasks_on_screen):
-            new_order = idx + 1  # 1부터 시작
-            if task.order_index != new_order:
-                task.order_index = new_order
-                updated_orders.append((task.id, new_order))
-
-        if updated_orders:
-            self.db.update_task_orders(self.current_project.id, updated_orders)
+        # 목록은 완료 여부로 먼저 정렬되므로 같은 완료 상태의 할 일끼리만 이웃으로 본다.
+        # 뒤쪽 이웃은 아직 불러오지 않은 페이지에 있을 수 있으므로 앞 이웃만 넘기고
+        # 새 키 계산(및 간격 소진 시 재배치)은 DB가 맡는다.
+        same_group = [t for t in tasks_on_screen if t.completed == moved_task.completed]
+        pos = same_group.index(moved_task)
+        prev_task_id = same_group[pos - 1].id if pos > 0 else None
 
-        # 캐시된 셀 위젯 제거 후 재로드 (행 사라짐 방지)
-        self.task_table.clearContents()
+        # 저장 완료 후 목록을 다시 읽어 비교 – 키 재배치가 일어났을 수 있으므로
+        # 새 키는 DB 값을 따르고, 화면에는 이동한 행만 반영된다. 이동하면 프로젝트 수정
+        # 시각이 바뀌어 사이드바 순서도 달라지므로 목록도 갱신
+        self._submit_mutation(self.db.move_task, self.current_project.id, moved_task.id, prev_task_id,
+                              on_done=lambda _order: refresh_bus.mark_dirty(RefreshBus.TASKS, RefreshBus.SIDEBAR))
 
-        # 테이블 재로드 (UI 위젯/시그널 일관성 보장)
-        self.load_tasks()
-        self.task_updated.emit()
-
-# 내부 테이블 위젯 서브클래스 (드래그 앤드 드롭 순서를 처리하기 위함)
-class TaskTableWidget(QTableWidget):
+# 내부 테이블 뷰 서브클래스 (드래그 앤드 드롭 순서를 처리하기 위함)
+class TaskTableView(QTableView):
     def __init__(self, parent_widget):
         super().__init__(parent_widget)
         self.parent_widget = parent_widget
@@ -572,24 +399,22 @@ class TaskTableWidget(QTableWidget):
     def dropEvent(self, event):
         """행 단위 드래그 이동 처리
 
-        Qt 기본 drop 처리는 셀 단위로 위젯까지 이동시키므로
-        체크박스 / 버튼 등이 엇갈리는 문제가 발생한다.
-        따라서 기본 처리(super().dropEvent)를 **막고**,
-        대상 행 인덱스만 계산한 뒤 부모(TaskWidget)에
-        '행 이동' 정보를 전달해 테이블을 **완전 재생성**하도록 한다.
+        Qt 기본 drop 처리(모델의 행 이동)를 **막고**, 대상 행 인덱스만
+        계산한 뒤 부모(TaskWidget)에 '행 이동' 정보를 전달해
+        DB 저장 후 목록을 다시 불러오도록 한다.
         """
 
         if not self.parent_widget or not self.parent_widget.current_project:
             event.ignore()
             return
 
-        source_row = self.currentRow()
+        source_row = self.currentIndex().row()
         # Qt 6: QDropEvent.position() → QPointF
         target_row = self.rowAt(int(event.position().y()))
 
         # 행 아래 빈 공간에 드롭한 경우 → 마지막 행으로 간주
         if target_row < 0:
-            target_row = self.rowCount() - 1
+            target_row = self.model().rowCount() - 1
 
         if source_row == target_row or source_row < 0:
             event.ignore()
@@ -598,4 +423,14 @@ class TaskTableWidget(QTableWidget):
         # 부모 위젯에 순서 변경 요청 (DB 갱신 + 테이블 재로드)
         self.parent_widget.reorder_tasks(source_row, target_row)
 
-        event.acceptProposedAction() 
\ No newline at end of file
+        event.acceptProposedAction()
+
+    def mouseMoveEvent(self, event):
+        """액션 컬럼을 벗어나면 버튼 호버 표시 제거"""
+        if self.indexAt(event.position().toPoint()).column() != TaskTableModel.COLUMN_ACTIONS:
+            self.parent_widget.action_delegate.clear_hover()
+        super().mouseMoveEvent(event)
+
+    def leaveEvent(self, event):
+        self.parent_widget.action_delegate.clear_hover()
+        super().leaveEvent(event)
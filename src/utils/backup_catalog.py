@@ -0,0 +1,276 @@
+"""
+백업 목록(카탈로그) 관리
+"""
+import os
+import sqlite3
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Callable, Dict, List, Optional, Tuple
+
+
+@dataclass
+class BackupEntry:
+    """카탈로그에 기록된 백업 파일 하나"""
+    filename: str
+    base_name: str                 # 타임스탬프/(N) 접미사를 뺀 표시 이름
+    created_at: datetime
+    database_size: int = 0         # 백업에 담긴 데이터베이스 크기
+    stored_size: int = 0           # 백업이 차지하는 저장 크기 (증분 백업은 새로 저장한 청크 포함)
+    file_size: int = 0             # 백업 파일 자체 크기 (변경 감지용)
+    mtime: float = 0.0             # 백업 파일 수정 시각 (변경 감지용)
+    checksum: Optional[str] = None  # 백업 파일 SHA-256 (모르면 None)
+    integrity: str = 'unknown'     # 'ok' / 'corrupt' / 'unknown'
+    checked_at: Optional[datetime] = None  # 마지막 전체 무결성 검사(integrity_check) 시각
+    verify_seconds: float = 0.0    # 마지막 검증에 걸린 시간 (초)
+    kind: str = 'manual'           # 'manual' (사용자가 만든 백업) / 'auto' (자동 백업 – 보존 정책으로 정리)
+
+
+@dataclass
+class BackupRun:
+    """자동 백업 실행 기록 하나"""
+    started_at: datetime
+    finished_at: datetime
+    trigger: str                   # 'timer' / 'mutations'
+    success: bool
+    message: str = ""
+    filename: Optional[str] = None  # 만든 백업 파일 (실패 시 None)
+    pruned: int = 0                # 보존 정책으로 삭제한 백업 수
+
+
+class BackupCatalog:
+    """백업 목록을 기록하는 카탈로그 (backups/catalog.sqlite)
+
+    백업을 만들거나 지울 때 기록해 두고, 목록은 디렉토리를 훑지 않고
+    카탈로그만 읽는다. 사용자가 직접 파일을 넣거나 지운 경우는 reconcile()로 반영한다.
+    연결은 호출마다 열고 닫으므로 어느 스레드에서나 사용할 수 있다.
+    """
+
+    SCHEMA_VERSION = 3
+
+    def __init__(self, path: str):
+        """
+        초기화
+
+        Args:
+            path: 카탈로그 DB 파일 경로
+        """
+        self.path = path
+        self.created = not os.path.exists(path)  # 새로 만든 카탈로그면 기존 파일을 reconcile 해야 함
+        conn = self._connect()
+        try:
+            version = conn.execute("PRAGMA user_version").fetchone()[0]
+            if version < 1:
+                conn.executescript("""
+                    CREATE TABLE IF NOT EXISTS backups (
+                        filename TEXT PRIMARY KEY,
+                        base_name TEXT NOT NULL,
+                        created_at TEXT NOT NULL,
+                        database_size INTEGER NOT NULL DEFAULT 0,
+                        stored_size INTEGER NOT NULL DEFAULT 0,
+                        file_size INTEGER NOT NULL DEFAULT 0,
+                        mtime REAL NOT NULL DEFAULT 0,
+                        checksum TEXT,
+                        integrity TEXT NOT NULL DEFAULT 'unknown'
+                    );
+                    CREATE INDEX IF NOT EXISTS idx_backups_created ON backups(created_at);
+                    PRAGMA user_version = 1;
+                """)
+            if version < 2:
+                # 검증 기록 (마지막 전체 검사 시각, 검증 소요 시간)
+                conn.executescript("""
+                    ALTER TABLE backups ADD COLUMN checked_at TEXT;
+                    ALTER TABLE backups ADD COLUMN verify_seconds REAL NOT NULL DEFAULT 0;
+                    PRAGMA user_version = 2;
+                """)
+            if version < 3:
+                # 자동 백업 구분과 자동 백업 실행 기록
+                conn.executescript("""
+                    ALTER TABLE backups ADD COLUMN kind TEXT NOT NULL DEFAULT 'manual';
+                    CREATE TABLE IF NOT EXISTS backup_runs (
+                        id INTEGER PRIMARY KEY AUTOINCREMENT,
+                        started_at TEXT NOT NULL,
+                        finished_at TEXT NOT NULL,
+                        trigger TEXT NOT NULL,
+                        success INTEGER NOT NULL,
+                        message TEXT NOT NULL DEFAULT '',
+                        filename TEXT,
+                        pruned INTEGER NOT NULL DEFAULT 0
+                    );
+                    PRAGMA user_version = 3;
+                """)
+        finally:
+            conn.close()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.path, timeout=5.0)
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    def _query(self, func):
+        """연결을 열어 func(conn) 실행 후 닫기 (with 블록은 커밋/롤백만 담당)"""
+        conn = self._connect()
+        try:
+            with conn:
+                return func(conn)
+        finally:
+            conn.close()
+
+    @staticmethod
+    def _row_to_entry(row) -> BackupEntry:
+        return BackupEntry(
+            filename=row['filename'],
+            base_name=row['base_name'],
+            created_at=datetime.fromisoformat(row['created_at']),
+            database_size=row['database_size'],
+            stored_size=row['stored_size'],
+            file_size=row['file_size'],
+            mtime=row['mtime'],
+            checksum=row['checksum'],
+            integrity=row['integrity'],
+            checked_at=datetime.fromisoformat(row['checked_at']) if row['checked_at'] else None,
+            verify_seconds=row['verify_seconds'],
+            kind=row['kind'],
+        )
+
+    def add(self, entry: BackupEntry):
+        """백업 기록 (같은 파일명이 있으면 교체)"""
+        self._query(lambda conn: conn.execute("""
+            INSERT OR REPLACE INTO backups
+                (filename, base_name, created_at, database_size, stored_size,
+                 file_size, mtime, checksum, integrity, checked_at, verify_seconds, kind)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """, (entry.filename, entry.base_name, entry.created_at.isoformat(sep=' '),
+              entry.database_size, entry.stored_size, entry.file_size, entry.mtime,
+              entry.checksum, entry.integrity,
+              entry.checked_at.isoformat(sep=' ') if entry.checked_at else None,
+              entry.verify_seconds, entry.kind)))
+
+    def remove(self, filename: str):
+        """백업 기록 삭제"""
+        self._query(lambda conn: conn.execute("DELETE FROM backups WHERE filename = ?", (filename,)))
+
+    def remove_many(self, filenames: List[str]):
+        """여러 백업 기록을 한 트랜잭션으로 삭제"""
+        self._query(lambda conn: conn.executemany(
+            "DELETE FROM backups WHERE filename = ?", [(filename,) for filename in filenames]
+        ))
+
+    def get(self, filename: str) -> Optional[BackupEntry]:
+        """파일명으로 백업 기록 조회"""
+        row = self._query(lambda conn: conn.execute(
+            "SELECT * FROM backups WHERE filename = ?", (filename,)
+        ).fetchone())
+        return self._row_to_entry(row) if row else None
+
+    def set_integrity(self, filename: str, integrity: str, checksum: Optional[str] = None,
+                      checked_at: Optional[datetime] = None, verify_seconds: Optional[float] = None):
+        """무결성 상태 갱신 (체크섬, 전체 검사 시각, 검증 시간은 주어진 것만)"""
+        columns = {'integrity': integrity}
+        if checksum is not None:
+            columns['checksum'] = checksum
+        if checked_at is not None:
+            columns['checked_at'] = checked_at.isoformat(sep=' ')
+        if verify_seconds is not None:
+            columns['verify_seconds'] = verify_seconds
+        assignments = ", ".join(f"{column} = ?" for column in columns)
+        self._query(lambda conn: conn.execute(
+            f"UPDATE backups SET {assignments} WHERE filename = ?", (*columns.values(), filename)
+        ))
+
+    def list_unchecked(self, checked_before: datetime) -> List[BackupEntry]:
+        """전체 무결성 검사를 한 적이 없거나 checked_before 이전에 한 백업 (오래된 검사 먼저)"""
+        rows = self._query(lambda conn: conn.execute("""
+            SELECT * FROM backups
+            WHERE integrity != 'corrupt' AND (checked_at IS NULL OR checked_at < ?)
+            ORDER BY checked_at IS NOT NULL, checked_at, created_at DESC
+        """, (checked_before.isoformat(sep=' '),)).fetchall())
+        return [self._row_to_entry(row) for row in rows]
+
+    def list_kind(self, kind: str) -> List[BackupEntry]:
+        """종류('manual' / 'auto')별 백업 기록 (최신순)"""
+        rows = self._query(lambda conn: conn.execute(
+            "SELECT * FROM backups WHERE kind = ? ORDER BY created_at DESC, filename DESC", (kind,)
+        ).fetchall())
+        return [self._row_to_entry(row) for row in rows]
+
+    def latest(self, kind: str) -> Optional[BackupEntry]:
+        """종류('manual' / 'auto')별 가장 최근 백업 기록"""
+        row = self._query(lambda conn: conn.execute(
+            "SELECT * FROM backups WHERE kind = ? ORDER BY created_at DESC, filename DESC LIMIT 1", (kind,)
+        ).fetchone())
+        return self._row_to_entry(row) if row else None
+
+    def add_run(self, run: BackupRun):
+        """자동 백업 실행 기록 추가"""
+        self._query(lambda conn: conn.execute("""
+            INSERT INTO backup_runs (started_at, finished_at, trigger, success, message, filename, pruned)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+        """, (run.started_at.isoformat(sep=' '), run.finished_at.isoformat(sep=' '), run.trigger,
+              int(run.success), run.message, run.filename, run.pruned)))
+
+    def last_run(self) -> Optional[BackupRun]:
+        """마지막 자동 백업 실행 기록"""
+        row = self._query(lambda conn: conn.execute(
+            "SELECT * FROM backup_runs ORDER BY id DESC LIMIT 1"
+        ).fetchone())
+        if row is None:
+            return None
+        return BackupRun(
+            started_at=datetime.fromisoformat(row['started_at']),
+            finished_at=datetime.fromisoformat(row['finished_at']),
+            trigger=row['trigger'],
+            success=bool(row['success']),
+            message=row['message'],
+            filename=row['filename'],
+            pruned=row['pruned'],
+        )
+
+    def list_entries(self) -> List[Tuple[BackupEntry, int]]:
+        """
+        백업 목록 (최신순)
+
+        Returns:
+            [(백업 기록, 같은 표시 이름 중 오래된 순 번호(0부터)), ...]
+        """
+        rows = self._query(lambda conn: conn.execute("""
+            SELECT *,
+                   ROW_NUMBER() OVER (PARTITION BY base_name ORDER BY created_at, filename) - 1 AS ordinal
+            FROM backups
+            ORDER BY created_at DESC, filename DESC
+        """).fetchall())
+        return [(self._row_to_entry(row), row['ordinal']) for row in rows]
+
+    def reconcile(self, files: Dict[str, os.stat_result],
+                  describe: Callable[[str, os.stat_result], BackupEntry]) -> Tuple[int, int, int]:
+        """
+        실제 백업 파일과 카탈로그 맞추기
+
+        Args:
+            files: 백업 디렉토리의 백업 파일 {파일명: stat 결과}
+            describe: 카탈로그에 없거나 바뀐 파일의 기록을 만드는 함수
+
+        Returns:
+            (추가, 갱신, 삭제된 기록 수)
+        """
+        known = {
+            row['filename']: (row['file_size'], row['mtime'])
+            for row in self._query(lambda conn: conn.execute(
+                "SELECT filename, file_size, mtime FROM backups"
+            ).fetchall())
+        }
+        added = updated = 0
+        for filename, stat in files.items():
+            previous = known.get(filename)
+            if previous == (stat.st_size, stat.st_mtime):
+                continue
+            self.add(describe(filename, stat))
+            if previous is None:
+                added += 1
+            else:
+                updated += 1
+        removed = [filename for filename in known if filename not in files]
+        if removed:
+            self._query(lambda conn: conn.executemany(
+                "DELETE FROM backups WHERE filename = ?", [(filename,) for filename in removed]
+            ))
+        return added, updated, len(removed)
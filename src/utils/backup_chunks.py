@@ -0,0 +1,165 @@
+"""
+증분 백업용 내용 주소 청크 저장소
+"""
+import hashlib
+import json
+import os
+import threading
+import zlib
+from typing import Callable, Iterable, List, Optional, Set
+
+
+class ChunkStore:
+    """데이터베이스 파일을 고정 크기 청크로 나눠 내용(SHA-256)별로 한 번만 저장하는 저장소
+
+    SQLite 는 페이지 단위로 제자리에서 고쳐 쓰므로 페이지 경계에 맞춘 고정 크기
+    청크로 나누면 바뀌지 않은 부분은 이전 백업과 같은 청크가 된다. 백업 하나는
+    청크 해시 목록(매니페스트)만 남기고, 새로 생긴 청크만 zlib 으로 압축해 저장한다.
+
+    저장 구조: <root>/<해시 앞 2자>/<해시>
+    """
+
+    CHUNK_SIZE = 64 * 1024  # SQLite 페이지 크기(최대 64KB)의 배수
+    MANIFEST_FORMAT = 1
+
+    def __init__(self, root: str):
+        """
+        초기화
+
+        Args:
+            root: 청크 저장 디렉토리
+        """
+        self.root = root
+        # 청크 저장 ~ 매니페스트 저장 사이에 정리(collect_garbage)가 끼어들면 아직 매니페스트에
+        # 없는 새 청크가 지워지므로, 호출하는 쪽은 매니페스트 저장까지 이 잠금을 잡는다.
+        self.lock = threading.RLock()
+
+    def _chunk_path(self, digest: str) -> str:
+        return os.path.join(self.root, digest[:2], digest)
+
+    def write_file(self, source_path: str,
+                   progress: Optional[Callable[[int, int], None]] = None,
+                   is_cancelled: Optional[Callable[[], bool]] = None) -> dict:
+        """
+        파일을 청크로 나눠 저장하고 매니페스트 반환
+
+        Args:
+            source_path: 저장할 파일 (백업 중 바뀌지 않는 복사본)
+            progress: 청크마다 (처리한 바이트, 전체 바이트)로 호출
+            is_cancelled: True 를 반환하면 중단 (이미 저장한 청크는 다음 정리 때 제거됨)
+
+        Returns:
+            매니페스트 {'format', 'size', 'chunk_size', 'chunks', 'stored_bytes'}
+            stored_bytes 는 이번에 새로 저장한 청크의 크기 합
+
+        Raises:
+            InterruptedError: is_cancelled 가 True 를 반환한 경우
+        """
+        total = os.path.getsize(source_path)
+        chunks: List[str] = []
+        stored_bytes = 0
+        done = 0
+        with self.lock, open(source_path, 'rb') as source:
+            while True:
+                if is_cancelled is not None and is_cancelled():
+                    raise InterruptedError()
+                data = source.read(self.CHUNK_SIZE)
+                if not data:
+                    break
+                digest = hashlib.sha256(data).hexdigest()
+                stored_bytes += self._put(digest, data)
+                chunks.append(digest)
+                done += len(data)
+                if progress is not None and total:
+                    progress(done, total)
+        return {
+            'format': self.MANIFEST_FORMAT,
+            'size': done,
+            'chunk_size': self.CHUNK_SIZE,
+            'chunks': chunks,
+            'stored_bytes': stored_bytes,
+        }
+
+    def _put(self, digest: str, data: bytes) -> int:
+        """청크 저장 (이미 있으면 건너뜀) – 새로 쓴 바이트 수 반환"""
+        path = self._chunk_path(digest)
+        if os.path.exists(path):
+            return 0
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        compressed = zlib.compress(data, 6)
+        # 임시 파일에 쓴 뒤 이름 변경 – 중간에 실패해도 깨진 청크가 남지 않음
+        temp_path = path + ".tmp"
+        with open(temp_path, 'wb') as f:
+            f.write(compressed)
+        os.replace(temp_path, path)
+        return len(compressed)
+
+    def read_file(self, manifest: dict, target_path: str,
+                  progress: Optional[Callable[[int, int], None]] = None,
+                  is_cancelled: Optional[Callable[[], bool]] = None):
+        """매니페스트대로 청크를 이어 붙여 target_path 에 파일 복원
+
+        Args:
+            manifest: 복원할 파일의 매니페스트
+            target_path: 복원할 경로
+            progress: 청크마다 (처리한 바이트, 전체 바이트)로 호출
+            is_cancelled: True 를 반환하면 중단
+
+        Raises:
+            ValueError: 청크가 없거나 내용이 해시와 다른 경우
+            InterruptedError: is_cancelled 가 True 를 반환한 경우
+        """
+        total = manifest.get('size', 0)
+        done = 0
+        with open(target_path, 'wb') as target:
+            for digest in manifest['chunks']:
+                if is_cancelled is not None and is_cancelled():
+                    raise InterruptedError()
+                path = self._chunk_path(digest)
+                try:
+                    with open(path, 'rb') as f:
+                        data = zlib.decompress(f.read())
+                except (OSError, zlib.error) as e:
+                    raise ValueError(f"백업 청크를 읽을 수 없습니다: {digest[:12]} ({e})")
+                if hashlib.sha256(data).hexdigest() != digest:
+                    raise ValueError(f"백업 청크가 손상되었습니다: {digest[:12]}")
+                target.write(data)
+                done += len(data)
+                if progress is not None and total:
+                    progress(done, total)
+
+    def collect_garbage(self, manifests: Iterable[dict]) -> int:
+        """어느 매니페스트에서도 쓰지 않는 청크 삭제 – 삭제한 청크 수 반환"""
+        with self.lock:
+            referenced: Set[str] = set()
+            for manifest in manifests:
+                referenced.update(manifest.get('chunks', []))
+            removed = 0
+            if not os.path.isdir(self.root):
+                return 0
+            for prefix in os.listdir(self.root):
+                directory = os.path.join(self.root, prefix)
+                if not os.path.isdir(directory):
+                    continue
+                for name in os.listdir(directory):
+                    if name not in referenced:
+                        try:
+                            os.remove(os.path.join(directory, name))
+                            removed += 1
+                        except OSError:
+                            pass
+            return removed
+
+
+def load_manifest(path: str) -> dict:
+    """매니페스트 파일 읽기"""
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def save_manifest(path: str, manifest: dict):
+    """매니페스트 파일 저장 (임시 파일에 쓴 뒤 이름 변경)"""
+    temp_path = path + ".tmp"
+    with open(temp_path, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f)
+    os.replace(temp_path, path)
@@ -0,0 +1,153 @@
+"""
+백업과 현재 데이터베이스 비교 (행 해시)
+"""
+import sqlite3
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+
+@dataclass
+class TableDiff:
+    """테이블 하나의 비교 결과 (id 기준)"""
+    table: str
+    only_in_backup: int = 0   # 백업에만 있는 행 (복원하면 되살아남)
+    only_in_live: int = 0     # 현재 DB에만 있는 행 (복원하면 사라짐)
+    changed: int = 0          # 양쪽에 있지만 내용이 다른 행
+    # 종류별 예시 id (최대 DatabaseDiffer.MAX_EXAMPLES 개)
+    backup_examples: List[int] = field(default_factory=list)
+    live_examples: List[int] = field(default_factory=list)
+    changed_examples: List[int] = field(default_factory=list)
+
+    @property
+    def is_same(self) -> bool:
+        return not (self.only_in_backup or self.only_in_live or self.changed)
+
+
+@dataclass
+class DatabaseDiff:
+    """백업과 현재 DB 비교 결과"""
+    tables: List[TableDiff] = field(default_factory=list)
+    project_titles: Dict[int, str] = field(default_factory=dict)  # 예시 프로젝트 id → 제목
+
+    @property
+    def is_same(self) -> bool:
+        return all(table.is_same for table in self.tables)
+
+    def get(self, table: str) -> Optional[TableDiff]:
+        for table_diff in self.tables:
+            if table_diff.table == table:
+                return table_diff
+        return None
+
+
+class DatabaseDiffer:
+    """두 SQLite DB의 테이블을 기본 키(id) 순서로 함께 읽으며 행 해시를 비교하는 비교기
+
+    각 DB에서 양쪽에 있는 컬럼만 id 순서로 FETCH_SIZE 씩 읽어 행마다 해시로 줄인 뒤
+    병합 비교하므로, 모델 객체를 만들지 않고 메모리 사용량은 DB 크기와 무관하다.
+    id 순서 읽기는 rowid(INTEGER PRIMARY KEY) 순서 그대로라 정렬 비용이 없다.
+
+    두 해시를 같은 프로세스 안에서 바로 비교하므로 파이썬 내장 hash()(64비트)를 쓰고,
+    텍스트는 디코딩하지 않도록 bytes 로 읽는다 (연결의 text_factory 를 바꾸므로
+    비교 전용 연결을 넘겨야 한다).
+    """
+
+    TABLES = ('projects', 'tasks', 'notes')
+    FETCH_SIZE = 4096
+    MAX_EXAMPLES = 20
+
+    def __init__(self, backup_conn: sqlite3.Connection, live_conn: sqlite3.Connection):
+        """
+        초기화
+
+        Args:
+            backup_conn: 백업 DB 연결 (읽기 전용, 비교 전용)
+            live_conn: 현재 DB 연결 (비교 전용) – 비교하는 동안 같은 시점을 보도록 읽기 트랜잭션 안에서 사용
+        """
+        self.backup_conn = backup_conn
+        self.live_conn = live_conn
+        for conn in (backup_conn, live_conn):
+            conn.text_factory = bytes
+
+    def diff(self, progress: Optional[Callable[[int, int], None]] = None,
+             is_cancelled: Optional[Callable[[], bool]] = None) -> DatabaseDiff:
+        """
+        모든 테이블 비교
+
+        Args:
+            progress: 테이블마다 (비교한 테이블 수, 전체 테이블 수)로 호출
+            is_cancelled: True 를 반환하면 중단
+
+        Raises:
+            InterruptedError: is_cancelled 가 True 를 반환한 경우
+        """
+        result = DatabaseDiff()
+        for index, table in enumerate(self.TABLES):
+            result.tables.append(self.diff_table(table, is_cancelled))
+            if progress is not None:
+                progress(index + 1, len(self.TABLES))
+        return result
+
+    def _columns(self, conn: sqlite3.Connection, table: str) -> List[str]:
+        return [row[1].decode('utf-8') for row in conn.execute(f"PRAGMA table_info({table})")]
+
+    def _rows(self, conn: sqlite3.Connection, table: str, columns: List[str],
+              is_cancelled: Optional[Callable[[], bool]]) -> Iterator[Tuple[int, int]]:
+        """(id, 행 해시)를 id 순서로 스트리밍"""
+        selected = ", ".join(['id'] + columns)
+        cursor = conn.execute(f"SELECT {selected} FROM {table} ORDER BY id")
+        while True:
+            if is_cancelled is not None and is_cancelled():
+                raise InterruptedError()
+            rows = cursor.fetchmany(self.FETCH_SIZE)
+            if not rows:
+                return
+            for row in rows:
+                yield row[0], hash(row[1:])
+
+    def diff_table(self, table: str, is_cancelled: Optional[Callable[[], bool]] = None) -> TableDiff:
+        """테이블 하나 비교 (id 순서 병합)"""
+        result = TableDiff(table)
+        backup_columns = self._columns(self.backup_conn, table)
+        live_columns = self._columns(self.live_conn, table)
+        if not backup_columns or not live_columns:
+            return result  # 한쪽에 테이블이 없음 (오래된 백업)
+        # 양쪽 스키마에 모두 있는 컬럼만 비교 (백업의 스키마 버전이 낮을 수 있음)
+        common = set(backup_columns)
+        columns = [column for column in live_columns if column in common and column != 'id']
+
+        limit = self.MAX_EXAMPLES
+        backup_rows = self._rows(self.backup_conn, table, columns, is_cancelled)
+        live_rows = self._rows(self.live_conn, table, columns, is_cancelled)
+        backup_row = next(backup_rows, None)
+        live_row = next(live_rows, None)
+        while backup_row is not None and live_row is not None:
+            backup_id, live_id = backup_row[0], live_row[0]
+            if backup_id == live_id:
+                if backup_row[1] != live_row[1]:
+                    result.changed += 1
+                    if len(result.changed_examples) < limit:
+                        result.changed_examples.append(backup_id)
+                backup_row = next(backup_rows, None)
+                live_row = next(live_rows, None)
+            elif backup_id < live_id:
+                result.only_in_backup += 1
+                if len(result.backup_examples) < limit:
+                    result.backup_examples.append(backup_id)
+                backup_row = next(backup_rows, None)
+            else:
+                result.only_in_live += 1
+                if len(result.live_examples) < limit:
+                    result.live_examples.append(live_id)
+                live_row = next(live_rows, None)
+        while backup_row is not None:
+            result.only_in_backup += 1
+            if len(result.backup_examples) < limit:
+                result.backup_examples.append(backup_row[0])
+            backup_row = next(backup_rows, None)
+        while live_row is not None:
+            result.only_in_live += 1
+            if len(result.live_examples) < limit:
+                result.live_examples.append(live_row[0])
+            live_row = next(live_rows, None)
+        return result
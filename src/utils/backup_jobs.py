@@ -0,0 +1,292 @@
+"""
+백업 작업 대기열
+"""
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable, List, Optional, Tuple
+from PySide6.QtCore import QObject, Signal
+from utils.backup_manager import BackupCancelled
+
+
+@dataclass(eq=False)
+class BackupJob:
+    """대기열에 넣은 백업 작업 하나"""
+    id: int
+    kind: str                      # 'create' / 'restore' / 'delete' / 'verify' / 'verify_stale' / 'prune' / 'auto' / 'export' / 'diff' / 'open'
+    label: str                     # 상태바에 표시할 설명
+    run: Callable[['BackupJob'], Tuple[bool, str]]  # 작업 스레드에서 실행 – (성공 여부, 메시지) 반환
+    callback: Optional[Callable[['BackupJob'], None]] = None  # 끝나면 GUI 스레드에서 호출
+    background: bool = False       # 사용자가 요청하지 않은 유지보수 작업 (자동 백업, 주기 검사)
+    state: str = 'pending'
+    done: int = 0                  # 진행률 (처리한 양, 전체 양 – 모르면 0)
+    total: int = 0
+    success: bool = False
+    message: str = ""
+    result: Any = None             # 메시지 외의 결과 (비교 결과, 연 백업 등)
+    cancel_event: threading.Event = field(default_factory=threading.Event, repr=False)
+
+    # 상태
+    PENDING = 'pending'
+    RUNNING = 'running'
+    DONE = 'done'
+    FAILED = 'failed'
+    CANCELLED = 'cancelled'
+
+    @property
+    def percent(self) -> Optional[int]:
+        """진행률(%) – 전체 양을 모르면 None"""
+        return self.done * 100 // self.total if self.total > 0 else None
+
+    @property
+    def finished(self) -> bool:
+        return self.state in (self.DONE, self.FAILED, self.CANCELLED)
+
+    def is_cancelled(self) -> bool:
+        """취소 요청 여부 (작업 함수가 단계마다 확인)"""
+        return self.cancel_event.is_set()
+
+
+class BackupJobQueue(QObject):
+    """백업·검증·복원·내보내기 작업을 한 작업 스레드에서 넣은 순서대로(FIFO) 실행하는 대기열
+
+    MainWindow 가 하나 만들어 두고 백업 창, 자동 백업, 주기 검사가 함께 쓴다. 백업 파일을
+    다루는 작업이 한 번에 하나씩만 실행되므로 복원 중에 자동 백업이 끼어들거나 검사 중인
+    백업이 삭제되지 않는다. 창을 닫아도 작업은 계속 실행되고, 상태는 시그널로 알린다.
+
+    취소는 협조적이다: cancel() 은 대기 중인 작업은 바로 빼고, 실행 중인 작업에는
+    cancel_event 를 설정해 작업 함수가 다음 단계에서 멈추게 한다.
+    """
+
+    # GUI 스레드에서 (BackupJob) 과 함께 전달
+    job_added = Signal(object)
+    job_started = Signal(object)
+    job_progress = Signal(object)  # 진행률(%)이 바뀔 때만
+    job_finished = Signal(object)
+    _job_started = Signal(object)   # 작업 스레드 → GUI 스레드
+    _job_progress = Signal(object)
+    _job_finished = Signal(object)
+
+    def __init__(self, backup_manager, parent: Optional[QObject] = None):
+        """
+        초기화
+
+        Args:
+            backup_manager: 작업을 실행할 BackupManager
+            parent: 부모 QObject
+        """
+        super().__init__(parent)
+        self.backup_manager = backup_manager
+        self._pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="backup-jobs")
+        self._lock = threading.Lock()  # 작업 상태 전환 (대기 중 취소 ↔ 실행 시작)
+        self._jobs: List[BackupJob] = []  # 끝나지 않은 작업 (넣은 순서) – GUI 스레드에서만 변경
+        self._next_id = 1
+        self._shutdown = False
+        self._job_started.connect(self._on_job_started)
+        self._job_progress.connect(self._on_job_progress)
+        self._job_finished.connect(self._on_job_finished)
+
+    # ------------------------------------------------------------------
+    # 대기열
+    # ------------------------------------------------------------------
+    def submit(self, kind: str, label: str, run: Callable[[BackupJob], Tuple[bool, str]],
+               callback: Optional[Callable[[BackupJob], None]] = None,
+               background: bool = False) -> Optional[BackupJob]:
+        """
+        작업 추가
+
+        Args:
+            kind: 작업 종류
+            label: 상태바에 표시할 설명
+            run: 작업 스레드에서 job 과 함께 호출할 함수 – (성공 여부, 메시지) 반환
+            callback: 끝나면(취소 포함) GUI 스레드에서 job 과 함께 호출
+            background: 유지보수 작업 여부
+
+        Returns:
+            BackupJob (종료된 대기열이면 None)
+        """
+        if self._shutdown:
+            return None
+        job = BackupJob(self._next_id, kind, label, run, callback, background)
+        self._next_id += 1
+        self._jobs.append(job)
+        self._pool.submit(self._execute, job)
+        self.job_added.emit(job)
+        return job
+
+    def jobs(self) -> List[BackupJob]:
+        """끝나지 않은 작업 (넣은 순서 – 실행 중인 작업이 맨 앞)"""
+        return list(self._jobs)
+
+    def current(self) -> Optional[BackupJob]:
+        """실행 중인 작업"""
+        for job in self._jobs:
+            if job.state == BackupJob.RUNNING:
+                return job
+        return None
+
+    def cancel(self, job: BackupJob):
+        """작업 취소 (GUI 스레드) – 대기 중이면 바로 빼고, 실행 중이면 다음 단계에서 멈추도록 요청"""
+        job.cancel_event.set()
+        with self._lock:
+            if job.state != BackupJob.PENDING:
+                return
+            job.state = BackupJob.CANCELLED
+        job.message = "작업이 취소되었습니다."
+        self._on_job_finished(job)
+
+    def cancel_all(self):
+        """모든 작업 취소"""
+        for job in self.jobs():
+            self.cancel(job)
+
+    def shutdown(self):
+        """대기 중인 작업은 버리고 실행 중인 작업은 취소를 요청한 뒤 끝날 때까지 대기
+
+        취소할 수 없는 단계(복원의 DB 파일 교체 등)는 마칠 때까지 기다린다.
+        """
+        if self._shutdown:
+            return
+        self._shutdown = True
+        for job in self.jobs():
+            job.cancel_event.set()
+            with self._lock:
+                if job.state == BackupJob.PENDING:
+                    job.state = BackupJob.CANCELLED
+        self._pool.shutdown(wait=True)
+
+    # ------------------------------------------------------------------
+    # 실행 (작업 스레드)
+    # ------------------------------------------------------------------
+    def _execute(self, job: BackupJob):
+        with self._lock:
+            if job.state != BackupJob.PENDING:
+                return  # 대기 중에 취소됨
+            job.state = BackupJob.RUNNING
+        self._job_started.emit(job)
+        try:
+            job.success, job.message = job.run(job)
+        except BackupCancelled as e:
+            job.success, job.message = False, str(e) or "작업이 취소되었습니다."
+        except Exception as e:
+            job.success, job.message = False, f"작업 중 오류가 발생했습니다: {str(e)}"
+        if job.success:
+            job.state = BackupJob.DONE
+        elif job.is_cancelled():
+            job.state = BackupJob.CANCELLED
+        else:
+            job.state = BackupJob.FAILED
+        self._job_finished.emit(job)
+
+    def progress_of(self, job: BackupJob) -> Callable[[int, int], None]:
+        """작업 함수에 넘길 progress(done, total) – 진행률(%)이 바뀔 때만 GUI 스레드로 알림"""
+        def _report(done: int, total: int):
+            previous = job.percent
+            job.done, job.total = done, total
+            if job.percent != previous:
+                self._job_progress.emit(job)
+        return _report
+
+    # ------------------------------------------------------------------
+    # GUI 스레드
+    # ------------------------------------------------------------------
+    def _on_job_started(self, job: BackupJob):
+        if not job.finished:
+            self.job_started.emit(job)
+
+    def _on_job_progress(self, job: BackupJob):
+        if not job.finished:
+            self.job_progress.emit(job)
+
+    def _on_job_finished(self, job: BackupJob):
+        if job not in self._jobs:
+            return
+        self._jobs.remove(job)
+        # 상태 표시를 먼저 갱신 (콜백이 결과 창을 띄우면 닫을 때까지 돌아오지 않음)
+        self.job_finished.emit(job)
+        if job.callback is not None:
+            job.callback(job)
+
+    # ------------------------------------------------------------------
+    # 작업 종류별 추가
+    # ------------------------------------------------------------------
+    def create_backup(self, name: Optional[str], incremental: bool = False,
+                      callback: Optional[Callable[[BackupJob], None]] = None) -> Optional[BackupJob]:
+        """백업 생성"""
+        manager = self.backup_manager
+        label = "증분 백업 만드는 중" if incremental else "백업 만드는 중"
+        return self.submit('create', label, lambda job: manager.create_backup(
+            name, incremental, progress=self.progress_of(job), cancel_event=job.cancel_event
+        ), callback)
+
+    def restore_backup(self, filename: str, should_backup: bool = True,
+                       replace: Optional[Callable[[str], None]] = None,
+                       callback: Optional[Callable[[BackupJob], None]] = None) -> Optional[BackupJob]:
+        """백업 복원 (DB 파일 교체 직전까지 취소 가능)"""
+        manager = self.backup_manager
+        return self.submit('restore', f"'{filename}' 복원하는 중", lambda job: manager.restore_backup(
+            filename, should_backup, replace, progress=self.progress_of(job), cancel_event=job.cancel_event
+        ), callback)
+
+    def delete_backup(self, filename: str,
+                      callback: Optional[Callable[[BackupJob], None]] = None) -> Optional[BackupJob]:
+        """백업 삭제"""
+        manager = self.backup_manager
+        return self.submit('delete', f"'{filename}' 삭제하는 중",
+                           lambda job: manager.delete_backup(filename), callback)
+
+    def verify_backup(self, filename: str,
+                      callback: Optional[Callable[[BackupJob], None]] = None) -> Optional[BackupJob]:
+        """백업 하나 전체 무결성 검사"""
+        manager = self.backup_manager
+        return self.submit('verify', f"'{filename}' 검사하는 중", lambda job: manager.verify_backup(
+            filename, manager.VERIFY_FULL, progress=self.progress_of(job), cancel_event=job.cancel_event
+        ), callback)
+
+    def verify_stale_backups(self, callback: Optional[Callable[[BackupJob], None]] = None) -> Optional[BackupJob]:
+        """오래 검사하지 않은 백업 전체 무결성 검사 (유지보수 작업)"""
+        manager = self.backup_manager
+        return self.submit('verify_stale', "백업 무결성 검사하는 중", lambda job: manager.verify_stale_backups(
+            cancel_event=job.cancel_event, progress=self.progress_of(job)
+        ), callback, background=True)
+
+    def prune_backups(self, callback: Optional[Callable[[BackupJob], None]] = None) -> Optional[BackupJob]:
+        """보존 정책에 따라 오래된 자동 백업 정리 (유지보수 작업) – job.result 는 삭제한 백업 수"""
+        manager = self.backup_manager
+
+        def _run(job: BackupJob) -> Tuple[bool, str]:
+            job.result = manager.prune_backups(cancel_event=job.cancel_event)
+            if job.result:
+                return True, f"오래된 자동 백업 {job.result}개를 정리했습니다."
+            return True, "정리할 자동 백업이 없습니다."
+        return self.submit('prune', "오래된 자동 백업 정리하는 중", _run, callback, background=True)
+
+    def export_backup(self, filename: str, target_path: str,
+                      callback: Optional[Callable[[BackupJob], None]] = None) -> Optional[BackupJob]:
+        """백업을 일반 데이터베이스 파일로 내보내기"""
+        manager = self.backup_manager
+        return self.submit('export', f"'{filename}' 내보내는 중", lambda job: manager.export_backup(
+            filename, target_path, progress=self.progress_of(job), cancel_event=job.cancel_event
+        ), callback)
+
+    def diff_backup(self, filename: str,
+                    callback: Optional[Callable[[BackupJob], None]] = None) -> Optional[BackupJob]:
+        """백업과 현재 데이터 비교 – job.result 는 DatabaseDiff"""
+        manager = self.backup_manager
+
+        def _run(job: BackupJob) -> Tuple[bool, str]:
+            job.result = manager.diff_backup(filename, progress=self.progress_of(job),
+                                             cancel_event=job.cancel_event)
+            return True, ""
+        return self.submit('diff', f"'{filename}' 현재 데이터와 비교하는 중", _run, callback)
+
+    def open_backup(self, filename: str,
+                    callback: Optional[Callable[[BackupJob], None]] = None) -> Optional[BackupJob]:
+        """살펴보기용으로 백업 열기 – job.result 는 BackupSnapshot (받은 쪽이 close())"""
+        manager = self.backup_manager
+
+        def _run(job: BackupJob) -> Tuple[bool, str]:
+            job.result = manager.open_backup(filename, progress=self.progress_of(job),
+                                             cancel_event=job.cancel_event)
+            return True, ""
+        return self.submit('open', f"'{filename}' 여는 중", _run, callback)
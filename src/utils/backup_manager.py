@@ -1,38 +1,180 @@
 """
 백업/복원 관리자
 """
+import bz2
+import gzip
+import hashlib
+import lzma
 import os
 import shutil
 import sqlite3
-from datetime import datetime
-from typing import Tuple, Optional
+import struct
+import tempfile
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import Callable, List, Tuple, Optional
 from pathlib import Path
 from utils.helpers import format_datetime
+from utils.backup_chunks import ChunkStore, load_manifest, save_manifest
+from utils.backup_catalog import BackupCatalog, BackupEntry
+from utils.backup_diff import DatabaseDiff, DatabaseDiffer
 import re
 
 
+class BackupCancelled(Exception):
+    """사용자 요청으로 백업 작업이 취소됨"""
+
+
+class _HashingWriter:
+    """쓰는 내용의 SHA-256 을 함께 계산하는 파일 래퍼 (압축 파일을 다시 읽지 않고 체크섬 계산)"""
+    
+    def __init__(self, file):
+        self._file = file
+        self.digest = hashlib.sha256()
+    
+    def write(self, data) -> int:
+        self.digest.update(data)
+        return self._file.write(data)
+    
+    def flush(self):
+        self._file.flush()
+
+
+class BackupSnapshot:
+    """읽기 전용으로 연 백업 (ATTACH 하거나 직접 연결할 수 있는 DB 파일)
+    
+    일반(.db) 백업은 백업 파일을 그대로 쓰고, 압축/증분 백업은 임시 파일로 한 번만 풀어 둔다.
+    파일은 열어 둔 동안 바뀌지 않으므로 immutable URI 로 열어 잠금/저널 확인을 생략한다.
+    다 쓰면 close() 로 임시 파일을 지운다.
+    """
+    
+    def __init__(self, filename: str, path: str, temporary: bool):
+        self.filename = filename
+        self.path = path
+        self.temporary = temporary
+    
+    @property
+    def uri(self) -> str:
+        """읽기 전용 SQLite URI (ATTACH DATABASE 또는 sqlite3.connect(uri, uri=True) 용)"""
+        return Path(self.path).resolve().as_uri() + "?mode=ro&immutable=1"
+    
+    def connect(self) -> sqlite3.Connection:
+        """백업 DB에 읽기 전용으로 연결"""
+        return sqlite3.connect(self.uri, uri=True)
+    
+    def close(self):
+        """임시로 푼 파일 삭제"""
+        if self.temporary:
+            BackupManager._remove_file(self.path)
+            self.temporary = False
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
 class BackupManager:
     """백업/복원 관리자"""
     
-    def __init__(self, db_path: str):
+    # 온라인 백업 한 단계에서 복사할 페이지 수 (4KB 페이지 기준 4MB)
+    PAGES_PER_STEP = 1024
+    
+    # 압축 방식별 백업 파일 확장자 (None: 압축하지 않음)
+    EXTENSIONS = {
+        None: ".db",
+        'zlib': ".db.gz",   # gzip 형식 (zlib)
+        'lzma': ".db.xz",
+        'bz2': ".db.bz2",
+    }
+    
+    # 증분 백업 매니페스트 확장자 (내용은 chunks 디렉토리의 청크 해시 목록)
+    MANIFEST_EXTENSION = ".db.manifest"
+    
+    # 압축/해제 시 한 번에 처리할 크기
+    CHUNK_SIZE = 1024 * 1024
+    
+    # 살펴보기용으로 푼 임시 파일 확장자 (남아 있으면 다음 실행 때 삭제)
+    SNAPSHOT_EXTENSION = ".browse"
+    
+    # 백업 생성/복원 시 검증 수준
+    VERIFY_CHECKSUM = 'checksum'  # SHA-256 체크섬만 기록·대조 (DB 검사 생략)
+    VERIFY_QUICK = 'quick'        # 체크섬 + PRAGMA quick_check (인덱스 내용 대조 생략)
+    VERIFY_FULL = 'full'          # 체크섬 + PRAGMA integrity_check (DB 전체 검사)
+    VERIFY_LABELS = {
+        VERIFY_CHECKSUM: "체크섬",
+        VERIFY_QUICK: "quick_check",
+        VERIFY_FULL: "integrity_check",
+    }
+    
+    # 백그라운드 전체 검사 주기 – 마지막 전체 검사 후 이 기간이 지난 백업만 다시 검사
+    FULL_CHECK_INTERVAL = timedelta(days=7)
+    
+    # 백업 종류 – 자동 백업만 보존 정책에 따라 정리하고 사용자가 만든 백업은 지우지 않음
+    KIND_MANUAL = 'manual'
+    KIND_AUTO = 'auto'
+    AUTO_BACKUP_NAME = "auto"
+    
+    # 자동 백업 보존 정책: 하루 안은 시간마다, 한 달 안은 하루마다, 그 이후는 주마다 하나씩
+    RETENTION_HOURLY = timedelta(days=1)
+    RETENTION_DAILY = timedelta(days=30)
+    
+    def __init__(self, db_path: str, compression: Optional[str] = 'zlib',
+                 verify_level: str = VERIFY_QUICK):
         """
         초기화
         
         Args:
             db_path: 데이터베이스 파일 경로
+            compression: 새 백업의 압축 방식 ('zlib', 'lzma', 'bz2', None)
+            verify_level: 백업 생성/복원 시 검증 수준 (VERIFY_CHECKSUM, VERIFY_QUICK, VERIFY_FULL)
         """
+        if compression not in self.EXTENSIONS:
+            raise ValueError(f"지원하지 않는 압축 방식입니다: {compression}")
+        if verify_level not in self.VERIFY_LABELS:
+            raise ValueError(f"지원하지 않는 검증 수준입니다: {verify_level}")
         self.db_path = db_path
+        self.compression = compression
+        self.verify_level = verify_level
         self.backup_dir = os.path.join(os.path.dirname(db_path), "backups")
+        self.chunk_store = ChunkStore(os.path.join(self.backup_dir, "chunks"))
         
         # 백업 디렉토리 생성
         os.makedirs(self.backup_dir, exist_ok=True)
+        for filename in os.listdir(self.backup_dir):
+            if filename.endswith(self.SNAPSHOT_EXTENSION):
+                self._remove_file(os.path.join(self.backup_dir, filename))
+        
+        # 백업 목록 카탈로그 (처음 만들면 기존 백업 파일을 등록)
+        self.catalog = BackupCatalog(os.path.join(self.backup_dir, "catalog.sqlite"))
+        if self.catalog.created:
+            self.reconcile_catalog()
     
-    def create_backup(self, custom_name: Optional[str] = None) -> Tuple[bool, str]:
+    def create_backup(self, custom_name: Optional[str] = None, incremental: bool = False,
+                      progress: Optional[Callable[[int, int], None]] = None,
+                      cancel_event: Optional[threading.Event] = None,
+                      kind: str = KIND_MANUAL) -> Tuple[bool, str]:
         """
         백업 생성
         
+        SQLite 온라인 백업 API로 페이지를 나눠 복사하므로 프로그램이 DB를
+        사용하는 중에도 일관된 백업이 만들어지고, 복사 중에도 쓰기가 막히지 않는다.
+        압축 방식이 설정되어 있으면 복사본을 CHUNK_SIZE 씩 읽어 압축 파일로 저장한다.
+        
+        증분 백업은 복사본을 청크로 나눠 이전 백업에 없던 청크만 저장하고,
+        청크 목록을 담은 매니페스트(.db.manifest)를 백업 파일로 남긴다.
+        
+        원본은 따로 검사하지 않고 복사본만 verify_level 수준으로 한 번 검사한다
+        (백업 API는 페이지를 그대로 복사하므로 원본이 손상되었으면 복사본 검사에서 드러남).
+        
         Args:
             custom_name: 사용자 지정 백업 이름 (선택사항)
+            incremental: 증분(청크 중복 제거) 백업 여부
+            progress: 단계마다 (처리한 양, 전체 양)으로 호출 (작업 스레드에서 호출됨)
+            cancel_event: 설정되면 다음 단계에서 백업 중단
+            kind: 백업 종류 (KIND_MANUAL, KIND_AUTO)
             
         Returns:
             (성공 여부, 메시지)
@@ -44,47 +186,106 @@ class BackupManager:
             
             # 백업 파일명 생성
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            if custom_name:
-                # 사용자 지정 이름에서 특수문자 제거
-                safe_name = "".join(c for c in custom_name if c.isalnum() or c in (' ', '-', '_')).strip()
-                prefix = safe_name or "temporary"
-            else:
-                prefix = "temporary"
+            prefix = self._backup_prefix(custom_name)
+            if kind != self.KIND_AUTO and prefix == self.AUTO_BACKUP_NAME:
+                # 파일 이름만 보고 종류를 정하는 reconcile_catalog 에서 자동 백업으로 분류되어 정리될 수 있음
+                return False, f"'{self.AUTO_BACKUP_NAME}' 은(는) 자동 백업용 이름이라 사용할 수 없습니다."
 
-            backup_filename = f"{prefix}_{timestamp}.db"
+            extension = self.MANIFEST_EXTENSION if incremental else self.EXTENSIONS[self.compression]
+            backup_filename = f"{prefix}_{timestamp}{extension}"
             backup_path = os.path.join(self.backup_dir, backup_filename)
 
             # 중복 파일명 존재 시 넘버링 (temporary_20240101_120000 (1).db ...)
             counter = 1
             while os.path.exists(backup_path):
-                backup_filename = f"{prefix}_{timestamp} ({counter}).db"
+                backup_filename = f"{prefix}_{timestamp} ({counter}){extension}"
                 backup_path = os.path.join(self.backup_dir, backup_filename)
                 counter += 1
             
-            # 데이터베이스 무결성 검사
-            if not self._verify_database_integrity(self.db_path):
-                return False, "데이터베이스 파일이 손상되어 백업할 수 없습니다."
-            
-            # 파일 복사
-            shutil.copy2(self.db_path, backup_path)
+            # 온라인 백업 (임시 파일에 복사한 뒤 이름 변경 – 중간에 실패해도 불완전한 백업이 남지 않음)
+            # 압축/청크 분할하는 경우 복사와 그 처리가 진행률을 절반씩 차지
+            copy_progress = pack_progress = None
+            if progress is not None:
+                if incremental or self.compression:
+                    copy_progress = lambda done, total: progress(done * 500 // total, 1000)
+                    pack_progress = lambda done, total: progress(500 + done * 500 // total, 1000)
+                else:
+                    copy_progress = progress
+            temp_path = backup_path + ".part"
+            archive_path = backup_path + ".partz"
+            try:
+                self._copy_database(self.db_path, temp_path, copy_progress, cancel_event)
+                
+                # 백업 파일 검증 (verify_level 수준으로 한 번만)
+                started = time.perf_counter()
+                if not self._verify_database_integrity(temp_path, self.verify_level):
+                    self._remove_file(temp_path)
+                    return False, "데이터베이스 파일이 손상되어 백업할 수 없습니다."
+                verify_seconds = time.perf_counter() - started
+                
+                checksum = None
+                if incremental:
+                    # 매니페스트를 저장할 때까지 청크 정리가 끼어들지 않도록 잠금 유지
+                    with self.chunk_store.lock:
+                        try:
+                            manifest = self.chunk_store.write_file(
+                                temp_path, pack_progress, cancel_event.is_set if cancel_event else None
+                            )
+                        except InterruptedError:
+                            raise BackupCancelled()
+                        save_manifest(backup_path, manifest)
+                    os.remove(temp_path)
+                elif self.compression:
+                    # 압축하면서 압축 파일의 체크섬도 계산
+                    checksum = self._compress_file(temp_path, archive_path, pack_progress, cancel_event)
+                    os.remove(temp_path)
+                    os.replace(archive_path, backup_path)
+                else:
+                    os.replace(temp_path, backup_path)
+            except BackupCancelled:
+                self._remove_file(temp_path)
+                self._remove_file(archive_path)
+                return False, "백업이 취소되었습니다."
+            except Exception:
+                self._remove_file(temp_path)
+                self._remove_file(archive_path)
+                raise
             
-            # 백업 파일 검증
-            if not self._verify_database_integrity(backup_path):
-                os.remove(backup_path)
-                return False, "백업 파일 생성 중 오류가 발생했습니다."
+            # 카탈로그에 기록 (검사를 통과한 복사본으로 만든 백업)
+            started = time.perf_counter()
+            if checksum is None:
+                checksum = self._file_checksum(backup_path)
+            verify_seconds += time.perf_counter() - started
+            now = datetime.now()
+            self._record_backup(
+                backup_filename, now, integrity='ok', checksum=checksum,
+                checked_at=now if self.verify_level == self.VERIFY_FULL else None,
+                verify_seconds=verify_seconds, kind=kind
+            )
             
-            return True, f"백업이 성공적으로 생성되었습니다.\n파일: {backup_filename}"
+            return True, (f"백업이 성공적으로 생성되었습니다.\n파일: {backup_filename}\n"
+                          f"{self._verification_text(verify_seconds)}")
             
         except Exception as e:
             return False, f"백업 생성 중 오류가 발생했습니다: {str(e)}"
     
-    def restore_backup(self, backup_filename: str, should_backup: bool = True) -> Tuple[bool, str]:
+    def restore_backup(self, backup_filename: str, should_backup: bool = True,
+                       replace: Optional[Callable[[str], None]] = None,
+                       progress: Optional[Callable[[int, int], None]] = None,
+                       cancel_event: Optional[threading.Event] = None) -> Tuple[bool, str]:
         """
         백업 복원
         
+        백업을 DB 옆 임시 파일로 풀어 검증한 뒤 replace(임시 파일 경로)로 DB 파일과 교체한다.
+        프로그램이 DB를 사용 중이면 replace 에서 연결을 정리하고 교체 후 다시 열어야 한다
+        (Database.replace_database_file). 지정하지 않으면 os.replace 로 바로 교체한다.
+        
         Args:
             backup_filename: 복원할 백업 파일 이름
             should_backup: 현재 데이터 자동 백업 여부 (기본값: True)
+            replace: 임시 파일을 DB 파일 자리로 옮기는 함수 (선택사항)
+            progress: 백업을 푸는 동안 (처리한 양, 전체 양)으로 호출
+            cancel_event: 설정되면 DB 파일을 교체하기 전까지의 단계에서 중단
             
         Returns:
             (성공 여부, 메시지)
@@ -96,95 +297,339 @@ class BackupManager:
             if not os.path.exists(backup_path):
                 return False, "백업 파일을 찾을 수 없습니다."
             
-            # 백업 파일 무결성 검사
-            if not self._verify_database_integrity(backup_path):
-                return False, "백업 파일이 손상되어 복원할 수 없습니다."
+            # 백업 파일을 DB 옆 임시 파일로 풀어(복사해) 검증한 뒤 이름 변경으로 교체
+            # – 교체는 원자적이므로 복원 후 DB 파일을 다시 검사하지 않음
+            temp_path = self.db_path + ".restore"
+            try:
+                try:
+                    ok, message, verify_seconds = self._verify_backup_file(
+                        backup_filename, temp_path, self.verify_level, progress, cancel_event
+                    )
+                except BackupCancelled:
+                    return False, "복원이 취소되었습니다."
+                if not ok:
+                    return False, message
+                
+                # 현재 데이터베이스 백업 (사용자 선택에 따라)
+                if should_backup:
+                    current_backup_result = self.create_backup("before_restore", cancel_event=cancel_event)
+                    if not current_backup_result[0]:
+                        return False, f"복원 전 현재 데이터 백업 실패: {current_backup_result[1]}"
+                if cancel_event is not None and cancel_event.is_set():
+                    return False, "복원이 취소되었습니다."
+                
+                # 데이터베이스 복원 (이름 변경으로 한 번에 교체)
+                if replace is not None:
+                    replace(temp_path)
+                else:
+                    os.replace(temp_path, self.db_path)
+            finally:
+                self._remove_file(temp_path)
+            
+            return True, (f"백업이 성공적으로 복원되었습니다.\n파일: {backup_filename}\n"
+                          f"{self._verification_text(verify_seconds)}")
             
-            # 현재 데이터베이스 백업 (사용자 선택에 따라)
-            if should_backup:
-                current_backup_result = self.create_backup("before_restore")
-                if not current_backup_result[0]:
-                    return False, f"복원 전 현재 데이터 백업 실패: {current_backup_result[1]}"
+        except Exception as e:
+            return False, f"백업 복원 중 오류가 발생했습니다: {str(e)}"
+    
+    def open_backup(self, backup_filename: str,
+                    progress: Optional[Callable[[int, int], None]] = None,
+                    cancel_event: Optional[threading.Event] = None) -> BackupSnapshot:
+        """
+        백업을 읽기 전용으로 열기 (복원하지 않고 내용 확인, 프로젝트 단위 복원용)
+        
+        일반 백업은 복사하지 않고 그대로 열고, 압축/증분 백업은 임시 파일로 풀어 검증한다.
+        
+        Args:
+            backup_filename: 열 백업 파일 이름
+            progress: 백업을 푸는 동안 (처리한 양, 전체 양)으로 호출
+            cancel_event: 설정되면 푸는 도중 중단 (BackupCancelled)
             
-            # 데이터베이스 복원
-            shutil.copy2(backup_path, self.db_path)
+        Returns:
+            BackupSnapshot (다 쓰면 close())
             
-            # 복원된 파일 검증
-            if not self._verify_database_integrity(self.db_path):
-                return False, "복원된 데이터베이스 파일이 손상되었습니다."
+        Raises:
+            ValueError: 백업 파일이 없거나 손상된 경우
+            BackupCancelled: 취소된 경우
+        """
+        backup_path = os.path.join(self.backup_dir, backup_filename)
+        if not os.path.exists(backup_path):
+            raise ValueError("백업 파일을 찾을 수 없습니다.")
+        if self._compression_of(backup_filename) is None and not backup_filename.endswith(self.MANIFEST_EXTENSION):
+            return BackupSnapshot(backup_filename, backup_path, temporary=False)
+        
+        fd, temp_path = tempfile.mkstemp(prefix=backup_filename + ".", suffix=self.SNAPSHOT_EXTENSION,
+                                         dir=self.backup_dir)
+        os.close(fd)
+        try:
+            ok, message, _ = self._verify_backup_file(backup_filename, temp_path, self.verify_level,
+                                                      progress, cancel_event)
+        except Exception:
+            self._remove_file(temp_path)
+            raise
+        if not ok:
+            self._remove_file(temp_path)
+            raise ValueError(message)
+        return BackupSnapshot(backup_filename, temp_path, temporary=True)
+    
+    def diff_backup(self, backup_filename: str,
+                    progress: Optional[Callable[[int, int], None]] = None,
+                    cancel_event: Optional[threading.Event] = None) -> DatabaseDiff:
+        """
+        백업과 현재 데이터베이스 비교 (복원 전 미리보기)
+        
+        백업과 현재 DB에 각각 읽기 전용 연결을 열어 행 해시를 id 순서로 비교한다.
+        DB 작업 스레드를 거치지 않으므로 비교하는 동안에도 편집이 막히지 않고,
+        WAL 모드에서는 읽기 트랜잭션 하나로 비교 시작 시점의 현재 DB를 본다.
+        
+        Args:
+            backup_filename: 비교할 백업 파일 이름
+            progress: 테이블마다 (비교한 테이블 수, 전체 테이블 수)로 호출
+            cancel_event: 설정되면 중단 (BackupCancelled)
+        
+        Returns:
+            DatabaseDiff (project_titles 에 예시 프로젝트 제목 포함)
+        
+        Raises:
+            ValueError: 백업 파일이 없거나 손상된 경우
+            BackupCancelled: 취소된 경우
+        """
+        is_cancelled = cancel_event.is_set if cancel_event is not None else None
+        with self.open_backup(backup_filename, cancel_event=cancel_event) as snapshot:
+            backup_conn = snapshot.connect()
+            live_conn = sqlite3.connect(Path(self.db_path).resolve().as_uri() + "?mode=ro", uri=True)
+            try:
+                if live_conn.execute("PRAGMA journal_mode").fetchone()[0] == 'wal':
+                    live_conn.execute("BEGIN")
+                try:
+                    diff = DatabaseDiffer(backup_conn, live_conn).diff(progress, is_cancelled)
+                except InterruptedError:
+                    raise BackupCancelled("비교가 취소되었습니다.")
+                projects = diff.get('projects')
+                for conn, ids in ((backup_conn, projects.backup_examples),
+                                  (live_conn, projects.live_examples + projects.changed_examples)):
+                    if ids:
+                        conn.text_factory = str
+                        placeholders = ", ".join("?" * len(ids))
+                        diff.project_titles.update(conn.execute(
+                            f"SELECT id, title FROM projects WHERE id IN ({placeholders})", ids
+                        ).fetchall())
+                return diff
+            finally:
+                backup_conn.close()
+                live_conn.close()
+    
+    def verify_backup(self, backup_filename: str, level: str = VERIFY_FULL,
+                      progress: Optional[Callable[[int, int], None]] = None,
+                      cancel_event: Optional[threading.Event] = None) -> Tuple[bool, str]:
+        """
+        백업 하나 검증 후 카탈로그에 결과 기록
+        
+        Args:
+            backup_filename: 검증할 백업 파일 이름
+            level: 검증 수준 (기본값: 전체 무결성 검사)
+            progress: 백업을 푸는 동안 (처리한 양, 전체 양)으로 호출
+            cancel_event: 설정되면 푸는 도중 중단
             
-            return True, f"백업이 성공적으로 복원되었습니다.\n파일: {backup_filename}"
+        Returns:
+            (검증 통과 여부, 메시지)
+        """
+        temp_path = os.path.join(self.backup_dir, backup_filename + ".verify")
+        try:
+            ok, message, verify_seconds = self._verify_backup_file(backup_filename, temp_path, level,
+                                                                   progress, cancel_event)
+        except BackupCancelled:
+            return False, "검증이 취소되었습니다."
+        finally:
+            self._remove_file(temp_path)
+        if ok:
+            message = f"백업 검증을 통과했습니다.\n파일: {backup_filename}\n{self._verification_text(verify_seconds, level)}"
+        return ok, message
+    
+    def export_backup(self, backup_filename: str, target_path: str,
+                      progress: Optional[Callable[[int, int], None]] = None,
+                      cancel_event: Optional[threading.Event] = None) -> Tuple[bool, str]:
+        """
+        백업을 일반 데이터베이스 파일(.db)로 내보내기 (다른 PC로 옮기거나 직접 열어 보기용)
+        
+        압축/증분 백업도 풀어서 verify_level 수준으로 검사한 뒤 target_path 에 저장한다.
+        
+        Args:
+            backup_filename: 내보낼 백업 파일 이름
+            target_path: 저장할 경로 (있으면 덮어씀)
+            progress: 백업을 푸는 동안 (처리한 양, 전체 양)으로 호출
+            cancel_event: 설정되면 푸는 도중 중단
             
+        Returns:
+            (성공 여부, 메시지)
+        """
+        # 같은 디렉토리의 임시 파일에 푼 뒤 이름 변경 – 중간에 실패해도 불완전한 파일이 남지 않음
+        temp_path = target_path + ".part"
+        try:
+            try:
+                ok, message, verify_seconds = self._verify_backup_file(
+                    backup_filename, temp_path, self.verify_level, progress, cancel_event
+                )
+            except BackupCancelled:
+                return False, "내보내기가 취소되었습니다."
+            if not ok:
+                return False, message
+            os.replace(temp_path, target_path)
+            return True, (f"백업을 내보냈습니다.\n파일: {target_path}\n"
+                          f"{self._verification_text(verify_seconds)}")
         except Exception as e:
-            return False, f"백업 복원 중 오류가 발생했습니다: {str(e)}"
+            return False, f"백업 내보내기 중 오류가 발생했습니다: {str(e)}"
+        finally:
+            self._remove_file(temp_path)
     
-    def get_backup_list(self) -> list:
+    def verify_stale_backups(self, cancel_event: Optional[threading.Event] = None,
+                             progress: Optional[Callable[[int, int], None]] = None) -> Tuple[bool, str]:
+        """
+        전체 무결성 검사를 FULL_CHECK_INTERVAL 안에 하지 않은 백업을 차례로 전체 검사 (백그라운드 실행용)
+        
+        Args:
+            cancel_event: 설정되면 검사를 중단 (중단한 백업은 다음 검사 때 다시 검사)
+            progress: 백업마다 (검사한 백업 수, 검사할 백업 수)로 호출
+            
+        Returns:
+            (손상된 백업이 없는지 여부, 메시지)
+        """
+        checked = 0
+        corrupt = []
+        entries = self.catalog.list_unchecked(datetime.now() - self.FULL_CHECK_INTERVAL)
+        for index, entry in enumerate(entries):
+            if cancel_event is not None and cancel_event.is_set():
+                break
+            if progress is not None:
+                progress(index, len(entries))
+            if not os.path.exists(os.path.join(self.backup_dir, entry.filename)):
+                continue
+            ok, _ = self.verify_backup(entry.filename, self.VERIFY_FULL, cancel_event=cancel_event)
+            if cancel_event is not None and cancel_event.is_set():
+                break
+            if not os.path.exists(os.path.join(self.backup_dir, entry.filename)):
+                continue  # 검사 중 삭제된 백업
+            checked += 1
+            if not ok:
+                corrupt.append(entry.filename)
+        if corrupt:
+            return False, f"손상된 백업 {len(corrupt)}개를 발견했습니다: {', '.join(corrupt)}"
+        return True, f"백업 {checked}개의 무결성 검사를 마쳤습니다."
+    
+    def _verify_backup_file(self, backup_filename: str, temp_path: str, level: str,
+                            progress: Optional[Callable[[int, int], None]] = None,
+                            cancel_event: Optional[threading.Event] = None) -> Tuple[bool, str, float]:
         """
-        백업 파일 목록 조회
+        백업 파일의 체크섬을 대조하고 temp_path 에 데이터베이스로 풀어 level 수준으로 검사
+        
+        결과는 카탈로그에 기록한다 (손상 시 'corrupt', 전체 검사 통과 시 검사 시각).
+        progress 와 cancel_event 는 압축 해제 단계에 적용된다.
         
         Returns:
-            백업 파일 정보 리스트 [(표시명, 생성일시, 크기, 실제 파일명), ...]
+            (통과 여부, 실패 메시지, 검증에 걸린 시간(초) – 압축 해제 시간 제외)
+            
+        Raises:
+            BackupCancelled: 압축 해제 중 cancel_event 가 설정된 경우
         """
-        raw_backup_files = []
+        backup_path = os.path.join(self.backup_dir, backup_filename)
+        if not os.path.exists(backup_path):
+            return False, "백업 파일을 찾을 수 없습니다.", 0.0
+        entry = self.catalog.get(backup_filename)
+        
+        # 1) 체크섬 대조 (기록이 없으면 계산해서 기록)
+        started = time.perf_counter()
+        checksum = self._file_checksum(backup_path)
+        if entry is not None and entry.checksum and entry.checksum != checksum:
+            self.catalog.set_integrity(backup_filename, 'corrupt')
+            return False, "백업 파일이 손상되었습니다 (체크섬 불일치).", time.perf_counter() - started
+        verify_seconds = time.perf_counter() - started
         
+        # 2) 데이터베이스 파일로 풀기 (증분 백업은 청크 해시도 확인됨)
         try:
-            for filename in os.listdir(self.backup_dir):
-                if filename.endswith('.db'):
-                    file_path = os.path.join(self.backup_dir, filename)
-                    stat = os.stat(file_path)
-                    
-                    created_time_dt = datetime.fromtimestamp(stat.st_ctime) # datetime 객체로 저장
-                    file_size = stat.st_size
-                    
-                    # (실제 파일명, datetime 객체, 파일 크기)
-                    raw_backup_files.append((filename, created_time_dt, file_size))
-            
-            # Step 1: 모든 백업을 생성 시간 오름차순 (오래된 순)으로 정렬
-            raw_backup_files.sort(key=lambda x: x[1])
-            
-            name_groups = {}
-
-            # Step 2: 기본 표시 이름 추출 및 그룹화
-            for filename, created_time_dt, file_size in raw_backup_files:
-                # 실제 파일명에서 타임스탬프와 (N) 접미사를 제거한 '기본' 표시 이름 추출
-                # 예: 'MyProject_20250501_123456 (1).db' -> 'MyProject'
-                #     'before_restore_20250501_123456.db' -> 'before_restore'
-                base_name_without_timestamp = re.sub(r'_\d{8}_\d{6}', '', filename.rsplit('.', 1)[0])
-                base_display_name = re.sub(r'\s\((\d+)\)$', '', base_name_without_timestamp).strip()
-                
-                if base_display_name not in name_groups:
-                    name_groups[base_display_name] = []
-                
-                name_groups[base_display_name].append({
-                    'filename': filename,
-                    'created_time_dt': created_time_dt,
-                    'file_size': file_size,
-                })
-            
-            # Step 3: 각 그룹 내에서 고유한 표시 이름 부여
-            final_backup_list = []
-            for base_name, backups_in_group in name_groups.items():
-                for i, backup_info in enumerate(backups_in_group):
-                    display_name_to_use = base_name
-                    if len(backups_in_group) > 1 and i > 0: # 그룹 내에 2개 이상이고, 첫 번째(가장 오래된)가 아닐 경우
-                        display_name_to_use = f"{base_name} ({i})"
-                    
-                    final_backup_list.append((
-                        display_name_to_use,
-                        format_datetime(backup_info['created_time_dt']),
-                        self._format_file_size(backup_info['file_size']),
-                        backup_info['filename']
-                    ))
-            
-            # Step 4: 최종 결과는 UI 표시를 위해 생성일시 역순으로 다시 정렬 (최신이 위로)
-            final_backup_list.sort(key=lambda x: x[1], reverse=True)
-            return final_backup_list
+            self._extract_backup(backup_path, temp_path, progress, cancel_event)
+        except (OSError, EOFError, ValueError, KeyError, lzma.LZMAError) as e:
+            if entry is not None:
+                self.catalog.set_integrity(backup_filename, 'corrupt')
+            return False, f"백업 파일을 풀 수 없습니다: {str(e)}", verify_seconds
+        
+        # 3) 데이터베이스 검사
+        started = time.perf_counter()
+        ok = self._verify_database_integrity(temp_path, level)
+        verify_seconds += time.perf_counter() - started
+        if entry is not None:
+            full_check = ok and level == self.VERIFY_FULL
+            self.catalog.set_integrity(
+                backup_filename, 'ok' if ok else 'corrupt', checksum=checksum,
+                checked_at=datetime.now() if full_check else None,
+                verify_seconds=verify_seconds
+            )
+        if not ok:
+            return False, "백업 파일이 손상되어 복원할 수 없습니다.", verify_seconds
+        return True, "", verify_seconds
+    
+    def _verification_text(self, seconds: float, level: Optional[str] = None) -> str:
+        """검증 방식과 소요 시간 문구"""
+        return f"검증({self.VERIFY_LABELS[level or self.verify_level]}): {seconds:.2f}초"
+    
+    def get_backup_list(self) -> list:
+        """
+        백업 파일 목록 조회 (카탈로그만 읽음 – 직접 넣거나 지운 파일은 reconcile_catalog 로 반영)
+        
+        Returns:
+            백업 파일 정보 리스트 [(표시명, 생성일시, 원본 크기, 저장 크기, 실제 파일명), ...] (최신순)
+        """
+        try:
+            backup_list = []
+            for entry, ordinal in self.catalog.list_entries():
+                # 같은 표시 이름이 여럿이면 가장 오래된 것 외에는 (N) 을 붙임
+                display_name = f"{entry.base_name} ({ordinal})" if ordinal > 0 else entry.base_name
+                backup_list.append((
+                    display_name,
+                    format_datetime(entry.created_at),
+                    self._format_file_size(entry.database_size),
+                    self._format_file_size(entry.stored_size),
+                    entry.filename
+                ))
+            return backup_list
             
         except Exception as e:
             print(f"백업 목록 조회 중 오류: {e}")
         
         return [] # 오류 발생 시 빈 리스트 반환
     
+    def reconcile_catalog(self) -> Tuple[int, int, int]:
+        """
+        백업 디렉토리를 훑어 카탈로그에 없는 파일은 추가하고, 바뀐 파일은 갱신하고, 없어진 파일은 삭제
+        
+        Returns:
+            (추가, 갱신, 삭제된 기록 수)
+        """
+        files = {}
+        for filename in os.listdir(self.backup_dir):
+            if self._is_backup_file(filename):
+                files[filename] = os.stat(os.path.join(self.backup_dir, filename))
+        
+        def _describe(filename, stat):
+            # 밖에서 바뀐 파일은 체크섬/무결성을 모르는 상태로 기록
+            database_size, stored_size = self._backup_sizes(os.path.join(self.backup_dir, filename), stat.st_size)
+            base_name = self._base_name(filename)
+            return BackupEntry(
+                filename=filename,
+                base_name=base_name,
+                created_at=datetime.fromtimestamp(stat.st_ctime),
+                database_size=database_size,
+                stored_size=stored_size,
+                file_size=stat.st_size,
+                mtime=stat.st_mtime,
+                kind=self.KIND_AUTO if base_name == self.AUTO_BACKUP_NAME else self.KIND_MANUAL,
+            )
+        
+        added, updated, removed = self.catalog.reconcile(files, _describe)
+        if removed:
+            # 직접 지운 증분 백업이 있었다면 그 청크 정리
+            self._collect_chunks()
+        return added, updated, removed
+    
     def delete_backup(self, backup_filename: str) -> Tuple[bool, str]:
         """
         백업 파일 삭제
@@ -201,18 +646,320 @@ class BackupManager:
             if not os.path.exists(backup_path):
                 return False, "백업 파일을 찾을 수 없습니다."
             
-            os.remove(backup_path)
+            self._delete_files([backup_filename])
             return True, f"백업 파일이 삭제되었습니다: {backup_filename}"
             
         except Exception as e:
             return False, f"백업 파일 삭제 중 오류가 발생했습니다: {str(e)}"
     
-    def _verify_database_integrity(self, db_path: str) -> bool:
+    def prune_backups(self, now: Optional[datetime] = None,
+                      cancel_event: Optional[threading.Event] = None) -> int:
+        """
+        보존 정책에 따라 오래된 자동 백업 삭제
+        
+        구간(하루 안은 1시간, 한 달 안은 하루, 그 이후는 ISO 주)마다 가장 최근 백업 하나만
+        남긴다. 손상된 백업은 구간을 차지하지 않으며, 가장 최근 자동 백업은 항상 남긴다.
+        
+        Args:
+            now: 기준 시각 (기본값: 현재)
+            cancel_event: 설정되어 있으면 삭제하기 전에 중단
+            
+        Returns:
+            삭제한 백업 수
+        """
+        now = now or datetime.now()
+        entries = self.catalog.list_kind(self.KIND_AUTO)  # 최신순
+        kept = set()
+        expired = []
+        for index, entry in enumerate(entries):
+            bucket = self._retention_bucket(entry.created_at, now)
+            if index == 0 or (entry.integrity != 'corrupt' and bucket not in kept):
+                kept.add(bucket)
+            else:
+                expired.append(entry.filename)
+        if expired:
+            if cancel_event is not None and cancel_event.is_set():
+                raise BackupCancelled()
+            self._delete_files(expired)
+        return len(expired)
+    
+    def _retention_bucket(self, created_at: datetime, now: datetime) -> tuple:
+        """백업이 속한 보존 구간 (같은 구간에서는 최근 백업 하나만 남김)"""
+        age = now - created_at
+        if age < self.RETENTION_HOURLY:
+            return ('hour', created_at.date(), created_at.hour)
+        if age < self.RETENTION_DAILY:
+            return ('day', created_at.date())
+        year, week, _ = created_at.isocalendar()
+        return ('week', year, week)
+    
+    def _delete_files(self, filenames: List[str]):
+        """백업 파일과 카탈로그 기록 삭제 (증분 백업이 있으면 마지막에 청크 한 번 정리)
+        
+        Raises:
+            OSError: 지우지 못한 파일이 있는 경우 (나머지는 삭제하고 그 기록만 남김)
+        """
+        removed = []
+        error = None
+        for filename in filenames:
+            try:
+                os.remove(os.path.join(self.backup_dir, filename))
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                error = error or e
+                continue
+            removed.append(filename)
+        self.catalog.remove_many(removed)
+        if any(filename.endswith(self.MANIFEST_EXTENSION) for filename in removed):
+            # 남은 증분 백업에서 쓰지 않는 청크 정리
+            self._collect_chunks()
+        if error is not None:
+            raise error
+    
+    def _record_backup(self, filename: str, created_at: datetime, integrity: str = 'unknown',
+                       checksum: Optional[str] = None, checked_at: Optional[datetime] = None,
+                       verify_seconds: float = 0.0, kind: str = KIND_MANUAL):
+        """백업 파일 정보를 카탈로그에 기록"""
+        path = os.path.join(self.backup_dir, filename)
+        stat = os.stat(path)
+        database_size, stored_size = self._backup_sizes(path, stat.st_size)
+        self.catalog.add(BackupEntry(
+            filename=filename,
+            base_name=self._base_name(filename),
+            created_at=created_at,
+            database_size=database_size,
+            stored_size=stored_size,
+            file_size=stat.st_size,
+            mtime=stat.st_mtime,
+            checksum=checksum or self._file_checksum(path),
+            integrity=integrity,
+            checked_at=checked_at,
+            verify_seconds=verify_seconds,
+            kind=kind,
+        ))
+    
+    def _backup_prefix(self, custom_name: Optional[str]) -> str:
+        """백업 파일명 앞부분 – 사용자 지정 이름에서 특수문자를 제거 (없으면 'temporary')"""
+        if custom_name:
+            safe_name = "".join(c for c in custom_name if c.isalnum() or c in (' ', '-', '_')).strip()
+            return safe_name or "temporary"
+        return "temporary"
+    
+    def is_reserved_name(self, custom_name: Optional[str]) -> bool:
+        """사용자가 만드는 백업에 쓸 수 없는 이름(자동 백업용)인지 여부"""
+        return self._backup_prefix(custom_name) == self.AUTO_BACKUP_NAME
+    
+    def _base_name(self, filename: str) -> str:
+        """
+        실제 파일명에서 타임스탬프와 (N) 접미사를 제거한 '기본' 표시 이름 추출
+        
+        예: 'MyProject_20250501_123456 (1).db' -> 'MyProject'
+            'before_restore_20250501_123456.db.gz' -> 'before_restore'
+        """
+        base_name_without_timestamp = re.sub(r'_\d{8}_\d{6}', '', self._strip_extension(filename))
+        return re.sub(r'\s\((\d+)\)$', '', base_name_without_timestamp).strip()
+    
+    def _file_checksum(self, path: str) -> str:
+        """파일의 SHA-256 (CHUNK_SIZE 씩 읽어 계산)"""
+        digest = hashlib.sha256()
+        with open(path, 'rb') as f:
+            while True:
+                chunk = f.read(self.CHUNK_SIZE)
+                if not chunk:
+                    break
+                digest.update(chunk)
+        return digest.hexdigest()
+    
+    # ------------------------------------------------------------------
+    # 백업 파일 형식 (압축)
+    # ------------------------------------------------------------------
+    def _compression_of(self, filename: str) -> Optional[str]:
+        """파일 확장자로 압축 방식 판별 (압축하지 않은 파일은 None)"""
+        for compression, extension in self.EXTENSIONS.items():
+            if compression and filename.endswith(extension):
+                return compression
+        return None
+    
+    def _is_backup_file(self, filename: str) -> bool:
+        """백업 파일 여부 (작업 중인 임시 파일 제외)"""
+        return filename.endswith(self.MANIFEST_EXTENSION) or any(
+            filename.endswith(extension) for extension in self.EXTENSIONS.values()
+        )
+    
+    def _strip_extension(self, filename: str) -> str:
+        """백업 파일명에서 확장자 제거 (예: 'a_20250501_123456.db.xz' → 'a_20250501_123456')"""
+        if filename.endswith(self.MANIFEST_EXTENSION):
+            return filename[:-len(self.MANIFEST_EXTENSION)]
+        extension = self.EXTENSIONS[self._compression_of(filename)]
+        if filename.endswith(extension):
+            return filename[:-len(extension)]
+        return filename.rsplit('.', 1)[0]
+    
+    def _open_archive(self, path, mode: str, compression: str):
+        """압축 파일 열기 ('rb' / 'wb', path 는 파일 경로 또는 파일 객체)"""
+        if compression == 'zlib':
+            return gzip.open(path, mode, compresslevel=6) if 'w' in mode else gzip.open(path, mode)
+        if compression == 'lzma':
+            return lzma.open(path, mode, preset=3) if 'w' in mode else lzma.open(path, mode)
+        if compression == 'bz2':
+            return bz2.open(path, mode, compresslevel=9) if 'w' in mode else bz2.open(path, mode)
+        raise ValueError(f"지원하지 않는 압축 방식입니다: {compression}")
+    
+    def _compress_file(self, source_path: str, target_path: str,
+                       progress: Optional[Callable[[int, int], None]] = None,
+                       cancel_event: Optional[threading.Event] = None):
+        """source_path 를 CHUNK_SIZE 씩 읽어 압축 파일로 저장 (파일 전체를 메모리에 올리지 않음)
+        
+        Returns:
+            압축 파일의 SHA-256 (쓰면서 계산)
+        
+        Raises:
+            BackupCancelled: cancel_event 가 설정된 경우
+        """
+        total = os.path.getsize(source_path)
+        with open(source_path, 'rb') as source, open(target_path, 'wb') as raw_target:
+            hashing_target = _HashingWriter(raw_target)
+            with self._open_archive(hashing_target, 'wb', self.compression) as target:
+                self._pump(source, target, total, progress, cancel_event)
+        return hashing_target.digest.hexdigest()
+    
+    def _pump(self, source, target, total: int,
+              progress: Optional[Callable[[int, int], None]] = None,
+              cancel_event: Optional[threading.Event] = None):
+        """source 를 CHUNK_SIZE 씩 target 에 복사"""
+        done = 0
+        while True:
+            if cancel_event is not None and cancel_event.is_set():
+                raise BackupCancelled()
+            chunk = source.read(self.CHUNK_SIZE)
+            if not chunk:
+                break
+            target.write(chunk)
+            done += len(chunk)
+            if progress is not None and total:
+                progress(done, total)
+    
+    def _extract_backup(self, backup_path: str, target_path: str,
+                        progress: Optional[Callable[[int, int], None]] = None,
+                        cancel_event: Optional[threading.Event] = None):
+        """압축/증분 백업을 풀어 target_path 에 데이터베이스 파일로 저장 (CHUNK_SIZE 씩 스트리밍)
+        
+        Raises:
+            BackupCancelled: cancel_event 가 설정된 경우
+        """
+        if backup_path.endswith(self.MANIFEST_EXTENSION):
+            try:
+                self.chunk_store.read_file(load_manifest(backup_path), target_path, progress,
+                                           cancel_event.is_set if cancel_event else None)
+            except InterruptedError:
+                raise BackupCancelled()
+            return
+        compression = self._compression_of(backup_path)
+        if compression is None and progress is None and cancel_event is None:
+            shutil.copyfile(backup_path, target_path)
+            return
+        # 진행률 기준은 풀었을 때의 데이터베이스 크기 (압축 파일은 헤더에서 계산)
+        total, _ = self._backup_sizes(backup_path, os.path.getsize(backup_path))
+        if compression is None:
+            source_context = open(backup_path, 'rb')
+        else:
+            source_context = self._open_archive(backup_path, 'rb', compression)
+        with source_context as source, open(target_path, 'wb') as target:
+            self._pump(source, target, total, progress, cancel_event)
+    
+    def _backup_sizes(self, path: str, file_size: int) -> Tuple[int, int]:
+        """백업에 담긴 데이터베이스 크기와 백업이 차지하는 저장 크기
+        
+        압축 파일은 풀지 않고 SQLite 헤더(앞 100바이트)의 페이지 크기와 페이지 수로 계산한다.
+        증분 백업의 저장 크기는 매니페스트와 그 백업에서 새로 저장한 청크 크기의 합이다.
+        """
+        if path.endswith(self.MANIFEST_EXTENSION):
+            try:
+                manifest = load_manifest(path)
+                return manifest['size'], file_size + manifest.get('stored_bytes', 0)
+            except (OSError, ValueError, KeyError):
+                return file_size, file_size
+        compression = self._compression_of(path)
+        if compression is None:
+            return file_size, file_size
+        try:
+            with self._open_archive(path, 'rb', compression) as archive:
+                header = archive.read(100)
+            if len(header) < 100 or not header.startswith(b"SQLite format 3\0"):
+                return file_size, file_size
+            page_size, = struct.unpack(">H", header[16:18])
+            page_count, = struct.unpack(">I", header[28:32])
+            # 페이지 크기 1은 65536을 뜻함
+            return (65536 if page_size == 1 else page_size) * page_count, file_size
+        except (OSError, EOFError, lzma.LZMAError):
+            return file_size, file_size
+    
+    def _collect_chunks(self) -> int:
+        """어떤 증분 백업에서도 쓰지 않는 청크 삭제 – 삭제한 청크 수 반환"""
+        with self.chunk_store.lock:
+            manifests = []
+            for filename in os.listdir(self.backup_dir):
+                if filename.endswith(self.MANIFEST_EXTENSION):
+                    try:
+                        manifests.append(load_manifest(os.path.join(self.backup_dir, filename)))
+                    except (OSError, ValueError) as e:
+                        # 읽을 수 없는 매니페스트가 있으면 그 청크를 지울 수 있으므로 정리하지 않음
+                        print(f"증분 백업 매니페스트를 읽을 수 없어 청크 정리를 건너뜁니다: {filename} ({e})")
+                        return 0
+            return self.chunk_store.collect_garbage(manifests)
+    
+    def _copy_database(self, source_path: str, target_path: str,
+                       progress: Optional[Callable[[int, int], None]] = None,
+                       cancel_event: Optional[threading.Event] = None):
+        """
+        SQLite 백업 API로 데이터베이스 복사 (PAGES_PER_STEP 페이지씩)
+        
+        Raises:
+            BackupCancelled: cancel_event 가 설정된 경우
+        """
+        def _on_step(status, remaining, total):
+            if cancel_event is not None and cancel_event.is_set():
+                # 진행 콜백에서 예외가 나면 sqlite3 가 백업을 중단하고 예외를 전달함
+                raise BackupCancelled()
+            if progress is not None:
+                progress(total - remaining, total)
+        
+        if cancel_event is not None and cancel_event.is_set():
+            raise BackupCancelled()
+        source = sqlite3.connect(source_path)
+        try:
+            row = source.execute("PRAGMA journal_mode").fetchone()
+            if row and row[0] == 'wal':
+                # WAL 모드에서는 읽기 트랜잭션을 열어 두면 단계 사이에 다른 연결이 써도
+                # 같은 스냅샷에서 이어서 복사한다 (쓰기는 막지 않고, 백업이 처음부터 다시 시작되지 않음).
+                # 롤백 저널 모드에서는 읽기 잠금이 쓰기를 막으므로 열어 두지 않는다.
+                source.execute("BEGIN")
+                source.execute("SELECT COUNT(*) FROM sqlite_master").fetchone()
+            target = sqlite3.connect(target_path)
+            try:
+                source.backup(target, pages=self.PAGES_PER_STEP, progress=_on_step)
+            finally:
+                target.close()
+        finally:
+            source.close()
+    
+    @staticmethod
+    def _remove_file(path: str):
+        """파일이 있으면 삭제 (실패는 무시)"""
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+    
+    def _verify_database_integrity(self, db_path: str, level: str = VERIFY_FULL) -> bool:
         """
         데이터베이스 무결성 검사
         
         Args:
             db_path: 검사할 데이터베이스 파일 경로
+            level: VERIFY_FULL 은 integrity_check, VERIFY_QUICK 은 quick_check,
+                   VERIFY_CHECKSUM 은 SQLite 파일로 열리는지만 확인
             
         Returns:
             무결성 검사 통과 여부
@@ -221,8 +968,15 @@ class BackupManager:
             conn = sqlite3.connect(db_path)
             cursor = conn.cursor()
             
-            # PRAGMA integrity_check 실행
-            cursor.execute("PRAGMA integrity_check")
+            if level == self.VERIFY_CHECKSUM:
+                # 헤더/스키마만 읽어 SQLite 파일인지 확인
+                cursor.execute("SELECT COUNT(*) FROM sqlite_master")
+                cursor.fetchone()
+                conn.close()
+                return True
+            
+            # PRAGMA integrity_check / quick_check 실행
+            cursor.execute("PRAGMA integrity_check" if level == self.VERIFY_FULL else "PRAGMA quick_check")
             result = cursor.fetchone()
             
             conn.close()
@@ -0,0 +1,184 @@
+"""
+자동 백업 스케줄러
+"""
+import os
+from datetime import datetime, timedelta
+from typing import Callable, Optional, Tuple
+from PySide6.QtCore import QObject, QTimer, Signal
+from utils.backup_catalog import BackupRun
+from utils.backup_jobs import BackupJob, BackupJobQueue
+
+
+class BackupScheduler(QObject):
+    """일정 시간마다 또는 변경이 많이 쌓이면 자동 백업을 만드는 스케줄러
+
+    GUI 스레드의 타이머는 메모리에 둔 마지막 백업/실행 기록과 DB 파일 수정 시각만으로
+    백업이 필요할 수 있는지 걸러 내고, 카탈로그를 읽는 최종 판단과 백업(증분), 보존 정책에
+    따른 정리는 백업 작업 대기열의 유지보수 작업에서 한다. 복원 등 다른 백업 작업과 같은
+    작업 스레드에서 차례로 실행되므로 서로 끼어들지 않는다. 실행 결과는 백업 카탈로그에 기록한다.
+
+    - 시간: 마지막 자동 백업 후 INTERVAL 이 지났고 그 뒤로 DB 파일이 바뀌었으면 백업
+    - 변경: 마지막 자동 백업 후 변경한 행이 MUTATION_THRESHOLD 이상이면 바로 백업
+    """
+
+    INTERVAL = timedelta(hours=1)
+    MUTATION_THRESHOLD = 500
+    RETRY_INTERVAL = timedelta(minutes=10)  # 자동 백업이 실패한 뒤 다시 시도할 때까지
+    CHECK_INTERVAL_MS = 60 * 1000  # 백업 필요 여부 판단 주기
+
+    # 실행 계기
+    TRIGGER_TIMER = 'timer'
+    TRIGGER_MUTATIONS = 'mutations'
+
+    # (성공 여부, 메시지) – GUI 스레드에서 전달
+    backup_finished = Signal(bool, str)
+
+    def __init__(self, backup_manager, change_counter: Callable[[], int], job_queue: BackupJobQueue,
+                 parent: Optional[QObject] = None):
+        """
+        초기화
+
+        Args:
+            backup_manager: 백업을 만들 BackupManager
+            change_counter: 지금까지 변경한 행 수를 돌려주는 함수 (예: db.total_changes)
+            job_queue: 자동 백업을 실행할 백업 작업 대기열
+            parent: 부모 QObject
+        """
+        super().__init__(parent)
+        self.backup_manager = backup_manager
+        self.change_counter = change_counter
+        self.job_queue = job_queue
+        self._job: Optional[BackupJob] = None
+        # 카탈로그에서 읽은 마지막 자동 백업 시각 / 실행 기록 (작업 스레드에서 갱신, 처음에는 모름)
+        self._state_loaded = False
+        self._last_backup_at: Optional[datetime] = None
+        self._last_run: Optional[BackupRun] = None
+        self._shutdown = False
+        self._changes_at_backup = change_counter()
+        self._timer = QTimer(self)
+        self._timer.timeout.connect(self.check)
+
+    def start(self):
+        """주기적인 판단 시작 (시작 직후에도 한 번 판단)"""
+        if self._shutdown:
+            return
+        self._timer.start(self.CHECK_INTERVAL_MS)
+        QTimer.singleShot(0, self.check)
+
+    def is_running(self) -> bool:
+        """자동 백업이 대기열에 있거나 실행 중인지 여부"""
+        return self._job is not None and not self._job.finished
+
+    def shutdown(self):
+        """판단 타이머 종료 (대기열의 자동 백업은 취소 요청 – 대기열 종료 전에 호출)"""
+        if self._shutdown:
+            return
+        self._shutdown = True
+        self._timer.stop()
+        if self.is_running():
+            self.job_queue.cancel(self._job)
+
+    # ------------------------------------------------------------------
+    # 판단
+    # ------------------------------------------------------------------
+    def check(self):
+        """백업이 필요할 수 있으면 백업 작업 대기열에 추가 (GUI 스레드 – 카탈로그는 읽지 않음)
+
+        카탈로그를 아직 읽지 않았으면 일단 작업을 넣고, 작업에서 카탈로그를 읽어 다시 판단한다.
+        """
+        if self._shutdown or self.is_running():
+            return
+        changes = self.change_counter()
+        if self._state_loaded and self._due_trigger(changes) is None:
+            return
+        self._job = self.job_queue.submit(
+            'auto', "자동 백업", lambda job: self._run(job, changes),
+            callback=self._on_run_finished, background=True
+        )
+
+    def _load_state(self):
+        """카탈로그에서 마지막 자동 백업 시각과 실행 기록 읽기 (작업 스레드)"""
+        catalog = self.backup_manager.catalog
+        latest = catalog.latest(self.backup_manager.KIND_AUTO)
+        self._last_backup_at = latest.created_at if latest else None
+        self._last_run = catalog.last_run()
+        self._state_loaded = True
+
+    def _due_trigger(self, changes: int) -> Optional[str]:
+        """메모리의 기록 기준으로 지금 백업해야 하는 계기 (필요 없으면 None)"""
+        last_run = self._last_run
+        if last_run is not None and not last_run.success and \
+                datetime.now() - last_run.finished_at < self.RETRY_INTERVAL:
+            return None
+        if changes - self._changes_at_backup >= self.MUTATION_THRESHOLD:
+            return self.TRIGGER_MUTATIONS
+        last_backup = self._last_backup_at
+        if last_backup is None:
+            return self.TRIGGER_TIMER
+        if datetime.now() - last_backup < self.INTERVAL:
+            return None
+        # 마지막 자동 백업 뒤로 DB가 바뀌었을 때만 (WAL 모드에서는 -wal 파일에 먼저 기록됨)
+        if self._database_modified() > last_backup:
+            return self.TRIGGER_TIMER
+        return None
+
+    def _database_modified(self) -> datetime:
+        """DB 파일(-wal 포함)의 마지막 수정 시각"""
+        modified = 0.0
+        for path in (self.backup_manager.db_path, self.backup_manager.db_path + "-wal"):
+            try:
+                modified = max(modified, os.path.getmtime(path))
+            except OSError:
+                pass
+        return datetime.fromtimestamp(modified)
+
+    # ------------------------------------------------------------------
+    # 실행 (백업 작업 스레드)
+    # ------------------------------------------------------------------
+    def _run(self, job: BackupJob, changes: int) -> Tuple[bool, str]:
+        """카탈로그를 읽어 다시 판단한 뒤, 필요하면 자동 백업 + 보존 정책 정리 후 카탈로그에 실행 기록
+
+        changes 는 판단 시점의 변경 행 수. 기록한 실행은 job.result 에 BackupRun 으로 남긴다
+        (백업할 필요가 없었으면 None).
+        """
+        self._load_state()
+        trigger = self._due_trigger(changes)
+        if trigger is None:
+            return True, ""
+        manager = self.backup_manager
+        started_at = datetime.now()
+        filename = None
+        pruned = 0
+        try:
+            success, message = manager.create_backup(
+                manager.AUTO_BACKUP_NAME, incremental=True, progress=self.job_queue.progress_of(job),
+                cancel_event=job.cancel_event, kind=manager.KIND_AUTO
+            )
+            if success:
+                latest = manager.catalog.latest(manager.KIND_AUTO)
+                filename = latest.filename if latest else None
+                self._last_backup_at = latest.created_at if latest else started_at
+            pruned = manager.prune_backups(cancel_event=job.cancel_event)
+            if pruned:
+                message += f"\n오래된 자동 백업 {pruned}개를 정리했습니다."
+        except Exception as e:
+            success, message = False, f"자동 백업 중 오류가 발생했습니다: {str(e)}"
+        if not success and job.is_cancelled():
+            return success, message  # 취소된 실행은 기록하지 않음 (다음 판단 때 다시 시도)
+        # 변경 수 기준은 실행을 마친 뒤에 옮김 (대기·실행 중에는 check 가 판단하지 않음)
+        self._changes_at_backup = changes
+        run = BackupRun(
+            started_at=started_at, finished_at=datetime.now(), trigger=trigger,
+            success=success, message=message, filename=filename, pruned=pruned
+        )
+        try:
+            manager.catalog.add_run(run)
+        except Exception as e:
+            print(f"자동 백업 기록 중 오류: {e}")
+        self._last_run = run
+        job.result = run
+        return success, message
+
+    def _on_run_finished(self, job: BackupJob):
+        if job.result is not None:
+            self.backup_finished.emit(job.success, job.message)
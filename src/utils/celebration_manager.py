@@ -11,23 +11,28 @@ Completion celebration manager providing visual & audio feedback when progress r
 
 from __future__ import annotations
 
+import math
 import random
-from typing import List
 
-from PySide6.QtCore import Qt, QPropertyAnimation, QEasingCurve, QTimer, QPoint, QParallelAnimationGroup, QSequentialAnimationGroup, QPauseAnimation
+from PySide6.QtCore import Qt, QPropertyAnimation, QEasingCurve, QTimer, QPointF, QRect, QRectF
 from PySide6.QtMultimedia import QSoundEffect  # PySide6 >= 6.2
-from PySide6.QtWidgets import (
-    QWidget,
-    QLabel,
-    QApplication,
-    QGraphicsOpacityEffect,
-)
-from PySide6.QtGui import QColor
-from shiboken6 import isValid
+from PySide6.QtWidgets import QWidget
+from PySide6.QtGui import QColor, QPainter, QPen, QPolygonF, QTransform
 
+from utils.frame_clock import frame_clock
 
-class ConfettiParticle(QLabel):
-    """간단한 콘페티 입자(QLabel 사각형)."""
+
+class ConfettiSystem:
+    """콘페티 입자 묶음 – 위젯 없이 묶음(batch)별 점 목록으로만 상태를 보관한다.
+
+    모든 입자가 같은 곳에서 함께 발사되고 중력과 선형 저항만 받으므로, 시각 t 의 위치는
+    입자마다 고정된 발사 속도에 모든 입자가 같은 계수를 곱하고 더한 값이다
+    (x = x0 + vx·F(t), y = y0 + (vy - g/k)·F(t) + (g/k)·t, F(t) = (1 - e^(-kt)) / k).
+    그래서 입자를 (색, 크기, 수명) 묶음으로 나눠 발사 속도를 QPolygonF 로 한 번만 만들어 두고,
+    프레임마다 파이썬에서는 입자 수와 무관하게 계수만 갱신한다. 그릴 때는 그 계수를 변환 행렬로
+    걸고 묶음마다 drawPoints 한 번 – 크기는 변환과 무관한 코스메틱 펜(사각 끝)으로 정한다.
+    다 사라진 묶음은 버린다. 길이 단위는 오버레이 높이(H) 기준.
+    """
 
     COLORS_LIGHT = ["#FFB3BA", "#FFDFBA", "#FFFFBA", "#BAFFC9", "#BAE1FF"]
     COLORS_DARK = [
@@ -38,15 +43,114 @@ class ConfettiParticle(QLabel):
         "#B5EAD7",
     ]
 
-    def __init__(self, parent: QWidget, dark_mode: bool):
-        super().__init__(parent)
-        size = random.randint(12, 18)  # 이전 6~10 → 가독성 ↑
-        self.resize(size, size)
-        self.setStyleSheet(
-            f"background-color: {random.choice(self.COLORS_DARK if dark_mode else self.COLORS_LIGHT)};"
-            "border-radius: 3px;"
-            "border:1px solid rgba(0,0,0,0.15);"
-        )
+    GRAVITY = 2.8        # 중력 가속도 (H/s²)
+    DRAG = 4.0           # 공기 저항 (1/s) – 종단 속도 = GRAVITY / DRAG
+    LAUNCH_SPEED = 5.85  # 상승 높이 1H 당 발사 속도 (H/s)
+    FADE_DELAY = 0.4     # 투명해지기 시작하는 시간 (s)
+    LIFETIME = 1.5       # 최대 수명 (s) – 입자마다 80~100 %
+    LIFETIME_LEVELS = 4  # 수명 단계 수 (같은 단계끼리 같은 투명도)
+    SIZES = (12, 14, 16, 18)  # 입자 크기 (px)
+    MAX_SIZE = 18        # 입자 최대 크기 (px)
+
+    def __init__(self):
+        self.count = 0           # 남은 입자 수 (모두 사라지면 0)
+        self.age = 0.0           # 발사 후 경과 시간 (모든 입자가 함께 발사됨)
+        self.origin = QPointF()
+        self.terminal = 0.0      # 종단 속도 g/k (px/s)
+        # (색, 크기(px), 수명(s), 입자 수, 발사 속도 점 목록) – 발사 속도의 y 는 종단 속도를 뺀 값
+        self.batches: list[tuple[QColor, int, float, int, QPolygonF]] = []
+        self.velocity_bounds = QRectF()  # 모든 입자의 발사 속도를 감싸는 영역
+        self.bounds = QRect()    # 입자들이 차지하는 영역
+
+    def spawn(self, count: int, origin_x: float, origin_y: float, height: float, dark: bool):
+        """origin 에서 위로 퍼지는 입자 count 개 생성 (이전 입자는 버림)"""
+        colors = [QColor(c) for c in (self.COLORS_DARK if dark else self.COLORS_LIGHT)]
+        self.count = count
+        self.age = 0.0
+        self.origin = QPointF(origin_x, origin_y)
+        self.terminal = self.GRAVITY * height / self.DRAG
+        levels = self.LIFETIME_LEVELS
+        sizes = len(self.SIZES)
+        points: list[list[QPointF]] = [[] for _ in range(len(colors) * sizes * levels)]
+        uniform, randrange = random.uniform, random.randrange
+        left = top = right = bottom = 0.0
+        for _ in range(count):
+            lift = uniform(0.6, 0.9) * height  # 상승 높이
+            # 좌우로 퍼지는 정도는 상승 높이에 비례 (저항 때문에 총 이동 거리 = 속도 / DRAG)
+            vx = self.DRAG * lift * uniform(-0.85, 0.85) * 1.05
+            vy = -self.LAUNCH_SPEED * lift - self.terminal
+            left, right = min(left, vx), max(right, vx)
+            top, bottom = min(top, vy), max(bottom, vy)
+            points[randrange(len(points))].append(QPointF(vx, vy))
+        self.velocity_bounds = QRectF(left, top, right - left, bottom - top)
+        # 수명은 80~100 % – FADE_DELAY 이후 수명 끝까지 투명도가 선형으로 줄어듦
+        self.batches = []
+        for key, batch in enumerate(points):
+            if not batch:
+                continue
+            color_index, rest = divmod(key, sizes * levels)
+            size_index, level = divmod(rest, levels)
+            lifetime = self.LIFETIME * (0.8 + 0.2 * level / max(1, levels - 1))
+            self.batches.append((colors[color_index], self.SIZES[size_index], lifetime, len(batch), QPolygonF(batch)))
+        self._update_bounds()
+
+    def clear(self):
+        """모든 입자 제거"""
+        self.count = 0
+        self.batches = []
+        self.bounds = QRect()
+
+    def _spread(self) -> float:
+        """발사 속도에 곱하는 이동 계수 F(age) = (1 - e^(-k·age)) / k"""
+        return -math.expm1(-self.DRAG * self.age) / self.DRAG
+
+    def step(self, dt: float):
+        """dt(s) 만큼 시간을 진행 – 위치는 계수로만 정해지므로 입자 수와 무관, 다 사라진 묶음은 버림"""
+        if not self.count:
+            return
+        self.age += dt
+        if self.age >= self.LIFETIME:
+            self.clear()
+            return
+        if any(self.age >= batch[2] for batch in self.batches):
+            self.batches = [batch for batch in self.batches if self.age < batch[2]]
+            self.count = sum(batch[3] for batch in self.batches)
+        self._update_bounds()
+
+    def _update_bounds(self):
+        if not self.count:
+            self.bounds = QRect()
+            return
+        spread = self._spread()
+        velocity = self.velocity_bounds
+        left = self.origin.x() + velocity.left() * spread
+        top = self.origin.y() + velocity.top() * spread + self.terminal * self.age
+        half = self.MAX_SIZE // 2 + 2  # 입자 크기(점 중심 기준)와 반올림 여유
+        self.bounds = QRect(int(left) - half, int(top) - half,
+                            int(velocity.width() * spread) + 2 * half, int(velocity.height() * spread) + 2 * half)
+
+    def paint(self, painter: QPainter, region: QRect):
+        """region 에 걸친 입자를 묶음마다 drawPoints 한 번으로 그리기"""
+        if not self.count or not region.intersects(self.bounds):
+            return
+        spread = self._spread()
+        # 발사 속도 → 화면 위치 (x = x0 + vx·F, y = y0 + g/k·t + vy·F)
+        painter.setTransform(QTransform(spread, 0, 0, spread, self.origin.x(),
+                                        self.origin.y() + self.terminal * self.age))
+        fade = max(0.0, self.age - self.FADE_DELAY)
+        for color, size, lifetime, _, points in self.batches:
+            alpha = 1.0 - fade / (lifetime - self.FADE_DELAY)
+            if alpha <= 0:
+                continue
+            # setOpacity 보다 반투명 단색 펜이 래스터 엔진에서 훨씬 빠름
+            color = QColor(color)
+            color.setAlphaF(alpha)
+            pen = QPen(color, size)
+            pen.setCosmetic(True)  # 변환(계수)과 무관하게 size px
+            pen.setCapStyle(Qt.SquareCap)  # 점을 size × size 사각형으로
+            painter.setPen(pen)
+            painter.drawPoints(points)
+        painter.resetTransform()
 
 
 class CelebrationManager(QWidget):
@@ -61,7 +165,7 @@ class CelebrationManager(QWidget):
         self.theme_manager = theme_manager
         self.animation_manager = animation_manager
         self.sound: QSoundEffect | None = None
-        self.particles: List[ConfettiParticle] = []
+        self.confetti = ConfettiSystem()
         self.active = False
         self.resize(parent_window.size())
         parent_window.installEventFilter(self)  # 부모 리사이즈 감지
@@ -96,11 +200,9 @@ class CelebrationManager(QWidget):
         # 애니메이션 정리 – AnimationManager가 개별 애니메이션을 관리하므로 종료 요청
         self.animation_manager.stop_all_animations()
 
-        # 파티클 제거 (이미 deleteLater 된 객체는 skip)
-        for p in self.particles[:]:
-            if isValid(p):
-                p.deleteLater()
-        self.particles.clear()
+        # 파티클 제거
+        frame_clock.unsubscribe(self)
+        self.confetti.clear()
 
         # ProgressBar 축하 모드 해제
         if hasattr(self, "target_progress_bar") and hasattr(self.target_progress_bar, "set_celebration_mode"):
@@ -128,88 +230,32 @@ class CelebrationManager(QWidget):
             # 사운드 장치 문제 시 무음
             pass
 
+    def _confetti_count(self) -> int:
+        """설정된 콘페티 입자 수 (설정을 읽을 때 ThemeManager 가 범위를 맞춰 둠)"""
+        return self.theme_manager.get_confetti_count()
+
     def _spawn_confetti(self):
         dark = self.theme_manager.get_current_theme() == "dark"
         # 폭죽처럼 아래에서 위로 퍼지는 효과: 중앙 하단에서 시작
-        origin_x = self.width() // 2
-        origin_y = self.height() - 10
-
-        for i in range(50):  # particle count↑ (±10 런타임 조정 가능)
-            particle = ConfettiParticle(self, dark)
-            particle.move(origin_x, origin_y)
-            particle.show()
-            self.particles.append(particle)
-
-            # --------------------------------------------
-            # 위치 애니메이션: 상승 0.4 s + 낙하 1.1 s
-            # --------------------------------------------
-            angle_deg = random.uniform(-85, 85)
-            distance = random.randint(int(self.height() * 0.6), int(self.height() * 0.9))
-
-            # Apex 좌표
-            apex_x = origin_x + int(distance * 0.8 * (angle_deg / 100))  # 더 넓게 퍼짐
-            apex_y = origin_y - distance
-
-            # Landing 좌표 – apex에서 80 % 만큼 낙하
-            land_x = apex_x + int((angle_deg / 100) * distance * 0.25)  # 더 퍼짐
-            land_y = apex_y + int(distance * 0.8)
-
-            # 상승 애니메이션
-            up = QPropertyAnimation(particle, b"pos", self)
-            up.setDuration(400)  # 0.4 s (더 느린 상승)
-            up.setStartValue(QPoint(origin_x, origin_y))
-            up.setEndValue(QPoint(apex_x, apex_y))
-            up.setEasingCurve(QEasingCurve.OutCubic)
-
-            # 낙하 애니메이션
-            down = QPropertyAnimation(particle, b"pos", self)
-            down.setDuration(1100)  # 1.1 s (총 1.5)
-            down.setStartValue(QPoint(apex_x, apex_y))
-            down.setEndValue(QPoint(land_x, land_y))
-            down.setEasingCurve(QEasingCurve.InQuad)
-
-            # 위치 시퀀스 그룹
-            seq_pos = QSequentialAnimationGroup(self)
-            seq_pos.addAnimation(up)
-            seq_pos.addAnimation(down)
-
-            # --------------------------------------------
-            # 투명도 애니메이션: 0.4 s 대기 후 1.1 s fade
-            # --------------------------------------------
-            opacity_effect = QGraphicsOpacityEffect()
-            particle.setGraphicsEffect(opacity_effect)
-
-            pause = QPauseAnimation(400, self)
-            fade = QPropertyAnimation(opacity_effect, b"opacity", self)
-            fade.setDuration(1100)
-            fade.setStartValue(1.0)
-            fade.setEndValue(0.0)
-
-            seq_opacity = QSequentialAnimationGroup(self)
-            seq_opacity.addAnimation(pause)
-            seq_opacity.addAnimation(fade)
-
-            # --------------------------------------------
-            # 병렬 실행 그룹 (pos + opacity)
-            # --------------------------------------------
-            group = QParallelAnimationGroup(self)
-            group.addAnimation(seq_pos)
-            group.addAnimation(seq_opacity)
-
-            # 종료 처리
-            def _on_group_finished(p=particle, g=group):
-                if isValid(p):
-                    p.hide()
-                    p.deleteLater()
-                if p in self.particles:
-                    self.particles.remove(p)
-                if g in self.animation_manager.active_animations:
-                    self.animation_manager.active_animations.remove(g)
-
-            group.finished.connect(_on_group_finished)
-
-            self.animation_manager.active_animations.append(group)
-            group.start()
+        self.confetti.spawn(self._confetti_count(), self.width() // 2, self.height() - 10, self.height(), dark)
+        self.update(self.confetti.bounds)
+        # 프레임 시계가 보이는 동안만 advance_frame 호출
+        frame_clock.subscribe(self)
+
+    def advance_frame(self, dt: float):
+        """프레임 시계 콜백 – 입자 이동 후 이전/현재 영역만 다시 그림"""
+        previous = self.confetti.bounds
+        self.confetti.step(dt)
+        self.update(previous.united(self.confetti.bounds))
+        if not self.confetti.count:
+            frame_clock.unsubscribe(self)
+
+    def paintEvent(self, event):
+        if not self.confetti.count:
+            return
+        painter = QPainter(self)
+        self.confetti.paint(painter, event.rect())
+        painter.end()
 
     def _morph_progress_bar(self, progress_bar):
         # 컬러 변경 – 골드 그라디언트 단순화(고정 색으로 대체)
@@ -0,0 +1,222 @@
+"""
+공유 프레임 시계 모듈
+"""
+from PySide6.QtCore import QObject, QTimer, QElapsedTimer, QEvent, Qt
+from PySide6.QtWidgets import QWidget
+from typing import List
+
+
+class FrameClock(QObject):
+    """계속 움직이는 위젯들이 함께 쓰는 프레임 시계
+
+    위젯마다 타이머를 두지 않고 시계 하나가 프레임마다 구독 위젯의
+    advance_frame(경과 초)를 호출한다. 가능하면 창의 requestUpdate()로
+    플랫폼의 화면 갱신(vsync) 주기에 맞춰 돌고, 보이는 구독 위젯이 하나도
+    없으면(창 최소화/숨김, 탭 전환 등) 멈췄다가 다시 보일 때 재개한다.
+
+    requestUpdate()가 vsync 대신 짧은 고정 타이머로 구현된 플랫폼도 있으므로
+    처음 몇 프레임의 간격을 재서 화면 주사율보다 빠르면 주사율에 맞춘 타이머로 바꾼다.
+    """
+
+    REDUCED_FPS = 20    # 저전력 모드 프레임 수
+    PROBE_FRAMES = 10   # vsync 여부 판단에 쓰는 프레임 수
+
+    # 구독 위젯/창에서 실행 여부를 다시 판단할 이벤트
+    _WAKE_EVENTS = (
+        QEvent.Show, QEvent.Hide, QEvent.WindowStateChange, QEvent.Expose, QEvent.ParentChange,
+        QEvent.Move, QEvent.Resize,  # 스크롤 등으로 다시 드러나는 경우
+    )
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._subscribers: List[QWidget] = []
+        self._reduced = False
+        self._running = False
+        self._driver_window = None   # requestUpdate 로 구동 중인 창 (QWindow)
+        self._frame_interval = 1000.0 / 60  # 구동 창 화면의 프레임 간격 (ms)
+        self._check_pending = False
+        self._vsync_available = True  # requestUpdate 가 화면 주사율로 오는지 (측정 전에는 가정)
+        self._probe_frames = 0        # 측정한 프레임 수 (PROBE_FRAMES 이상이면 측정 끝)
+        self._probe_elapsed = QElapsedTimer()
+        self._elapsed = QElapsedTimer()
+        self._timer = QTimer(self)
+        self._timer.setTimerType(Qt.PreciseTimer)
+        self._timer.timeout.connect(self._tick)
+
+    # ------------------------------------------------------------------
+    # 구독 관리
+    # ------------------------------------------------------------------
+    def subscribe(self, widget: QWidget):
+        """프레임마다 widget.advance_frame(dt) 호출 시작"""
+        if widget in self._subscribers:
+            return
+        self._subscribers.append(widget)
+        widget.installEventFilter(self)
+        widget.destroyed.connect(self._on_subscriber_destroyed)
+        self._schedule_check()
+
+    def unsubscribe(self, widget: QWidget):
+        """프레임 호출 중지"""
+        if widget not in self._subscribers:
+            return
+        self._subscribers.remove(widget)
+        widget.removeEventFilter(self)
+        try:
+            widget.destroyed.disconnect(self._on_subscriber_destroyed)
+        except (RuntimeError, TypeError):
+            pass
+        self._schedule_check()
+
+    def _on_subscriber_destroyed(self, _obj=None):
+        # 파괴 중에는 아직 살아있는 것으로 보이므로 다음 틱에 정리
+        self._schedule_check()
+
+    # ------------------------------------------------------------------
+    # 설정
+    # ------------------------------------------------------------------
+    def is_reduced(self) -> bool:
+        """저전력(낮은 프레임 수) 모드 여부"""
+        return self._reduced
+
+    def set_reduced(self, reduced: bool):
+        """저전력 모드 설정 – 타이머로 REDUCED_FPS 만큼만 구동"""
+        if self._reduced == reduced:
+            return
+        self._reduced = reduced
+        if self._running:
+            self._stop()
+        self._schedule_check()
+
+    def is_running(self) -> bool:
+        """프레임 구동 중 여부"""
+        return self._running
+
+    # ------------------------------------------------------------------
+    # 가시성 판단
+    # ------------------------------------------------------------------
+    @staticmethod
+    def is_widget_visible(widget: QWidget) -> bool:
+        """위젯이 실제로 화면에 보이는지 (숨김, 창 최소화/가려짐, 부모에 가려짐 제외)"""
+        if not widget.isVisible():
+            return False
+        window = widget.window()
+        if window.isMinimized():
+            return False
+        handle = window.windowHandle()
+        if handle is None or not handle.isExposed():
+            return False
+        return not widget.visibleRegion().isEmpty()
+
+    def _visible_subscribers(self) -> List[QWidget]:
+        self._subscribers = [w for w in self._subscribers if _is_alive(w)]
+        return [w for w in self._subscribers if self.is_widget_visible(w)]
+
+    def eventFilter(self, obj, event):
+        if event.type() in self._WAKE_EVENTS:
+            self._schedule_check()
+        elif event.type() == QEvent.UpdateRequest and obj is self._driver_window:
+            self._on_update_request()
+        return False
+
+    def _schedule_check(self):
+        """이벤트가 몰려도 한 번만 실행 여부를 다시 판단"""
+        if not self._check_pending:
+            self._check_pending = True
+            QTimer.singleShot(0, self._update_running)
+
+    def _update_running(self):
+        self._check_pending = False
+        visible = self._visible_subscribers()
+        # 최소화/복원, 가려짐 변화는 최상위 창과 QWindow 로 전달되므로 함께 감시
+        for widget in self._subscribers:
+            window = widget.window()
+            if window is not widget:
+                window.removeEventFilter(self)
+                window.installEventFilter(self)
+            handle = window.windowHandle()
+            if handle is not None:
+                handle.removeEventFilter(self)
+                handle.installEventFilter(self)
+        if visible and not self._running:
+            self._start(visible[0])
+        elif not visible and self._running:
+            self._stop()
+        elif self._driver_window is not None:
+            # 창이 다시 노출되기 전에 요청한 갱신은 전달되지 않을 수 있으므로 다시 요청
+            self._driver_window.requestUpdate()
+
+    # ------------------------------------------------------------------
+    # 구동
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _refresh_rate(widget: QWidget) -> float:
+        """위젯이 있는 화면의 주사율 (알 수 없으면 60)"""
+        screen = widget.screen()
+        rate = screen.refreshRate() if screen is not None else 0
+        return rate if rate > 0 else 60.0
+
+    def _start(self, widget: QWidget):
+        self._running = True
+        self._elapsed.start()
+        handle = widget.window().windowHandle()
+        if not self._reduced and self._vsync_available and handle is not None:
+            # 플랫폼이 화면 갱신 주기에 맞춰 UpdateRequest 를 보내줌 (vsync)
+            self._driver_window = handle
+            self._frame_interval = 1000.0 / self._refresh_rate(widget)
+            if self._probe_frames < self.PROBE_FRAMES:
+                self._probe_frames = 0
+                self._probe_elapsed.start()
+            handle.requestUpdate()
+        else:
+            fps = self.REDUCED_FPS if self._reduced else self._refresh_rate(widget)
+            self._timer.start(max(1, round(1000 / fps)))
+
+    def _stop(self):
+        self._running = False
+        self._driver_window = None
+        self._timer.stop()
+
+    def _on_update_request(self):
+        if self._probe_frames < self.PROBE_FRAMES:
+            self._probe_frames += 1
+            if self._probe_frames == self.PROBE_FRAMES:
+                average = self._probe_elapsed.elapsed() / self.PROBE_FRAMES
+                if average < self._frame_interval * 0.75:
+                    # 주사율보다 훨씬 자주 옴 → vsync 가 아님, 타이머로 전환
+                    self._vsync_available = False
+                    visible = self._visible_subscribers()
+                    self._stop()
+                    if visible:
+                        self._start(visible[0])
+                    return
+        self._tick()
+        if self._running and self._driver_window is not None:
+            self._driver_window.requestUpdate()
+
+    def _tick(self):
+        """경과 시간을 구독 위젯에 전달 (보이는 위젯만)"""
+        dt = self._elapsed.restart() / 1000.0
+        visible = self._visible_subscribers()
+        if not visible:
+            self._stop()
+            return
+        if self._driver_window is not None and all(
+                w.window().windowHandle() is not self._driver_window for w in visible):
+            # 구동 창이 더 이상 보이지 않으면 보이는 위젯의 창으로 옮김
+            self._stop()
+            self._start(visible[0])
+        for widget in visible:
+            widget.advance_frame(dt)
+
+
+def _is_alive(widget: QWidget) -> bool:
+    """C++ 객체가 아직 살아있는지 확인"""
+    try:
+        widget.objectName()
+        return True
+    except RuntimeError:
+        return False
+
+
+# 전역 프레임 시계 인스턴스
+frame_clock = FrameClock()
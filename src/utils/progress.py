@@ -1,8 +1,8 @@
 """
 진척도 계산 유틸리티
 """
-from typing import List
-from database.models import Task
+from typing import List, Union
+from database.models import Task, ProjectStats
 
 
 class ProgressCalculator:
@@ -72,20 +72,25 @@ class ProgressCalculator:
             return "시작해보세요! 💡"
 
     @staticmethod
-    def get_completion_stats(tasks: List[Task]) -> dict:
+    def get_completion_stats(tasks: Union[List[Task], ProjectStats]) -> dict:
         """
         완료 통계 반환
         
         Args:
-            tasks: 할 일 목록
+            tasks: 할 일 목록 또는 DB 집계(ProjectStats, 목록 순회 없이 계산)
             
         Returns:
             통계 딕셔너리
         """
-        total = len(tasks)
-        completed = sum(1 for task in tasks if task.completed)
+        if isinstance(tasks, ProjectStats):
+            total = tasks.total
+            completed = tasks.completed
+            progress = tasks.progress
+        else:
+            total = len(tasks)
+            completed = sum(1 for task in tasks if task.completed)
+            progress = ProgressCalculator.calculate_progress(tasks)
         remaining = total - completed
-        progress = ProgressCalculator.calculate_progress(tasks)
         
         return {
             'total': total,
@@ -0,0 +1,66 @@
+"""
+화면 갱신 요청 모음 모듈
+"""
+from PySide6.QtCore import QObject, QTimer
+from typing import Callable, Dict, List, Set
+
+
+class RefreshBus(QObject):
+    """변경 알림을 모아 화면별로 한 번씩만 갱신하는 버스
+
+    할 일 하나가 바뀌면 프로젝트 정보, 사이드바(프로젝트 목록) 등 여러 화면이
+    다시 그려져야 한다. 각 화면을 바로 갱신하지 않고 '갱신 필요'로 표시만 해 두면,
+    같은 이벤트 루프 틱 안에서 쌓인 요청은 다음 틱에 화면마다 한 번씩 처리된다.
+    """
+
+    # 갱신 대상 화면
+    PROJECT_INFO = 'project_info'  # 선택된 프로젝트 정보/진척도
+    TASKS = 'tasks'                # 할 일 목록
+    SIDEBAR = 'sidebar'            # 프로젝트 목록
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._handlers: Dict[str, List[Callable[[], None]]] = {}
+        self._dirty: Set[str] = set()
+        self._scheduled = False
+
+    def register(self, view: str, handler: Callable[[], None]):
+        """화면 갱신 함수 등록
+
+        Args:
+            view: 갱신 대상 화면 (PROJECT_INFO, TASKS, SIDEBAR)
+            handler: 갱신할 때 호출할 함수
+        """
+        self._handlers.setdefault(view, []).append(handler)
+
+    def unregister(self, view: str, handler: Callable[[], None]):
+        """화면 갱신 함수 등록 해제"""
+        handlers = self._handlers.get(view, [])
+        if handler in handlers:
+            handlers.remove(handler)
+
+    def mark_dirty(self, *views: str):
+        """화면을 갱신 필요로 표시 (다음 이벤트 루프 틱에 한 번만 갱신)"""
+        self._dirty.update(views)
+        if not self._scheduled:
+            self._scheduled = True
+            QTimer.singleShot(0, self.flush)
+
+    def is_dirty(self, view: str) -> bool:
+        """갱신 대기 중인지 확인"""
+        return view in self._dirty
+
+    def flush(self):
+        """쌓인 갱신 요청 처리 – 처리 중 새로 표시된 화면은 다음 틱으로 미룸"""
+        self._scheduled = False
+        dirty, self._dirty = self._dirty, set()
+        # 표시된 순서와 무관하게 할 일 목록 → 프로젝트 정보 → 사이드바 순으로 처리
+        for view in (self.TASKS, self.PROJECT_INFO, self.SIDEBAR):
+            if view not in dirty:
+                continue
+            for handler in list(self._handlers.get(view, [])):
+                handler()
+
+
+# 전역 갱신 버스 인스턴스
+refresh_bus = RefreshBus()
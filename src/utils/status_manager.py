@@ -2,8 +2,8 @@
 상태 표시 관리 모듈
 """
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Tuple
-from database.models import Task, Project
+from typing import Dict, List, Optional, Tuple, Union
+from database.models import Task, Project, ProjectStats
 
 
 class StatusManager:
@@ -50,24 +50,29 @@ class StatusManager:
     
     def get_project_status(self, project: Project, tasks: List[Task]) -> str:
         """프로젝트 상태 계산"""
-        if not tasks:
+        task_statuses = [self.get_task_status(t) for t in tasks]
+        return self.get_project_status_by_counts(
+            total=len(tasks),
+            completed=task_statuses.count('completed'),
+            urgent=task_statuses.count('urgent'),
+            overdue=task_statuses.count('overdue')
+        )
+    
+    def get_project_status_by_counts(self, total: int, completed: int, urgent: int, overdue: int) -> str:
+        """집계된 할 일 개수로 프로젝트 상태 계산"""
+        if not total:
             return 'normal'
         
-        completed_tasks = [t for t in tasks if t.completed]
-        completion_rate = len(completed_tasks) / len(tasks)
-        
         # 완료율 80% 이상
-        if completion_rate >= 0.8:
+        if completed / total >= 0.8:
             return 'high_progress'
         
         # 마감일 임박한 할 일이 있는지 확인
-        urgent_tasks = [t for t in tasks if self.get_task_status(t) == 'urgent']
-        if urgent_tasks:
+        if urgent:
             return 'urgent'
         
         # 마감일 초과한 할 일이 있는지 확인
-        overdue_tasks = [t for t in tasks if self.get_task_status(t) == 'overdue']
-        if overdue_tasks:
+        if overdue:
             return 'overdue'
         
         return 'normal'
@@ -112,8 +117,11 @@ class StatusManager:
             'priority': self.status_priority.get(status, 99)
         }
     
-    def get_project_status_summary(self, project: Project, tasks: List[Task]) -> Dict:
-        """프로젝트 상태 요약 정보 반환"""
+    def get_project_status_summary(self, project: Project, tasks: Union[List[Task], ProjectStats]) -> Dict:
+        """프로젝트 상태 요약 정보 반환 (ProjectStats 를 넘기면 목록 순회 없이 계산)"""
+        if isinstance(tasks, ProjectStats):
+            return self.get_project_stats_summary(tasks)
+        
         status = self.get_project_status(project, tasks)
         
         # 각 할 일의 상태 통계
@@ -135,6 +143,35 @@ class StatusManager:
             'overdue_tasks': status_counts['overdue']
         }
     
+    def get_project_stats_summary(self, stats: ProjectStats) -> Dict:
+        """집계(ProjectStats) 기반 프로젝트 상태 요약 정보 반환
+
+        get_project_status_summary 와 같은 키를 제공하되 할 일 목록이 필요 없다.
+        """
+        status = self.get_project_status_by_counts(
+            stats.total, stats.completed, stats.urgent, stats.overdue
+        )
+        normal = stats.total - stats.completed - stats.urgent - stats.overdue
+        
+        return {
+            'status': status,
+            'icon': self.get_status_icon(status),
+            'color': self.get_status_color(status),
+            'description': self.get_status_description(status),
+            'priority': self.status_priority.get(status, 99),
+            'task_counts': {
+                'urgent': stats.urgent,
+                'overdue': stats.overdue,
+                'completed': stats.completed,
+                'high_progress': 0,
+                'normal': normal
+            },
+            'total_tasks': stats.total,
+            'completed_tasks': stats.completed,
+            'urgent_tasks': stats.urgent,
+            'overdue_tasks': stats.overdue
+        }
+    
     def is_due_soon(self, task: Task, hours: int = 24) -> bool:
         """마감일이 임박한지 확인"""
         if not task.due_date:
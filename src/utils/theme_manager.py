@@ -11,6 +11,9 @@ class ThemeManager(QObject):
     
     theme_changed = Signal(str)  # 테마 변경 시그널
     
+    DEFAULT_CONFETTI_COUNT = 50
+    MAX_CONFETTI_COUNT = 2000  # 설정 가능한 최대 콘페티 입자 수 (한 프레임 그리기 ≈ 4ms)
+    
     def __init__(self):
         super().__init__()
         # 프로젝트 루트 기준으로 config 폴더의 설정 파일 경로
@@ -19,6 +22,8 @@ class ThemeManager(QObject):
         self.current_theme = "light"
         self.animation_enabled = True
         self.animation_speed = "normal"
+        self.reduced_frame_rate = False  # 흐르는 진척도 바 저전력(낮은 프레임) 모드
+        self.confetti_count = self.DEFAULT_CONFETTI_COUNT  # 100% 달성 축하 콘페티 입자 수
         self.load_settings()
     
     def get_light_theme(self) -> str:
@@ -49,19 +54,19 @@ class ThemeManager(QObject):
             QPushButton:pressed {
                 background-color: #3d8b40;
             }
-            QListWidget {
+            QListView {
                 border: 1px solid #ddd;
                 border-radius: 4px;
                 background-color: white;
                 selection-background-color: #e3f2fd;
                 color: #333;
             }
-            QListWidget::item {
+            QListView::item {
                 padding: 8px;
                 border-bottom: 1px solid #eee;
                 color: #333;
             }
-            QListWidget::item:selected {
+            QListView::item:selected {
                 background-color: #e3f2fd;
                 color: #1976d2;
             }
@@ -81,33 +86,33 @@ class ThemeManager(QObject):
                 color: #333;
                 background-color: transparent;
             }
-            QTableWidget {
+            QTableView {
                 gridline-color: #ddd;
                 selection-background-color: #e3f2fd;
                 background-color: white;
                 color: #333;
                 font-size: 14px;
             }
-            QTableWidget::item {
+            QTableView::item {
                 padding: 8px;
                 border: none;
                 font-size: 15px;
                 background-color: white;
                 color: #333;
             }
-            QTableWidget::item:selected {
+            QTableView::item:selected {
                 background-color: #0078d4;
                 color: #ffffff;
             }
-            QTableWidget::item:hover {
+            QTableView::item:hover {
                 background-color: #e5f3ff;
                 color: #333;
             }
-            QTableWidget::item:selected:focus {
+            QTableView::item:selected:focus {
                 background-color: #106ebe;
                 color: #ffffff;
             }
-            QTableWidget::item:selected:!focus {
+            QTableView::item:selected:!focus {
                 background-color: #cce8ff;
                 color: #333;
             }
@@ -222,19 +227,19 @@ class ThemeManager(QObject):
             QPushButton:pressed {
                 background-color: #3d8b40;
             }
-            QListWidget {
+            QListView {
                 border: 1px solid #555;
                 border-radius: 4px;
                 background-color: #3c3c3c;
                 selection-background-color: #404040;
                 color: #ffffff;
             }
-            QListWidget::item {
+            QListView::item {
                 padding: 8px;
                 border-bottom: 1px solid #555;
                 color: #ffffff;
             }
-            QListWidget::item:selected {
+            QListView::item:selected {
                 background-color: #404040;
                 color: #4CAF50;
             }
@@ -254,25 +259,25 @@ class ThemeManager(QObject):
                 color: #ffffff;
                 background-color: transparent;
             }
-            QTableWidget {
+            QTableView {
                 gridline-color: #555555;
                 selection-background-color: #404040;
                 background-color: #2b2b2b;
                 color: #ffffff;
                 font-size: 14px;
             }
-            QTableWidget::item {
+            QTableView::item {
                 background-color: #2b2b2b;
                 color: #ffffff;
                 padding: 8px;
                 border: none;
                 font-size: 15px;
             }
-            QTableWidget::item:selected {
+            QTableView::item:selected {
                 background-color: #404040;
                 color: #ffffff;
             }
-            QTableWidget::item:hover {
+            QTableView::item:hover {
                 background-color: #353535;
             }
             QTableCornerButton::section {
@@ -378,6 +383,37 @@ class ThemeManager(QObject):
         from utils.animation_manager import animation_manager
         animation_manager.set_animation_enabled(enabled)
     
+    def get_reduced_frame_rate(self) -> bool:
+        """저전력 애니메이션(낮은 프레임) 모드 여부 반환"""
+        return self.reduced_frame_rate
+    
+    def set_reduced_frame_rate(self, reduced: bool):
+        """저전력 애니메이션 모드 설정"""
+        self.reduced_frame_rate = reduced
+        self.save_settings()
+        # 프레임 시계에 설정 적용
+        from utils.frame_clock import frame_clock
+        frame_clock.set_reduced(reduced)
+    
+    def get_confetti_count(self) -> int:
+        """축하 콘페티 입자 수 반환"""
+        return self.confetti_count
+    
+    def set_confetti_count(self, count: int):
+        """축하 콘페티 입자 수 설정 (0 ~ MAX_CONFETTI_COUNT)"""
+        self.confetti_count = self._valid_confetti_count(count)
+        self.save_settings()
+    
+    def _valid_confetti_count(self, count) -> int:
+        """콘페티 입자 수를 0 ~ MAX_CONFETTI_COUNT 로 맞춤 (숫자가 아니면 기본값)"""
+        if isinstance(count, bool):
+            return self.DEFAULT_CONFETTI_COUNT
+        try:
+            count = int(count)
+        except (TypeError, ValueError, OverflowError):
+            return self.DEFAULT_CONFETTI_COUNT
+        return max(0, min(self.MAX_CONFETTI_COUNT, count))
+    
     def get_animation_speed(self) -> str:
         """애니메이션 속도 반환"""
         return self.animation_speed
@@ -411,7 +447,9 @@ class ThemeManager(QObject):
             settings = {
                 'theme': self.current_theme,
                 'animation_enabled': self.animation_enabled,
-                'animation_speed': self.animation_speed
+                'animation_speed': self.animation_speed,
+                'reduced_frame_rate': self.reduced_frame_rate,
+                'confetti_count': self.confetti_count
             }
             with open(self.settings_file, 'w', encoding='utf-8') as f:
                 json.dump(settings, f, ensure_ascii=False, indent=2)
@@ -427,11 +465,16 @@ class ThemeManager(QObject):
                     self.current_theme = settings.get('theme', 'light')
                     self.animation_enabled = settings.get('animation_enabled', True)
                     self.animation_speed = settings.get('animation_speed', 'normal')
+                    self.reduced_frame_rate = settings.get('reduced_frame_rate', False)
+                    self.confetti_count = self._valid_confetti_count(
+                        settings.get('confetti_count', self.DEFAULT_CONFETTI_COUNT))
         except Exception as e:
             print(f"테마 설정 로드 실패: {e}")
             self.current_theme = 'light'
             self.animation_enabled = True
             self.animation_speed = 'normal'
+            self.reduced_frame_rate = False
+            self.confetti_count = self.DEFAULT_CONFETTI_COUNT
 
 
 # 전역 테마 매니저 인스턴스